@@ -0,0 +1,54 @@
+"""Cursores opacos para paginação por chave (keyset)."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+
+CURSOR_VERSION = 1
+
+
+class InvalidCursorError(ValueError):
+    """Cursor malformado, adulterado ou de versão desconhecida."""
+
+
+@dataclass(frozen=True, slots=True)
+class KeysetCursor:
+    """Posição após a última linha entregue, na ordenação ``(sort_value DESC, id DESC)``."""
+
+    sort_value: str
+    row_id: str
+
+
+def encode_cursor(cursor: KeysetCursor) -> str:
+    raw = json.dumps({"v": CURSOR_VERSION, "s": cursor.sort_value, "i": cursor.row_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> KeysetCursor:
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise InvalidCursorError("cursor inválido") from exc
+    if not isinstance(data, dict) or data.get("v") != CURSOR_VERSION:
+        raise InvalidCursorError("versão de cursor não suportada")
+    sort_value, row_id = data.get("s"), data.get("i")
+    if not isinstance(sort_value, str) or not isinstance(row_id, str):
+        raise InvalidCursorError("cursor inválido")
+    return KeysetCursor(sort_value=sort_value, row_id=row_id)
+
+
+def keyset_filter(cursor: KeysetCursor, *, sort_column: str, id_column: str = "id") -> str:
+    """Filtro PostgREST ``or`` para linhas estritamente após o cursor em ordem decrescente."""
+    sort_value = _quote(cursor.sort_value)
+    row_id = _quote(cursor.row_id)
+    return f"{sort_column}.lt.{sort_value},and({sort_column}.eq.{sort_value},{id_column}.lt.{row_id})"
+
+
+def _quote(value: str) -> str:
+    # Aspas protegem ':', '+' e ',' de timestamps dentro da sintaxe de filtros do PostgREST.
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
@@ -9,6 +9,7 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, EmailStr, Field
 from supabase import AuthApiError
 
+from auth.auth_cache import auth_cache
 from auth.jwt_handler import (
     create_access_token,
     create_refresh_token,
@@ -161,4 +162,5 @@ async def logout(
     _ = credentials
     supabase = get_supabase()
     supabase.table("refresh_tokens").update({"revoked": True}).eq("user_id", user["id"]).execute()
+    auth_cache.invalidate_user(user["id"])
     return {"message": "Logout realizado"}
@@ -6,6 +6,7 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
 
+from api.pagination import InvalidCursorError, KeysetCursor, decode_cursor, encode_cursor, keyset_filter
 from auth.dependencies import get_current_user
 from db.audit import log_audit_event
 from db.supabase_client import get_supabase
@@ -17,25 +18,46 @@ router = APIRouter()
 async def list_executions(
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
     user: dict = Depends(get_current_user),
 ) -> dict[str, Any]:
+    """Lista execuções do usuário, mais recentes primeiro.
+
+    Com ``cursor`` (o ``next_cursor`` da página anterior) a consulta é por
+    chave em ``(started_at, id)`` e custa o mesmo em qualquer profundidade.
+    ``offset`` continua aceito para clientes antigos quando não há cursor.
+    """
+    limit = max(1, limit)
     supabase = get_supabase()
-    result = (
-        supabase.table("executions")
-        .select("*")
-        .eq("user_id", user["id"])
-        .order("started_at", desc=True)
-        .range(offset, offset + limit - 1)
-        .execute()
-    )
+    # Linhas sem started_at não têm posição na ordenação por chave e gerariam um cursor inválido.
+    query = supabase.table("executions").select("*").eq("user_id", user["id"]).not_.is_("started_at", "null")
+    if cursor is not None:
+        try:
+            position = decode_cursor(cursor)
+        except InvalidCursorError as exc:
+            raise HTTPException(status_code=400, detail="Cursor de paginação inválido") from exc
+        query = query.or_(keyset_filter(position, sort_column="started_at"))
+    query = query.order("started_at", desc=True).order("id", desc=True)
+    if cursor is None and offset:
+        query = query.range(offset, offset + limit)
+    else:
+        query = query.limit(limit + 1)
+    result = query.execute()
+
+    rows = result.data[:limit]
+    next_cursor = None
+    if len(result.data) > limit and rows:
+        last = rows[-1]
+        next_cursor = encode_cursor(KeysetCursor(sort_value=str(last["started_at"]), row_id=str(last["id"])))
     log_audit_event(
         user_id=user["id"],
         action="list_runs",
         resource_type="execution",
         resource_id="*",
-        metadata={"limit": limit, "offset": offset},
+        metadata={"limit": limit, "offset": offset, "cursor": cursor is not None},
+        deferred=True,
     )
-    return {"executions": result.data, "total": len(result.data)}
+    return {"executions": rows, "total": len(rows), "next_cursor": next_cursor}
 
 
 @router.get("/{session_id}")
@@ -57,6 +79,7 @@ async def get_execution(session_id: str, user: dict = Depends(get_current_user))
         resource_type="execution",
         resource_id=execution["id"],
         metadata={"session_id": session_id},
+        deferred=True,
     )
     if execution.get("result") and execution["result"].get("artifacts"):
         log_audit_event(
@@ -65,5 +88,6 @@ async def get_execution(session_id: str, user: dict = Depends(get_current_user))
             resource_type="artifact",
             resource_id=session_id,
             metadata={"artifact_count": len(execution["result"].get("artifacts", []))},
+            deferred=True,
         )
     return execution
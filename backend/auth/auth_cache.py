@@ -0,0 +1,102 @@
+"""Cache em processo de claims verificados e perfis por hash de token."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+def token_fingerprint(token: str) -> str:
+    """Hash estável do token; o token bruto nunca é guardado em memória."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+@dataclass(slots=True)
+class CachedIdentity:
+    claims: dict[str, Any]
+    profile: dict[str, Any]
+    expires_at: float
+
+
+class AuthCache:
+    """LRU com TTL de claims verificados + perfil, indexado por hash do token.
+
+    Cada entrada expira no menor entre ``ttl_seconds`` e o ``exp`` do JWT, então
+    um token nunca é aceito depois de expirar. ``invalidate_user`` remove todas
+    as entradas de um usuário e deve ser chamado quando o papel (role) ou o
+    perfil mudar, ou no logout.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 60.0,
+        max_entries: int = 10_000,
+        time_fn: Callable[[], float] | None = None,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self.time_fn = time_fn or time.time
+        self._entries: OrderedDict[str, CachedIdentity] = OrderedDict()
+        self._tokens_by_user: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> CachedIdentity | None:
+        key = token_fingerprint(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= self.time_fn():
+                self._discard(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, token: str, claims: dict[str, Any], profile: dict[str, Any]) -> CachedIdentity:
+        key = token_fingerprint(token)
+        expires_at = self.time_fn() + self.ttl_seconds
+        if isinstance(claims.get("exp"), int | float):
+            expires_at = min(expires_at, float(claims["exp"]))
+        entry = CachedIdentity(claims=claims, profile=profile, expires_at=expires_at)
+        user_id = str(claims.get("sub", ""))
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = entry
+            self._tokens_by_user.setdefault(user_id, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._discard(next(iter(self._entries)))
+        return entry
+
+    def invalidate_user(self, user_id: str) -> int:
+        with self._lock:
+            keys = self._tokens_by_user.pop(str(user_id), set())
+            for key in keys:
+                self._entries.pop(key, None)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        user_id = str(entry.claims.get("sub", ""))
+        keys = self._tokens_by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._tokens_by_user[user_id]
+
+
+auth_cache = AuthCache()
@@ -5,6 +5,7 @@ from __future__ import annotations
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from auth.auth_cache import auth_cache
 from auth.jwt_handler import verify_access_token
 from db.supabase_client import get_supabase
 
@@ -15,6 +16,10 @@ async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> dict:
     token = credentials.credentials
+    cached = auth_cache.get(token)
+    if cached is not None:
+        return dict(cached.profile)
+
     payload = verify_access_token(token)
     if not payload:
         raise HTTPException(
@@ -34,7 +39,9 @@ async def get_current_user(
     if not result.data:
         raise HTTPException(status_code=404, detail="Usuário não encontrado")
 
-    return result.data[0]
+    profile = result.data[0]
+    auth_cache.put(token, payload, profile)
+    return dict(profile)
 
 
 async def get_current_admin(user: dict = Depends(get_current_user)) -> dict:
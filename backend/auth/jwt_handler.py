@@ -67,6 +67,9 @@ def create_refresh_token(subject: str) -> tuple[str, dict[str, Any]]:
 
 def _decode_with_secret(token: str, secret_name: str, env_fallback: str) -> dict[str, Any]:
     secret = secret_manager.get_active_secret(secret_name, env_fallback=env_fallback)
+    if jwt.get_unverified_header(token).get("kid") != secret.version:
+        # Token assinado com uma versão diferente da em cache: a chave pode ter rotacionado.
+        secret = secret_manager.get_active_secret(secret_name, env_fallback=env_fallback, force_refresh=True)
     return jwt.decode(
         token,
         secret.value,
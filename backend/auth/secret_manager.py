@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
 from dataclasses import dataclass
+from typing import Callable
 
 from config import settings
 from db.supabase_client import get_supabase
@@ -16,10 +19,47 @@ class SecretVersion:
     version: str
 
 
+@dataclass
+class _CachedSecret:
+    secret: SecretVersion
+    fetched_at: float
+    refreshing: bool = False
+
+
 class SecretManager:
-    def get_active_secret(self, name: str, env_fallback: str | None = None) -> SecretVersion:
+    """Resolve segredos ativos com cache em processo e renovação antecipada.
+
+    Com o provedor ``supabase`` cada segredo fica em cache por
+    ``cache_ttl_seconds``. Nos últimos ``refresh_ahead_seconds`` da janela a
+    versão em cache continua sendo servida enquanto uma thread busca a nova,
+    então a rotação não coloca a consulta ao banco no caminho da requisição.
+    ``force_refresh=True`` ignora o cache (ex.: token assinado com um ``kid``
+    mais novo que o em cache), mas no máximo uma vez a cada
+    ``min_force_refresh_interval_seconds`` por segredo: tokens forjados com
+    ``kid`` arbitrário não conseguem gerar uma consulta por requisição.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_ttl_seconds: float = 300.0,
+        refresh_ahead_seconds: float = 60.0,
+        min_force_refresh_interval_seconds: float = 30.0,
+        time_fn: Callable[[], float] | None = None,
+    ) -> None:
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.refresh_ahead_seconds = min(refresh_ahead_seconds, cache_ttl_seconds)
+        self.min_force_refresh_interval_seconds = min_force_refresh_interval_seconds
+        self.time_fn = time_fn or time.monotonic
+        self._cache: dict[str, _CachedSecret] = {}
+        self._forced_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def get_active_secret(
+        self, name: str, env_fallback: str | None = None, *, force_refresh: bool = False
+    ) -> SecretVersion:
         if settings.secret_manager_provider == "supabase":
-            return self._get_from_supabase(name)
+            return self._get_cached(name, force_refresh=force_refresh)
 
         env_name = env_fallback or name.upper()
         value = os.getenv(env_name)
@@ -27,6 +67,48 @@ class SecretManager:
             raise RuntimeError(f"Segredo ausente: {env_name}")
         return SecretVersion(name=name, value=value, version="env")
 
+    def invalidate(self, name: str | None = None) -> None:
+        with self._lock:
+            if name is None:
+                self._cache.clear()
+                self._forced_at.clear()
+            else:
+                self._cache.pop(name, None)
+                self._forced_at.pop(name, None)
+
+    def _get_cached(self, name: str, *, force_refresh: bool) -> SecretVersion:
+        now = self.time_fn()
+        with self._lock:
+            cached = self._cache.get(name)
+            age = now - cached.fetched_at if cached is not None else 0.0
+            if cached is not None and force_refresh:
+                last_forced = max(cached.fetched_at, self._forced_at.get(name, float("-inf")))
+                if age < self.cache_ttl_seconds and now - last_forced < self.min_force_refresh_interval_seconds:
+                    return cached.secret
+                self._forced_at[name] = now
+            elif cached is not None:
+                if age < self.cache_ttl_seconds - self.refresh_ahead_seconds:
+                    return cached.secret
+                if age < self.cache_ttl_seconds:
+                    if not cached.refreshing:
+                        cached.refreshing = True
+                        threading.Thread(target=self._refresh, args=(name,), daemon=True).start()
+                    return cached.secret
+        return self._refresh(name)
+
+    def _refresh(self, name: str) -> SecretVersion:
+        try:
+            secret = self._get_from_supabase(name)
+        except Exception:
+            with self._lock:
+                cached = self._cache.get(name)
+                if cached is not None:
+                    cached.refreshing = False
+            raise
+        with self._lock:
+            self._cache[name] = _CachedSecret(secret=secret, fetched_at=self.time_fn())
+        return secret
+
     def _get_from_supabase(self, name: str) -> SecretVersion:
         supabase = get_supabase()
         response = (
@@ -2,19 +2,143 @@
 
 from __future__ import annotations
 
-from typing import Any
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable
 
 from db.supabase_client import get_supabase
 
+logger = logging.getLogger(__name__)
 
-def log_audit_event(*, user_id: str, action: str, resource_type: str, resource_id: str, metadata: dict[str, Any] | None = None) -> None:
-    supabase = get_supabase()
-    supabase.table("audit_logs").insert(
-        {
-            "user_id": user_id,
-            "action": action,
-            "resource_type": resource_type,
-            "resource_id": resource_id,
-            "metadata": metadata or {},
-        }
-    ).execute()
+
+def _insert_rows(rows: list[dict[str, Any]]) -> None:
+    get_supabase().table("audit_logs").insert(rows).execute()
+
+
+class AuditBatchWriter:
+    """Fila limitada de eventos de auditoria gravados em lote por uma thread de fundo.
+
+    ``enqueue`` nunca bloqueia a requisição: com a fila cheia o evento é
+    gravado de forma síncrona em vez de descartado. A thread agrupa até
+    ``batch_size`` eventos por insert. Se o insert do lote falhar, cada evento
+    é regravado individualmente até ``max_attempts`` vezes antes de ser
+    registrado no log como perdido. ``flush`` grava o que estiver pendente e
+    ``close`` deve ser chamado no shutdown.
+    """
+
+    def __init__(
+        self,
+        *,
+        insert_batch: Callable[[list[dict[str, Any]]], None] | None = None,
+        max_queue_size: int = 10_000,
+        batch_size: int = 200,
+        flush_interval_seconds: float = 0.5,
+        max_attempts: int = 3,
+        retry_backoff_seconds: float = 0.2,
+    ) -> None:
+        self._insert_batch = insert_batch or _insert_rows
+        self.batch_size = max(1, batch_size)
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_attempts = max(1, max_attempts)
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self._queue: queue.Queue[dict[str, Any]] = queue.Queue(maxsize=max(1, max_queue_size))
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def enqueue(self, row: dict[str, Any]) -> None:
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self._insert_batch([row])
+
+    def flush(self) -> int:
+        written = 0
+        while batch := self._take_batch(block=False):
+            self._write(batch)
+            written += len(batch)
+        return written
+
+    def close(self) -> None:
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join()
+            self._thread = None
+        self.flush()
+        self._stop_event.clear()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="audit-batch-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            batch = self._take_batch(block=True)
+            if not batch:
+                continue
+            self._write(batch)
+
+    def _write(self, batch: list[dict[str, Any]]) -> None:
+        try:
+            self._insert_batch(batch)
+            return
+        except Exception:
+            logger.exception("falha ao gravar lote de auditoria (%d eventos); regravando um a um", len(batch))
+        for row in batch:
+            self._insert_with_retry(row)
+
+    def _insert_with_retry(self, row: dict[str, Any]) -> None:
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                self._insert_batch([row])
+                return
+            except Exception:
+                if attempt == self.max_attempts:
+                    logger.exception("evento de auditoria perdido após %d tentativas: %s", attempt, row)
+                    return
+                time.sleep(self.retry_backoff_seconds * attempt)
+
+    def _take_batch(self, *, block: bool) -> list[dict[str, Any]]:
+        batch: list[dict[str, Any]] = []
+        try:
+            if block:
+                batch.append(self._queue.get(timeout=self.flush_interval_seconds))
+            while len(batch) < self.batch_size:
+                batch.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+
+audit_writer = AuditBatchWriter()
+
+
+def log_audit_event(
+    *,
+    user_id: str,
+    action: str,
+    resource_type: str,
+    resource_id: str,
+    metadata: dict[str, Any] | None = None,
+    deferred: bool = False,
+) -> None:
+    """Registra um evento de auditoria; ``deferred=True`` o envia ao lote em segundo plano."""
+    row = {
+        "user_id": user_id,
+        "action": action,
+        "resource_type": resource_type,
+        "resource_id": resource_id,
+        "metadata": metadata or {},
+    }
+    if deferred:
+        audit_writer.enqueue(row)
+        return
+    _insert_rows([row])
@@ -32,7 +32,7 @@ CREATE TABLE IF NOT EXISTS public.executions (
   config JSONB NOT NULL,
   result JSONB,
   events JSONB[],
-  started_at TIMESTAMPTZ DEFAULT NOW(),
+  started_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
   completed_at TIMESTAMPTZ,
   duration_seconds INTEGER,
   cost_usd DECIMAL(10, 4) DEFAULT 0.00
@@ -72,11 +72,16 @@ CREATE TABLE IF NOT EXISTS public.audit_logs (
   created_at TIMESTAMPTZ DEFAULT NOW()
 );
 
+-- A paginação por chave em (started_at, id) exige started_at preenchido em bases já existentes
+UPDATE public.executions SET started_at = COALESCE(completed_at, NOW()) WHERE started_at IS NULL;
+ALTER TABLE public.executions ALTER COLUMN started_at SET NOT NULL;
+
 CREATE INDEX IF NOT EXISTS idx_flows_user_id ON public.flows(user_id);
 CREATE INDEX IF NOT EXISTS idx_flows_is_public ON public.flows(is_public) WHERE is_public = TRUE;
 CREATE INDEX IF NOT EXISTS idx_executions_user_id ON public.executions(user_id);
 CREATE INDEX IF NOT EXISTS idx_executions_session_id ON public.executions(session_id);
 CREATE INDEX IF NOT EXISTS idx_executions_started_at ON public.executions(started_at DESC);
+CREATE INDEX IF NOT EXISTS idx_executions_user_keyset ON public.executions(user_id, started_at DESC, id DESC);
 CREATE INDEX IF NOT EXISTS idx_refresh_tokens_user_id ON public.refresh_tokens(user_id);
 CREATE INDEX IF NOT EXISTS idx_refresh_tokens_expires_at ON public.refresh_tokens(expires_at);
 CREATE INDEX IF NOT EXISTS idx_audit_logs_user_id ON public.audit_logs(user_id);
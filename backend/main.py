@@ -26,6 +26,7 @@ from api.routes_tools import router as tools_router
 from api.websocket import router as ws_router
 
 from config import current_pid, settings
+from db.audit import audit_writer
 from observability.logging import log_structured
 from monitoring.system_health import router as system_health_router
 
@@ -99,6 +100,8 @@ async def lifespan(_: FastAPI):
 
     yield
 
+    audit_writer.close()
+
     log_structured(
         logger,
         "shutdown_complete",
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+pytest.importorskip("supabase")
+
+from db.audit import AuditBatchWriter
+
+
+def test_failed_batch_is_rewritten_row_by_row() -> None:
+    written: list[dict] = []
+    calls: list[int] = []
+
+    def flaky_insert(rows: list[dict]) -> None:
+        calls.append(len(rows))
+        if len(calls) in (1, 3):
+            raise RuntimeError("supabase indisponível")
+        written.extend(rows)
+
+    writer = AuditBatchWriter(insert_batch=flaky_insert, batch_size=10, retry_backoff_seconds=0)
+    writer._ensure_thread = lambda: None  # mantém os eventos na fila até o flush
+    for idx in range(3):
+        writer.enqueue({"action": f"a{idx}"})
+
+    assert writer.flush() == 3
+    assert calls == [3, 1, 1, 1, 1]
+    assert sorted(row["action"] for row in written) == ["a0", "a1", "a2"]
+
+
+def test_row_is_dropped_only_after_max_attempts(caplog) -> None:
+    calls: list[int] = []
+
+    def failing_insert(rows: list[dict]) -> None:
+        calls.append(len(rows))
+        raise RuntimeError("supabase indisponível")
+
+    writer = AuditBatchWriter(insert_batch=failing_insert, max_attempts=2, retry_backoff_seconds=0)
+    writer._ensure_thread = lambda: None
+    writer.enqueue({"action": "lost"})
+
+    writer.flush()
+
+    assert calls == [1, 1, 1]
+    assert "perdido" in caplog.text
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from auth.auth_cache import AuthCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_hit_until_ttl_or_token_expiry() -> None:
+    clock = _Clock()
+    cache = AuthCache(ttl_seconds=60, time_fn=clock)
+    cache.put("token-a", {"sub": "u1", "exp": 1_030}, {"id": "u1", "role": "admin"})
+    cache.put("token-b", {"sub": "u1", "exp": 5_000}, {"id": "u1", "role": "admin"})
+
+    assert cache.get("token-a").profile["role"] == "admin"
+    clock.now = 1_031
+    assert cache.get("token-a") is None
+    assert cache.get("token-b") is not None
+    clock.now = 1_061
+    assert cache.get("token-b") is None
+
+
+def test_invalidate_user_drops_every_token_for_that_user() -> None:
+    cache = AuthCache(time_fn=_Clock())
+    cache.put("token-a", {"sub": "u1"}, {"id": "u1", "role": "admin"})
+    cache.put("token-b", {"sub": "u1"}, {"id": "u1", "role": "admin"})
+    cache.put("token-c", {"sub": "u2"}, {"id": "u2", "role": "viewer"})
+
+    assert cache.invalidate_user("u1") == 2
+    assert cache.get("token-a") is None and cache.get("token-b") is None
+    assert cache.get("token-c") is not None
+
+
+def test_cache_is_bounded_lru() -> None:
+    cache = AuthCache(max_entries=2, time_fn=_Clock())
+    cache.put("token-a", {"sub": "u1"}, {})
+    cache.put("token-b", {"sub": "u2"}, {})
+    cache.get("token-a")
+    cache.put("token-c", {"sub": "u3"}, {})
+
+    assert len(cache) == 2
+    assert cache.get("token-b") is None
+    assert cache.invalidate_user("u2") == 0
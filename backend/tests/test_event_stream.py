@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+pytest.importorskip("redis.asyncio")
+pytest.importorskip("pydantic")
+
+from orchestrator.event_stream import SessionEventHub, make_event
+
+
+class _FakePubSub:
+    def __init__(self, redis: "_FakeRedis") -> None:
+        self._redis = redis
+
+    async def psubscribe(self, pattern: str) -> None:
+        self._redis.patterns.append(pattern)
+        await self._redis.messages.put({"type": "psubscribe", "pattern": pattern, "channel": pattern, "data": 1})
+
+    async def listen(self):
+        while True:
+            message = await self._redis.messages.get()
+            if isinstance(message, Exception):
+                raise message
+            yield message
+
+    async def aclose(self) -> None:
+        self._redis.closed += 1
+
+
+class _FakeRedis:
+    """Only the Pub/Sub surface SessionEventHub uses; messages are fed by the test."""
+
+    def __init__(self) -> None:
+        self.messages: asyncio.Queue = asyncio.Queue()
+        self.patterns: list[str] = []
+        self.closed = 0
+
+    def pubsub(self) -> _FakePubSub:
+        return _FakePubSub(self)
+
+
+def _payload(session_id: str, event_type: str = "log", content: str = "x") -> str:
+    return make_event(session_id, "agent-1", "Agent", event_type, content).model_dump_json()
+
+
+def test_hub_uses_one_pattern_subscription_and_fans_out_per_session() -> None:
+    async def scenario() -> None:
+        redis = _FakeRedis()
+        hub = SessionEventHub(redis)
+        first = await hub.subscribe("s1")
+        second = await hub.subscribe("s1")
+        other = await hub.subscribe("s2")
+
+        hub.dispatch("session:s1", _payload("s1", content="hello"))
+        hub.dispatch("session:unwatched", "not even json")
+
+        assert redis.patterns == ["session:*"]
+        assert (await first.get()).content == "hello"
+        assert (await second.get()).content == "hello"
+        assert other.empty()
+        await hub.close()
+
+    asyncio.run(scenario())
+
+
+def test_slow_consumer_drops_oldest_event_and_keeps_terminal_event() -> None:
+    async def scenario() -> None:
+        hub = SessionEventHub(_FakeRedis(), queue_size=2)
+        queue = await hub.subscribe("s1")
+        for idx in range(3):
+            hub.dispatch("session:s1", _payload("s1", content=str(idx)))
+        hub.dispatch("session:s1", _payload("s1", event_type="done"))
+
+        assert hub.dropped_events == 2
+        assert (await queue.get()).content == "2"
+        assert (await queue.get()).event_type == "done"
+        await hub.close()
+
+    asyncio.run(scenario())
+
+
+def test_unsubscribe_stops_delivery() -> None:
+    async def scenario() -> None:
+        hub = SessionEventHub(_FakeRedis())
+        queue = await hub.subscribe("s1")
+        hub.unsubscribe("s1", queue)
+        hub.dispatch("session:s1", _payload("s1"))
+
+        assert queue.empty()
+        await hub.close()
+
+    asyncio.run(scenario())
+
+
+def test_connection_loss_ends_viewers_with_error_event() -> None:
+    async def scenario() -> None:
+        redis = _FakeRedis()
+        hub = SessionEventHub(redis)
+        queue = await hub.subscribe("s1")
+
+        await redis.messages.put(ConnectionError("connection reset"))
+        event = await asyncio.wait_for(queue.get(), timeout=1)
+
+        assert event.event_type == "error"
+        assert "connection reset" in json.dumps(event.content)
+        await hub.close()
+
+    asyncio.run(scenario())
+
+
+def test_per_loop_client_is_closed_when_its_loop_ends() -> None:
+    from orchestrator import event_stream
+
+    async def use_client() -> bool:
+        return event_stream._get_redis_client() is event_stream._get_redis_client()
+
+    for _ in range(3):
+        assert asyncio.run(use_client())
+
+    assert event_stream._clients == {}
+    assert event_stream._sentinels == {}
@@ -2,21 +2,28 @@ from __future__ import annotations
 
 import threading
 import time
+from pathlib import Path
+
+import pytest
 
 from governance.approval_queue import ApprovalQueue
+from governance.approval_store import ApprovalStore
 from governance.human_validation import HumanValidationController, HumanValidationError, ValidationGates
 
 
-def test_approval_queue_records_pending_and_audit() -> None:
-    queue = ApprovalQueue()
+@pytest.fixture
+def queue(tmp_path: Path) -> ApprovalQueue:
+    return ApprovalQueue(ApprovalStore(str(tmp_path / "approvals.db")))
+
+
+def test_approval_queue_records_pending_and_audit(queue: ApprovalQueue) -> None:
     req = queue.submit(token="task:1:execute", reason="pre_execution", payload={"task": "demo"})
     assert req.status == "pending"
     assert req.audit_history[0].action == "submitted"
     assert queue.pending()[0].token == "task:1:execute"
 
 
-def test_human_validation_blocks_until_approval_is_resolved() -> None:
-    queue = ApprovalQueue()
+def test_human_validation_blocks_until_approval_is_resolved(queue: ApprovalQueue) -> None:
     controller = HumanValidationController(
         ValidationGates(require_pre_execution_approval=True),
         approval_queue=queue,
@@ -45,8 +52,7 @@ def test_human_validation_blocks_until_approval_is_resolved() -> None:
     assert result["status"] == "approved"
 
 
-def test_human_validation_raises_when_rejected() -> None:
-    queue = ApprovalQueue()
+def test_human_validation_raises_when_rejected(queue: ApprovalQueue) -> None:
     controller = HumanValidationController(
         ValidationGates(require_pre_execution_approval=True),
         approval_queue=queue,
@@ -71,3 +77,47 @@ def test_human_validation_raises_when_rejected() -> None:
 
     thread.join(timeout=2)
     assert result["status"] == "rejected"
+
+
+def test_pending_loads_history_in_one_query_per_call(queue: ApprovalQueue) -> None:
+    for idx in range(25):
+        queue.submit(token=f"task:{idx}:execute", reason="pre_execution")
+        queue.assign_reviewer(token=f"task:{idx}:execute", reviewer="alice")
+    queue.record_decision(token="task:0:execute", decision="approved", reviewer="alice")
+
+    statements: list[str] = []
+    queue._store._conn().set_trace_callback(statements.append)
+    pending = queue.pending()
+
+    assert len(pending) == 24
+    assert [entry.action for entry in pending[0].audit_history] == ["submitted", "reviewer_assigned"]
+    assert len(statements) == 1
+
+
+def test_wait_for_resolution_wakes_on_decision_and_honours_timeout(queue: ApprovalQueue) -> None:
+    queue.submit(token="task:7:execute", reason="pre_execution")
+    assert queue.wait_for_resolution("task:7:execute", timeout_seconds=0.01).status == "pending"
+
+    threading.Timer(0.05, lambda: queue.record_decision(token="task:7:execute", decision="approved", reviewer="bob")).start()
+    assert queue.wait_for_resolution("task:7:execute", timeout_seconds=2).status == "approved"
+
+
+def test_wait_for_resolution_sees_decisions_from_other_instances(tmp_path: Path) -> None:
+    store_path = str(tmp_path / "shared.db")
+    waiter = ApprovalQueue(ApprovalStore(store_path), poll_interval_seconds=0.02)
+    decider = ApprovalQueue(ApprovalStore(store_path))
+    waiter.submit(token="task:8:execute", reason="pre_execution")
+
+    threading.Timer(0.05, lambda: decider.record_decision(token="task:8:execute", decision="rejected", reviewer="eve")).start()
+    started = time.monotonic()
+    assert waiter.wait_for_resolution("task:8:execute", timeout_seconds=5).status == "rejected"
+    assert time.monotonic() - started < 2
+    assert waiter._resolution_events == {}
+
+
+def test_timed_out_waits_do_not_leak_resolution_events(queue: ApprovalQueue) -> None:
+    queue.submit(token="task:9:execute", reason="pre_execution")
+    for _ in range(3):
+        assert queue.wait_for_resolution("task:9:execute", timeout_seconds=0.01).status == "pending"
+    assert queue._resolution_events == {}
+    assert queue._waiter_counts == {}
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from api.pagination import InvalidCursorError, KeysetCursor, decode_cursor, encode_cursor, keyset_filter
+
+
+def test_cursor_round_trips_and_is_url_safe() -> None:
+    cursor = KeysetCursor(sort_value="2024-05-01T12:30:00+00:00", row_id="5f0c7a3e-1b2c-4d5e-8f90-a1b2c3d4e5f6")
+    token = encode_cursor(cursor)
+
+    assert "=" not in token and "+" not in token and "/" not in token
+    assert decode_cursor(token) == cursor
+
+
+@pytest.mark.parametrize("token", ["not-base64!", encode_cursor(KeysetCursor("a", "b"))[:-4], "eyJ2Ijo5OSwicyI6ImEiLCJpIjoiYiJ9"])
+def test_malformed_or_unknown_version_cursors_are_rejected(token: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(token)
+
+
+def test_keyset_filter_quotes_timestamp_values() -> None:
+    clause = keyset_filter(KeysetCursor(sort_value="2024-05-01T12:30:00+00:00", row_id="abc"), sort_column="started_at")
+
+    assert clause == (
+        'started_at.lt."2024-05-01T12:30:00+00:00",'
+        'and(started_at.eq."2024-05-01T12:30:00+00:00",id.lt."abc")'
+    )
@@ -1,4 +1,14 @@
-from security.rbac import Permission, RBACAuthorizationError, RBACContext, RBACResource, rbac_middleware
+import pytest
+
+from security.rbac import (
+    Permission,
+    RBACAuthorizationError,
+    RBACContext,
+    RBACMiddleware,
+    RBACResource,
+    RolePolicy,
+    rbac_middleware,
+)
 
 
 def test_operator_can_invoke_tools_in_same_tenant() -> None:
@@ -30,3 +40,50 @@ def test_viewer_cannot_take_governance_decision() -> None:
         assert "Permission" in str(exc)
     else:
         raise AssertionError("Expected governance decision to be denied for viewer")
+
+
+def test_role_inheritance_is_flattened_at_compile_time() -> None:
+    middleware = RBACMiddleware(
+        {
+            "reader": RolePolicy(permissions=frozenset({Permission.MEMORY_READ}), scopes=frozenset({"own"})),
+            "writer": RolePolicy(permissions=frozenset({Permission.MEMORY_WRITE}), inherits=frozenset({"reader"})),
+        }
+    )
+    context = RBACContext(user_id="u1", roles=("writer",), tenant_id="t1")
+
+    middleware.authorize(
+        context=context,
+        permission=Permission.MEMORY_READ,
+        resource=RBACResource(resource_type="memory", action="read", tenant_id="t1", scope="own"),
+    )
+    with pytest.raises(RBACAuthorizationError):
+        middleware.authorize(
+            context=context,
+            permission=Permission.TOOL_INVOKE,
+            resource=RBACResource(resource_type="tool", action="invoke", tenant_id="t1"),
+        )
+
+
+def test_role_inheritance_cycles_are_rejected() -> None:
+    with pytest.raises(ValueError, match="cycle"):
+        RBACMiddleware(
+            {
+                "a": RolePolicy(permissions=frozenset(), inherits=frozenset({"b"})),
+                "b": RolePolicy(permissions=frozenset(), inherits=frozenset({"a"})),
+            }
+        )
+
+
+def test_reload_swaps_policies_and_bumps_version() -> None:
+    middleware = RBACMiddleware()
+    context = RBACContext(user_id="u1", roles=("viewer",), tenant_id="t1")
+    resource = RBACResource(resource_type="tool", action="invoke", tenant_id="t1", scope="own")
+    with pytest.raises(RBACAuthorizationError):
+        middleware.authorize(context=context, permission=Permission.TOOL_INVOKE, resource=resource)
+
+    version = middleware.reload(
+        {"viewer": RolePolicy(permissions=frozenset({Permission.TOOL_INVOKE}), scopes=frozenset({"own"}))}
+    )
+
+    assert version == 1 and middleware.version == 1
+    middleware.authorize(context=context, permission=Permission.TOOL_INVOKE, resource=resource)
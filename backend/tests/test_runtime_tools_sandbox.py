@@ -11,7 +11,7 @@ class _RunnerStub:
     def __init__(self) -> None:
         self.calls = 0
 
-    def run_callable(self, func, *args, policy=None, **kwargs):
+    def run_callable(self, func, *args, policy=None, tenant_id=None, **kwargs):
         self.calls += 1
         return SandboxResult(ok=True, output=func(*args, **kwargs))
 
@@ -50,3 +50,67 @@ def test_sandbox_restricts_filesystem_to_explicit_paths(tmp_path: Path) -> None:
     assert allowed_result.output == "ok"
     assert not denied_result.ok
     assert "filesystem access denied" in denied_result.error
+
+
+def _worker_pid() -> int:
+    import os
+
+    return os.getpid()
+
+
+def _write_scratch_file(name: str) -> bool:
+    existed = Path(name).exists()
+    Path(name).write_text("scratch", encoding="utf-8")
+    return existed
+
+
+def test_pooled_sandbox_reuses_warm_workers_and_recycles_after_max_calls() -> None:
+    runner = SandboxRunner(pool_size=1, max_calls_per_worker=2)
+    try:
+        pids = [runner.run_callable(_worker_pid).output for _ in range(3)]
+        assert pids[0] == pids[1]
+        assert pids[2] != pids[1]
+
+        assert runner.run_callable(_write_scratch_file, "state.txt").output is False
+        assert runner.run_callable(_write_scratch_file, "state.txt").output is False
+    finally:
+        runner.close()
+
+
+def test_pooled_sandbox_keeps_restrictions_and_falls_back_for_closures() -> None:
+    runner = SandboxRunner(pool_size=1)
+    try:
+        blocked = runner.run_callable(_network_probe)
+        assert not blocked.ok
+        assert "network access disabled" in blocked.error
+
+        offset = 3
+        assert runner.run_callable(lambda value: value + offset, 4).output == 7
+    finally:
+        runner.close()
+
+
+def _unpicklable_result() -> object:
+    return lambda: None
+
+
+def test_pooled_workers_are_not_shared_across_tenants() -> None:
+    runner = SandboxRunner(pool_size=2)
+    try:
+        tenant_a = runner.run_callable(_worker_pid, tenant_id="tenant-a").output
+        assert runner.run_callable(_worker_pid, tenant_id="tenant-a").output == tenant_a
+        assert runner.run_callable(_worker_pid, tenant_id="tenant-b").output != tenant_a
+    finally:
+        runner.close()
+
+
+def test_pooled_worker_reports_unpicklable_result_and_stays_warm() -> None:
+    runner = SandboxRunner(pool_size=1)
+    try:
+        pid = runner.run_callable(_worker_pid).output
+        result = runner.run_callable(_unpicklable_result)
+        assert not result.ok
+        assert "could not be pickled" in result.error
+        assert runner.run_callable(_worker_pid).output == pid
+    finally:
+        runner.close()
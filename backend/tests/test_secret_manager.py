@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import threading
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+pytest.importorskip("pydantic_settings")
+pytest.importorskip("supabase")
+
+from auth import secret_manager as secret_manager_module
+from auth.secret_manager import SecretManager, SecretVersion
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeSecretTable:
+    def __init__(self) -> None:
+        self.version = 1
+        self.fetches = 0
+        self.fetched = threading.Event()
+
+    def __call__(self, name: str) -> SecretVersion:
+        self.fetches += 1
+        self.fetched.set()
+        return SecretVersion(name=name, value=f"value-{self.version}", version=str(self.version))
+
+
+@pytest.fixture
+def manager(monkeypatch) -> tuple[SecretManager, _FakeSecretTable, _Clock]:
+    monkeypatch.setattr(secret_manager_module.settings, "secret_manager_provider", "supabase")
+    clock = _Clock()
+    table = _FakeSecretTable()
+    instance = SecretManager(
+        cache_ttl_seconds=300,
+        refresh_ahead_seconds=60,
+        min_force_refresh_interval_seconds=30,
+        time_fn=clock,
+    )
+    monkeypatch.setattr(instance, "_get_from_supabase", table)
+    return instance, table, clock
+
+
+def test_refresh_ahead_serves_cached_secret_while_fetching_in_background(manager) -> None:
+    instance, table, clock = manager
+    assert instance.get_active_secret("jwt").version == "1"
+
+    table.version = 2
+    table.fetched.clear()
+    clock.now += 250
+    assert instance.get_active_secret("jwt").version == "1"
+    assert table.fetched.wait(timeout=2)
+    for _ in range(100):
+        if instance.get_active_secret("jwt").version == "2":
+            break
+        threading.Event().wait(0.01)
+    assert instance.get_active_secret("jwt").version == "2"
+    assert table.fetches == 2
+
+
+def test_forced_refresh_is_rate_limited_per_secret(manager) -> None:
+    instance, table, clock = manager
+    instance.get_active_secret("jwt")
+    instance.get_active_secret("other")
+
+    for _ in range(50):
+        instance.get_active_secret("jwt", force_refresh=True)
+    assert table.fetches == 2
+
+    table.version = 2
+    clock.now += 31
+    assert instance.get_active_secret("jwt", force_refresh=True).version == "2"
+    assert instance.get_active_secret("jwt", force_refresh=True).version == "2"
+    assert table.fetches == 3
+    assert instance.get_active_secret("other", force_refresh=True).version == "2"
+    assert table.fetches == 4
@@ -5,9 +5,9 @@ from __future__ import annotations
 import json
 import time
 import uuid
-from collections import deque
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 
 from monitoring.runtime_metrics import runtime_metrics
 
@@ -42,7 +42,9 @@ class DurableEventBus:
         self.max_consumer_failures = max(1, max_consumer_failures)
         self.max_payload_bytes = max(1024, max_payload_bytes)
         self._local_subscribers: dict[str, list[Subscriber]] = {}
-        self._recent_event_ids: deque[str] = deque(maxlen=max(1, dedupe_window_size))
+        self.dedupe_window_size = max(1, dedupe_window_size)
+        self._recent_event_ids: OrderedDict[str, None] = OrderedDict()
+        self._ready_groups: set[str] = set()
 
     @classmethod
     def from_url(cls, redis_url: str, *, stream_name: str = "agentos:events") -> "DurableEventBus":
@@ -63,15 +65,11 @@ class DurableEventBus:
         return self.publish_event(event)
 
     def publish_event(self, event: Event) -> str:
-        payload_json = json.dumps(event.payload)
-        if len(payload_json.encode("utf-8")) > self.max_payload_bytes:
-            runtime_metrics.inc("event_bus.payload_rejected")
-            raise ValueError(f"event payload too large for topic={event.topic}")
-        event_id = event.event_id or f"evt-{uuid.uuid4().hex}"
-        if event_id in self._recent_event_ids:
+        message = self._prepare_message(event)
+        event_id = message["event_id"]
+        if self._seen(event_id):
             runtime_metrics.inc("event_bus.duplicates_dropped")
             return event_id
-        message = {"topic": event.topic, "payload": payload_json, "timestamp": str(event.timestamp), "event_id": event_id}
         if self.redis is not None:
             try:
                 message_id = str(self.redis.xadd(self.stream_name, message))
@@ -80,11 +78,54 @@ class DurableEventBus:
                 raise
         else:
             message_id = event_id
-        self._recent_event_ids.append(event_id)
+        self._remember(event_id)
         self._dispatch_local(Event(topic=event.topic, payload=event.payload, event_id=message_id, timestamp=event.timestamp))
         runtime_metrics.inc("event_bus.published")
         return message_id
 
+    def publish_many(self, events: Iterable[Event]) -> list[str]:
+        """Publishes events with one pipelined round trip, preserving order.
+
+        Duplicates (within the batch or the dedupe window) are dropped and
+        reported by their event id, as ``publish_event`` does.
+        """
+        prepared: list[tuple[Event, dict[str, str]]] = []
+        batch_ids: set[str] = set()
+        results: list[str | None] = []
+        for event in events:
+            message = self._prepare_message(event)
+            event_id = message["event_id"]
+            if event_id in batch_ids or self._seen(event_id):
+                runtime_metrics.inc("event_bus.duplicates_dropped")
+                results.append(event_id)
+                continue
+            batch_ids.add(event_id)
+            prepared.append((event, message))
+            results.append(None)
+
+        if self.redis is not None and prepared:
+            pipe = self.redis.pipeline(transaction=False)
+            for _, message in prepared:
+                pipe.xadd(self.stream_name, message)
+            try:
+                message_ids = [str(message_id) for message_id in pipe.execute()]
+            except Exception:
+                runtime_metrics.inc("event_bus.publish_failures")
+                raise
+        else:
+            message_ids = [message["event_id"] for _, message in prepared]
+
+        published = iter(zip(prepared, message_ids))
+        for position, result in enumerate(results):
+            if result is not None:
+                continue
+            (event, message), message_id = next(published)
+            self._remember(message["event_id"])
+            self._dispatch_local(Event(topic=event.topic, payload=event.payload, event_id=message_id, timestamp=event.timestamp))
+            results[position] = message_id
+        runtime_metrics.inc("event_bus.published", float(len(prepared)))
+        return [str(result) for result in results]
+
     def replay(self, callback: Subscriber, *, topic: str | None = None, from_id: str = "0-0", count: int = 100) -> list[Event]:
         events: list[Event] = []
         if self.redis is None:
@@ -98,19 +139,36 @@ class DurableEventBus:
         return events
 
     def ensure_consumer_group(self, group: str, *, start_id: str = "0") -> None:
-        if self.redis is None:
+        if self.redis is None or group in self._ready_groups:
             return
         try:
             self.redis.xgroup_create(self.stream_name, group, id=start_id, mkstream=True)
         except Exception as exc:  # noqa: BLE001
             if "BUSYGROUP" not in str(exc):
                 raise
+        self._ready_groups.add(group)
 
     def consume(self, *, group: str, consumer: str, callback: Subscriber, block_ms: int = 1000, count: int = 10) -> int:
         if self.redis is None:
             return 0
         self.ensure_consumer_group(group)
-        rows = self.redis.xreadgroup(group, consumer, {self.stream_name: ">"}, count=count, block=block_ms)
+        try:
+            rows = self.redis.xreadgroup(group, consumer, {self.stream_name: ">"}, count=count, block=block_ms)
+        except Exception as exc:  # noqa: BLE001
+            if "NOGROUP" not in str(exc):
+                raise
+            # The stream or group was deleted since it was cached; recreate it once.
+            self._ready_groups.discard(group)
+            self.ensure_consumer_group(group)
+            rows = self.redis.xreadgroup(group, consumer, {self.stream_name: ">"}, count=count, block=block_ms)
+        handled: list[str] = []
+        try:
+            return self._process_messages(rows, group, callback, handled)
+        finally:
+            if handled:
+                self.redis.xack(self.stream_name, group, *handled)
+
+    def _process_messages(self, rows: Any, group: str, callback: Subscriber, handled: list[str]) -> int:
         processed = 0
         for _, messages in rows:
             for message_id, data in messages:
@@ -128,7 +186,7 @@ class DurableEventBus:
                                 "timestamp": str(event.timestamp),
                                 "error": str(exc),
                             })
-                        self.redis.xack(self.stream_name, group, message_id)
+                        handled.append(message_id)
                         runtime_metrics.inc("event_bus.dead_lettered")
                     else:
                         if self.redis is not None:
@@ -138,9 +196,9 @@ class DurableEventBus:
                                 "timestamp": str(event.timestamp),
                                 "attempts": str(attempts),
                             })
-                        self.redis.xack(self.stream_name, group, message_id)
+                        handled.append(message_id)
                     continue
-                self.redis.xack(self.stream_name, group, message_id)
+                handled.append(message_id)
                 runtime_metrics.inc("event_bus.consumed")
                 self._dispatch_local(event)
                 processed += 1
@@ -152,6 +210,25 @@ class DurableEventBus:
     def report_completion(self, *, task_id: str, worker_id: str, result: dict[str, Any]) -> None:
         self.publish("worker.task_completed", {"task_id": task_id, "worker_id": worker_id, "result": result})
 
+    def _prepare_message(self, event: Event) -> dict[str, str]:
+        payload_json = json.dumps(event.payload)
+        if len(payload_json.encode("utf-8")) > self.max_payload_bytes:
+            runtime_metrics.inc("event_bus.payload_rejected")
+            raise ValueError(f"event payload too large for topic={event.topic}")
+        event_id = event.event_id or f"evt-{uuid.uuid4().hex}"
+        return {"topic": event.topic, "payload": payload_json, "timestamp": str(event.timestamp), "event_id": event_id}
+
+    def _seen(self, event_id: str) -> bool:
+        if event_id not in self._recent_event_ids:
+            return False
+        self._recent_event_ids.move_to_end(event_id)
+        return True
+
+    def _remember(self, event_id: str) -> None:
+        self._recent_event_ids[event_id] = None
+        if len(self._recent_event_ids) > self.dedupe_window_size:
+            self._recent_event_ids.popitem(last=False)
+
     def _dispatch_local(self, event: Event) -> None:
         for callback in self._local_subscribers.get(event.topic, []):
             callback(event)
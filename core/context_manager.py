@@ -2,14 +2,107 @@
 
 from __future__ import annotations
 
+import hashlib
 import math
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from threading import Lock
+from typing import Any, Protocol
 
 from memory.vector_memory import MemoryRecord, VectorMemory
 
 
+class TokenCounter(Protocol):
+    """Counts and trims text in the token units of a specific model family."""
+
+    def count(self, text: str) -> int: ...
+
+    def truncate(self, text: str, max_tokens: int) -> str: ...
+
+
+class HeuristicTokenCounter:
+    """Dependency-free ``len(text) / 4`` approximation used when no tokenizer is installed."""
+
+    chars_per_token = 4
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        return max(1, math.ceil(len(text) / self.chars_per_token))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        return text[: max(0, max_tokens) * self.chars_per_token]
+
+
+class TiktokenCounter:
+    """Exact BPE counts from ``tiktoken``; set ``TIKTOKEN_CACHE_DIR`` to load the tables offline."""
+
+    def __init__(self, encoding_name: str = "cl100k_base") -> None:
+        try:
+            import tiktoken
+        except ModuleNotFoundError as exc:  # pragma: no cover - runtime dependency check
+            raise RuntimeError("tiktoken package is required for TiktokenCounter") from exc
+        self._encoding = tiktoken.get_encoding(encoding_name)
+
+    def count(self, text: str) -> int:
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        tokens = self._encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return self._encoding.decode(tokens[: max(0, max_tokens)])
+
+
+class CachedTokenCounter:
+    """LRU cache of token counts keyed by a digest of the text, in front of any counter.
+
+    Records are re-counted on every retrieval, chunking and packing pass, so
+    caching by content hash makes repeated counts of the same text O(1)
+    without holding the texts themselves in memory.
+    """
+
+    def __init__(self, counter: TokenCounter, max_entries: int = 4096) -> None:
+        self.counter = counter
+        self.max_entries = max(1, max_entries)
+        self._counts: OrderedDict[bytes, int] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        with self._lock:
+            cached = self._counts.get(key)
+            if cached is not None:
+                self._counts.move_to_end(key)
+                self.hits += 1
+                return cached
+        tokens = self.counter.count(text)
+        with self._lock:
+            self.misses += 1
+            self._counts[key] = tokens
+            while len(self._counts) > self.max_entries:
+                self._counts.popitem(last=False)
+        return tokens
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        return self.counter.truncate(text, max_tokens)
+
+
+def default_token_counter() -> TokenCounter:
+    """Uses tiktoken when it is installed and its tables load, otherwise the heuristic, behind an LRU cache."""
+
+    try:
+        counter: TokenCounter = TiktokenCounter()
+    except Exception:
+        counter = HeuristicTokenCounter()
+    return CachedTokenCounter(counter)
+
+
 @dataclass(slots=True)
 class ContextWindowConfig:
     """Defines how much context can be sent to an LLM request."""
@@ -24,7 +117,12 @@ class ContextWindowConfig:
 
 
 class LLMContextManager:
-    """Builds context that fits model limits with retrieval, summarization and prioritization."""
+    """Builds context that fits model limits with retrieval, summarization and prioritization.
+
+    Token counts come from ``token_counter`` (see ``default_token_counter``),
+    and long histories are only summarized when the candidate context would
+    not otherwise fit the prompt budget.
+    """
 
     _KIND_PRIORITY = {
         "goal": 1.0,
@@ -39,22 +137,25 @@ class LLMContextManager:
         "summary": 0.78,
     }
 
-    def __init__(self, *, memory: VectorMemory, config: ContextWindowConfig) -> None:
+    def __init__(
+        self,
+        *,
+        memory: VectorMemory,
+        config: ContextWindowConfig,
+        token_counter: TokenCounter | None = None,
+    ) -> None:
         self.memory = memory
         self.config = config
+        self.token_counter = token_counter or default_token_counter()
 
-    @staticmethod
-    def _estimate_tokens(text: str) -> int:
-        if not text:
-            return 0
-        return max(1, math.ceil(len(text) / 4))
+    def _estimate_tokens(self, text: str) -> int:
+        return self.token_counter.count(text)
 
     @staticmethod
     def _record_text(record: MemoryRecord) -> str:
         return f"{record.kind}: {record.payload}"
 
-    @staticmethod
-    def _chunk_text(text: str, *, max_tokens: int) -> list[str]:
+    def _chunk_text(self, text: str, *, max_tokens: int) -> list[str]:
         words = text.split()
         if not words:
             return []
@@ -63,7 +164,7 @@ class LLMContextManager:
         current: list[str] = []
         current_tokens = 0
         for word in words:
-            word_tokens = max(1, math.ceil(len(word) / 4))
+            word_tokens = max(1, self._estimate_tokens(f" {word}"))
             if current and current_tokens + word_tokens > max_tokens:
                 chunks.append(" ".join(current))
                 current = [word]
@@ -77,22 +178,19 @@ class LLMContextManager:
 
         return chunks
 
-    @classmethod
-    def _summarize_records(cls, records: list[MemoryRecord], *, max_tokens: int) -> MemoryRecord | None:
+    def _summarize_records(self, records: list[MemoryRecord], *, max_tokens: int) -> MemoryRecord | None:
         if not records:
             return None
 
         snippets: list[str] = []
         consumed = 0
         for record in records:
-            text = cls._record_text(record)
             remaining = max_tokens - consumed
             if remaining <= 0:
                 break
-            max_chars = max(32, remaining * 4)
-            shortened = text[:max_chars]
-            tokens = cls._estimate_tokens(shortened)
-            if consumed + tokens > max_tokens:
+            shortened = self.token_counter.truncate(self._record_text(record), remaining)
+            tokens = self._estimate_tokens(shortened)
+            if not shortened or consumed + tokens > max_tokens:
                 break
             snippets.append(shortened)
             consumed += tokens
@@ -119,27 +217,35 @@ class LLMContextManager:
         return base + recency_bonus
 
     def _truncate_by_priority(self, records: list[MemoryRecord]) -> list[MemoryRecord]:
-        budget = self.config.prompt_budget_tokens
-        used = 0
+        """Greedily packs records by priority, skipping any that would overshoot the remaining budget."""
+
+        remaining = self.config.prompt_budget_tokens
         selected: list[MemoryRecord] = []
 
         ranked = sorted(records, key=self._priority_for, reverse=True)
         for record in ranked:
+            if remaining <= 0:
+                break
             text_tokens = self._estimate_tokens(self._record_text(record))
-            if used + text_tokens > budget:
+            if text_tokens > remaining:
                 continue
             selected.append(record)
-            used += text_tokens
+            remaining -= text_tokens
 
         return selected
 
     def _summarize_long_histories(self, records: list[MemoryRecord]) -> tuple[list[MemoryRecord], MemoryRecord | None]:
+        budget = self.config.prompt_budget_tokens
+        record_tokens = [self._estimate_tokens(self._record_text(record)) for record in records]
+        if sum(record_tokens) <= budget:
+            return records, None
+
         long_records: list[MemoryRecord] = []
         compact_records: list[MemoryRecord] = []
-        long_threshold = max(120, self.config.prompt_budget_tokens // 3)
+        long_threshold = max(120, budget // 3)
 
-        for record in records:
-            if self._estimate_tokens(self._record_text(record)) > long_threshold:
+        for record, tokens in zip(records, record_tokens):
+            if tokens > long_threshold:
                 long_records.append(record)
             else:
                 compact_records.append(record)
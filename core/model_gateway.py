@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import inspect
 import logging
+import queue
+import threading
 import time
+from contextlib import AbstractContextManager
 from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any, Awaitable, Callable
 
 from core.quota_ledger import DurableQuotaLedger, QuotaDebit
 from core.semantic_cache import SemanticLLMCache
-from governance.audit_ledger import AuditLedger
+from governance.audit_ledger import EVENT_TOOL_EXECUTION, AuditLedger
 from monitoring.runtime_metrics import runtime_metrics
 from monitoring.structured_logging import log_event
-from monitoring.tracing import get_tracer
+from monitoring.tracing import TraceContext, get_tracer
 from security.tenant_context import TenantContext, require_tenant_context
 
 
@@ -27,17 +32,56 @@ class ModelRequest:
     metadata: dict[str, Any]
 
 
+@dataclass(slots=True)
+class _PostCallRecord:
+    tenant_id: str
+    agent_id: str
+    request_id: str
+    trace_id: str
+    model: str
+    prompt: str
+    output: str
+    usage: dict[str, Any]
+
+
 class ModelGateway:
+    """Routes model calls through tenant policy, the semantic cache and the quota ledger.
+
+    After a cache miss, the cache insert, structured log and audit append are
+    post-call bookkeeping. Under ``"sync"`` durability (the default) they run
+    before the call returns. Under ``"deferred"`` they go onto a bounded queue
+    that a background thread drains in batches of up to ``post_call_batch_size``,
+    with audit entries written through ``AuditLedger.append_many``. When the
+    queue is full the record is processed inline, so bookkeeping is never
+    dropped. If a deferred batch's audit append fails, its entries are retried
+    one at a time, up to ``post_call_max_attempts`` each, before being counted
+    as ``model_gateway.post_call_failed``. ``tenant_durability`` selects the
+    mode per tenant. ``flush()`` drains the queue, and ``close()`` flushes and
+    stops the thread.
+    """
+
+    DURABILITY_MODES = ("sync", "deferred")
+
     def __init__(
         self,
         *,
         quota_ledger: DurableQuotaLedger,
-        model_router: dict[str, Callable[[ModelRequest], str]] | None = None,
+        model_router: dict[str, Callable[[ModelRequest], str | Awaitable[str]]] | None = None,
         audit_ledger: AuditLedger | None = None,
         logger: logging.Logger | None = None,
         semantic_cache: SemanticLLMCache | None = None,
         tenant_model_allowlist: dict[str, set[str]] | None = None,
+        default_durability: str = "sync",
+        tenant_durability: dict[str, str] | None = None,
+        post_call_queue_size: int = 1024,
+        post_call_batch_size: int = 64,
+        post_call_flush_interval_seconds: float = 0.05,
+        post_call_max_attempts: int = 3,
+        post_call_retry_backoff_seconds: float = 0.1,
     ) -> None:
+        for mode in [default_durability, *(tenant_durability or {}).values()]:
+            if mode not in self.DURABILITY_MODES:
+                raise ValueError(f"durability must be one of {self.DURABILITY_MODES}")
         self.quota_ledger = quota_ledger
         self.model_router = model_router or {}
         self.audit_ledger = audit_ledger
@@ -45,10 +89,23 @@ class ModelGateway:
         self.tracer = get_tracer()
         self.semantic_cache = semantic_cache or SemanticLLMCache()
         self.tenant_model_allowlist = tenant_model_allowlist or {}
+        self.default_durability = default_durability
+        self.tenant_durability = dict(tenant_durability or {})
+        self.post_call_batch_size = max(1, post_call_batch_size)
+        self.post_call_flush_interval_seconds = post_call_flush_interval_seconds
+        self.post_call_max_attempts = max(1, post_call_max_attempts)
+        self.post_call_retry_backoff_seconds = post_call_retry_backoff_seconds
+        self._post_calls: queue.Queue[_PostCallRecord] = queue.Queue(maxsize=max(1, post_call_queue_size))
+        self._post_call_lock = threading.Lock()
+        self._post_call_thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
 
-    def register_model(self, model: str, handler: Callable[[ModelRequest], str]) -> None:
+    def register_model(self, model: str, handler: Callable[[ModelRequest], str | Awaitable[str]]) -> None:
         self.model_router[model] = handler
 
+    def durability_for(self, tenant_id: str) -> str:
+        return self.tenant_durability.get(tenant_id, self.default_durability)
+
     def _validate_policy(self, request: ModelRequest) -> None:
         if request.max_tokens <= 0 or request.estimated_tokens <= 0:
             raise ValueError("token bounds must be positive")
@@ -65,7 +122,64 @@ class ModelGateway:
         enforced = require_tenant_context(context)
         self._validate_policy(request)
 
-        with self.tracer.start_span(
+        with self._span(request, enforced) as span:
+            start = time.perf_counter()
+            cached = self._lookup_cached(request, enforced, start)
+            if cached is not None:
+                return cached
+
+            handler = self.model_router.get(request.model, self._fallback_handler)
+            if inspect.iscoroutinefunction(handler):
+                raise TypeError(f"model {request.model} has an async handler; use acall()")
+            usage = self.quota_ledger.debit(self._debit_for(request, enforced))
+            output = handler(request)
+            return self._complete(request, enforced, span.trace_id, output, usage, start)
+
+    async def acall(self, request: ModelRequest, *, context: TenantContext) -> dict[str, Any]:
+        """Async ``call``: awaits coroutine handlers and runs blocking steps in worker threads."""
+        enforced = require_tenant_context(context)
+        self._validate_policy(request)
+
+        with self._span(request, enforced) as span:
+            start = time.perf_counter()
+            cached = self._lookup_cached(request, enforced, start)
+            if cached is not None:
+                return cached
+
+            usage = await asyncio.to_thread(self.quota_ledger.debit, self._debit_for(request, enforced))
+            handler = self.model_router.get(request.model, self._fallback_handler)
+            if inspect.iscoroutinefunction(handler):
+                output = await handler(request)
+            else:
+                output = await asyncio.to_thread(handler, request)
+                if inspect.isawaitable(output):
+                    output = await output
+            if self.durability_for(enforced.tenant_id) == "sync":
+                return await asyncio.to_thread(self._complete, request, enforced, span.trace_id, output, usage, start)
+            return self._complete(request, enforced, span.trace_id, output, usage, start)
+
+    def flush(self) -> int:
+        """Processes every queued post-call record on the calling thread; returns how many ran."""
+        processed = 0
+        while True:
+            batch = self._take_batch(block=False)
+            if not batch:
+                return processed
+            self._process_post_calls(batch, retry=True)
+            processed += len(batch)
+
+    def close(self) -> None:
+        """Stops the post-call thread and flushes anything it left queued."""
+        self._stop_event.set()
+        thread = self._post_call_thread
+        if thread is not None:
+            thread.join()
+            self._post_call_thread = None
+        self.flush()
+        self._stop_event.clear()
+
+    def _span(self, request: ModelRequest, enforced: TenantContext) -> AbstractContextManager[TraceContext]:
+        return self.tracer.start_span(
             "model_gateway.call",
             kind="llm_call",
             attributes={
@@ -75,53 +189,158 @@ class ModelGateway:
                 "trace_id": enforced.trace_id,
                 "model": request.model,
             },
-        ) as span:
-            allowed_models = self.tenant_model_allowlist.get(enforced.tenant_id)
-            if allowed_models is not None and request.model not in allowed_models:
-                runtime_metrics.inc("model_gateway.blocked_model")
-                raise PermissionError(f"model {request.model} is not allowed for tenant {enforced.tenant_id}")
+        )
 
-            start = time.perf_counter()
-            cached = self.semantic_cache.lookup(
-                request.prompt,
-                tenant_id=enforced.tenant_id,
-                model=request.model,
-            )
-            if cached is not None:
-                runtime_metrics.inc("model_gateway.cache_hit")
-                runtime_metrics.observe("model_gateway.latency_ms", (time.perf_counter() - start) * 1000)
-                return {"output": cached, "usage": {"cached": True}, "model": request.model}
-
-            usage = self.quota_ledger.debit(
-                QuotaDebit(
-                    tenant_id=enforced.tenant_id,
-                    agent_id=enforced.agent_id,
-                    request_id=enforced.request_id,
-                    tokens=request.estimated_tokens,
-                    cost=request.estimated_cost,
-                )
-            )
-            handler = self.model_router.get(request.model, self._fallback_handler)
-            output = handler(request)
-            self.semantic_cache.store(request.prompt, output, tenant_id=enforced.tenant_id, model=request.model)
-            runtime_metrics.inc("model_gateway.cache_miss")
-            runtime_metrics.observe("model_gateway.latency_ms", (time.perf_counter() - start) * 1000)
+    def _lookup_cached(self, request: ModelRequest, enforced: TenantContext, start: float) -> dict[str, Any] | None:
+        allowed_models = self.tenant_model_allowlist.get(enforced.tenant_id)
+        if allowed_models is not None and request.model not in allowed_models:
+            runtime_metrics.inc("model_gateway.blocked_model")
+            raise PermissionError(f"model {request.model} is not allowed for tenant {enforced.tenant_id}")
+
+        cached = self.semantic_cache.lookup(
+            request.prompt,
+            tenant_id=enforced.tenant_id,
+            model=request.model,
+        )
+        if cached is None:
+            return None
+        runtime_metrics.inc("model_gateway.cache_hit")
+        runtime_metrics.observe("model_gateway.latency_ms", (time.perf_counter() - start) * 1000)
+        return {"output": cached, "usage": {"cached": True}, "model": request.model}
+
+    @staticmethod
+    def _debit_for(request: ModelRequest, enforced: TenantContext) -> QuotaDebit:
+        return QuotaDebit(
+            tenant_id=enforced.tenant_id,
+            agent_id=enforced.agent_id,
+            request_id=enforced.request_id,
+            tokens=request.estimated_tokens,
+            cost=request.estimated_cost,
+        )
+
+    def _complete(
+        self,
+        request: ModelRequest,
+        enforced: TenantContext,
+        trace_id: str,
+        output: str,
+        usage: dict[str, Any],
+        start: float,
+    ) -> dict[str, Any]:
+        record = _PostCallRecord(
+            tenant_id=enforced.tenant_id,
+            agent_id=enforced.agent_id,
+            request_id=enforced.request_id,
+            trace_id=trace_id,
+            model=request.model,
+            prompt=request.prompt,
+            output=output,
+            usage=usage,
+        )
+        if self.durability_for(enforced.tenant_id) == "sync":
+            self._process_post_calls([record])
+        else:
+            self._enqueue_post_call(record)
+        runtime_metrics.inc("model_gateway.cache_miss")
+        runtime_metrics.observe("model_gateway.latency_ms", (time.perf_counter() - start) * 1000)
+        return {"output": output, "usage": usage, "model": request.model}
+
+    def _enqueue_post_call(self, record: _PostCallRecord) -> None:
+        self._ensure_post_call_thread()
+        try:
+            self._post_calls.put_nowait(record)
+        except queue.Full:
+            runtime_metrics.inc("model_gateway.post_call_inline")
+            self._process_post_calls([record])
+        runtime_metrics.set_gauge("model_gateway.post_call_queue_depth", float(self._post_calls.qsize()))
+
+    def _ensure_post_call_thread(self) -> None:
+        if self._post_call_thread is not None:
+            return
+        with self._post_call_lock:
+            if self._post_call_thread is None:
+                self._post_call_thread = threading.Thread(target=self._run_post_calls, daemon=True)
+                self._post_call_thread.start()
+
+    def _run_post_calls(self) -> None:
+        while not self._stop_event.is_set():
+            batch = self._take_batch(block=True)
+            if not batch:
+                continue
+            try:
+                self._process_post_calls(batch, retry=True)
+            except Exception:
+                runtime_metrics.inc("model_gateway.post_call_failed", float(len(batch)))
+                self.logger.exception("model gateway post-call batch failed")
+
+    def _take_batch(self, *, block: bool) -> list[_PostCallRecord]:
+        batch: list[_PostCallRecord] = []
+        try:
+            if block:
+                batch.append(self._post_calls.get(timeout=self.post_call_flush_interval_seconds))
+            while len(batch) < self.post_call_batch_size:
+                batch.append(self._post_calls.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def _process_post_calls(self, records: list[_PostCallRecord], *, retry: bool = False) -> None:
+        for record in records:
+            self.semantic_cache.store(record.prompt, record.output, tenant_id=record.tenant_id, model=record.model)
             log_event(
                 self.logger,
                 component="model_gateway",
                 event="llm_call_executed",
-                tenant_id=enforced.tenant_id,
-                agent_id=enforced.agent_id,
-                request_id=enforced.request_id,
-                trace_id=span.trace_id,
-                model=request.model,
-                usage=usage,
+                tenant_id=record.tenant_id,
+                agent_id=record.agent_id,
+                request_id=record.request_id,
+                trace_id=record.trace_id,
+                model=record.model,
+                usage=record.usage,
             )
-            if self.audit_ledger is not None:
-                self.audit_ledger.record_tool_execution(
-                    actor=enforced.agent_id,
-                    tool=f"model:{request.model}",
-                    status="success",
-                    metadata={"tenant_id": enforced.tenant_id, "request_id": enforced.request_id, "prompt_hash": hashlib.sha256(request.prompt.encode()).hexdigest()},
-                )
-            return {"output": output, "usage": usage, "model": request.model}
+        if self.audit_ledger is None:
+            return
+        events = [self._audit_event(record) for record in records]
+        if not retry:
+            self.audit_ledger.append_many(events)
+            return
+        try:
+            self.audit_ledger.append_many(events)
+        except Exception:
+            self.logger.exception("model gateway audit batch failed; retrying %d entries one by one", len(events))
+            for record, event in zip(records, events):
+                self._append_audit_with_retry(record, event)
+
+    def _append_audit_with_retry(self, record: _PostCallRecord, event: tuple[str, str, dict[str, Any]]) -> None:
+        for attempt in range(1, self.post_call_max_attempts + 1):
+            try:
+                self.audit_ledger.append_many([event])
+                return
+            except Exception:
+                if attempt == self.post_call_max_attempts:
+                    runtime_metrics.inc("model_gateway.post_call_failed")
+                    self.logger.exception(
+                        "model gateway audit entry dropped after %d attempts (request_id=%s)",
+                        attempt,
+                        record.request_id,
+                    )
+                    return
+                runtime_metrics.inc("model_gateway.post_call_retried")
+                time.sleep(self.post_call_retry_backoff_seconds * attempt)
+
+    @staticmethod
+    def _audit_event(record: _PostCallRecord) -> tuple[str, str, dict[str, Any]]:
+        return (
+            EVENT_TOOL_EXECUTION,
+            record.agent_id,
+            {
+                "tool": f"model:{record.model}",
+                "status": "success",
+                "duration_ms": None,
+                "metadata": {
+                    "tenant_id": record.tenant_id,
+                    "request_id": record.request_id,
+                    "prompt_hash": hashlib.sha256(record.prompt.encode()).hexdigest(),
+                },
+            },
+        )
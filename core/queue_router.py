@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import bisect
 import hashlib
+import math
+import time
 from dataclasses import dataclass
+from typing import Callable, Iterator
 
 from monitoring.runtime_metrics import runtime_metrics
 
@@ -18,11 +22,41 @@ class QueueShard:
 
 
 class QueueShardRouter:
-    def __init__(self, shard_queues: dict[str, DistributedTaskQueue], *, tenant_assignments: dict[str, str] | None = None) -> None:
+    """Routes tenants to shard queues on a consistent-hash ring with bounded loads.
+
+    Each shard owns ``virtual_nodes * weight`` points on the ring, so adding or
+    removing a shard only moves the tenants between it and its neighbours.
+    Placement walks clockwise from the tenant's hash and skips shards whose
+    load would exceed ``load_factor`` times the mean, or that would cross
+    their high watermark. Loads come from a depth sample refreshed every
+    ``depth_refresh_seconds`` and bumped locally on each route, so routing
+    itself never queries the backends.
+    """
+
+    def __init__(
+        self,
+        shard_queues: dict[str, DistributedTaskQueue],
+        *,
+        tenant_assignments: dict[str, str] | None = None,
+        virtual_nodes: int = 64,
+        shard_weights: dict[str, int] | None = None,
+        load_factor: float = 1.25,
+        depth_refresh_seconds: float = 1.0,
+        time_fn: Callable[[], float] | None = None,
+    ) -> None:
         if not shard_queues:
             raise ValueError("at least one shard queue is required")
-        self.shard_queues = shard_queues
         self.tenant_assignments = tenant_assignments or {}
+        self.virtual_nodes = max(1, virtual_nodes)
+        self.shard_weights = shard_weights or {}
+        self.load_factor = max(1.0, load_factor)
+        self.depth_refresh_seconds = max(0.0, depth_refresh_seconds)
+        self.time_fn = time_fn or time.monotonic
+        self._ring_hashes: list[int] = []
+        self._ring_shards: list[str] = []
+        self._depths: dict[str, int] = {}
+        self._depths_sampled_at: float | None = None
+        self._set_shards(shard_queues)
 
     def list_shards(self) -> list[str]:
         return sorted(self.shard_queues)
@@ -33,7 +67,7 @@ class QueueShardRouter:
         self.tenant_assignments[tenant_id] = shard_name
 
     def rebalance(self, shard_queues: dict[str, DistributedTaskQueue]) -> None:
-        self.shard_queues = shard_queues
+        self._set_shards(shard_queues)
         for tenant, shard in list(self.tenant_assignments.items()):
             if shard not in self.shard_queues:
                 self.tenant_assignments[tenant] = self._hash_shard(tenant)
@@ -46,21 +80,57 @@ class QueueShardRouter:
         """Expose shard queues for worker subscription bootstrapping."""
         return dict(self.shard_queues)
 
+    def refresh_depths(self) -> dict[str, int]:
+        """Samples every shard's depth; called automatically once the sample is stale."""
+        self._depths = {name: queue.queue_size() for name, queue in self.shard_queues.items()}
+        self._depths_sampled_at = self.time_fn()
+        return dict(self._depths)
+
+    def _set_shards(self, shard_queues: dict[str, DistributedTaskQueue]) -> None:
+        self.shard_queues = shard_queues
+        points = sorted(
+            (_ring_hash(f"{name}#{replica}"), name)
+            for name in shard_queues
+            for replica in range(self.virtual_nodes * max(1, self.shard_weights.get(name, 1)))
+        )
+        self._ring_hashes = [point for point, _ in points]
+        self._ring_shards = [name for _, name in points]
+        self._depths_sampled_at = None
+
+    def _ring_walk(self, tenant_id: str) -> Iterator[str]:
+        start = bisect.bisect(self._ring_hashes, _ring_hash(tenant_id))
+        seen: set[str] = set()
+        for offset in range(len(self._ring_shards)):
+            name = self._ring_shards[(start + offset) % len(self._ring_shards)]
+            if name not in seen:
+                seen.add(name)
+                yield name
+                if len(seen) == len(self.shard_queues):
+                    return
+
     def _hash_shard(self, tenant_id: str) -> str:
-        shards = sorted(self.shard_queues)
-        digest = int(hashlib.sha256(tenant_id.encode("utf-8")).hexdigest(), 16)
-        return shards[digest % len(shards)]
+        return next(self._ring_walk(tenant_id))
+
+    def _current_depths(self) -> dict[str, int]:
+        if self._depths_sampled_at is None or self.time_fn() - self._depths_sampled_at >= self.depth_refresh_seconds:
+            self.refresh_depths()
+        return self._depths
 
     def _select_least_loaded_shard(self) -> str:
-        return min(self.shard_queues, key=lambda name: self.shard_queues[name].queue_size())
+        depths = self._current_depths()
+        return min(self.shard_queues, key=lambda name: depths.get(name, 0))
 
     def shard_for_tenant(self, tenant_id: str) -> str:
         if tenant_id in self.tenant_assignments:
             return self.tenant_assignments[tenant_id]
-        candidate = self._hash_shard(tenant_id)
-        if self.shard_queues[candidate].is_under_pressure():
-            return self._select_least_loaded_shard()
-        return candidate
+        depths = self._current_depths()
+        bound = math.ceil(self.load_factor * (sum(depths.values()) + 1) / len(self.shard_queues))
+        for name in self._ring_walk(tenant_id):
+            depth = depths.get(name, 0) + 1
+            if depth <= bound and depth <= self.shard_queues[name].queue_high_watermark:
+                return name
+        runtime_metrics.inc("queue.route.overflow")
+        return self._select_least_loaded_shard()
 
     def route_task(self, task: QueueTask) -> str:
         enforce_context_in_metadata(task.metadata, strict=False)
@@ -68,5 +138,10 @@ class QueueShardRouter:
         shard_name = self.shard_for_tenant(tenant_id)
         task.metadata["queue_shard"] = shard_name
         self.shard_queues[shard_name].enqueue_task(task)
+        self._depths[shard_name] = self._depths.get(shard_name, 0) + 1
         runtime_metrics.inc(f"queue.route.shard.{shard_name}")
         return shard_name
+
+
+def _ring_hash(key: str) -> int:
+    return int.from_bytes(hashlib.sha256(key.encode("utf-8")).digest()[:8], "big")
@@ -32,6 +32,28 @@ class QuotaDebit:
     timestamp: float = field(default_factory=time.time)
 
 
+_EXCEEDED_MESSAGES = {
+    "tenant_tokens": "tenant token quota exceeded",
+    "agent_tokens": "agent token quota exceeded",
+    "daily_cost": "daily cost ceiling exceeded",
+    "monthly_cost": "monthly cost ceiling exceeded",
+}
+
+
+def _enforce_policy(current: dict[str, float], tokens: int, cost: float, policy: QuotaPolicy | None) -> None:
+    if policy is None:
+        return
+    limits = {
+        "tenant_tokens": (tokens, policy.tenant_token_quota),
+        "agent_tokens": (tokens, policy.agent_token_quota),
+        "daily_cost": (cost, policy.daily_cost_ceiling),
+        "monthly_cost": (cost, policy.monthly_cost_ceiling),
+    }
+    for field_name, (amount, ceiling) in limits.items():
+        if current[field_name] + amount > ceiling:
+            raise QuotaExceededError(_EXCEEDED_MESSAGES[field_name])
+
+
 class QuotaStore(Protocol):
     def read_usage(self, tenant_id: str, agent_id: str, day_key: str, month_key: str) -> dict[str, float]: ...
 
@@ -44,6 +66,7 @@ class QuotaStore(Protocol):
         tokens: int,
         cost: float,
         request_id: str,
+        policy: QuotaPolicy | None = None,
     ) -> dict[str, float]: ...
 
 
@@ -72,11 +95,22 @@ class InMemoryQuotaStore:
                 "monthly_cost": float(self._state.get(keys[3], 0.0)),
             }
 
-    def atomic_debit(self, tenant_id: str, agent_id: str, day_key: str, month_key: str, tokens: int, cost: float, request_id: str) -> dict[str, float]:
+    def atomic_debit(
+        self,
+        tenant_id: str,
+        agent_id: str,
+        day_key: str,
+        month_key: str,
+        tokens: int,
+        cost: float,
+        request_id: str,
+        policy: QuotaPolicy | None = None,
+    ) -> dict[str, float]:
         keys = self._k(tenant_id, agent_id, day_key, month_key)
         with self._lock:
             if self._state.get(f"audit:{request_id}") is not None:
                 return self.read_usage(tenant_id, agent_id, day_key, month_key)
+            _enforce_policy(self.read_usage(tenant_id, agent_id, day_key, month_key), tokens, cost, policy)
             self._state[keys[0]] = self._state.get(keys[0], 0.0) + tokens
             self._state[keys[1]] = self._state.get(keys[1], 0.0) + tokens
             self._state[keys[2]] = self._state.get(keys[2], 0.0) + cost
@@ -86,10 +120,43 @@ class InMemoryQuotaStore:
 
 
 class RedisQuotaStore:
-    """Redis-backed durable and atomic quota updates via WATCH/MULTI/EXEC."""
+    """Redis-backed durable quota updates.
+
+    ``atomic_debit`` runs one Lua script that checks the request's audit key,
+    enforces the policy ceilings, applies all four increments and returns the
+    new balances, so a debit is a single round trip with no optimistic retries.
+    """
+
+    AUDIT_TTL_SECONDS = 60 * 60 * 24 * 90
+
+    DEBIT_SCRIPT = """
+local usage = redis.call('MGET', KEYS[1], KEYS[2], KEYS[3], KEYS[4])
+for i = 1, 4 do
+    usage[i] = usage[i] or '0'
+end
+if redis.call('EXISTS', KEYS[5]) == 1 then
+    return {'ok', usage[1], usage[2], usage[3], usage[4]}
+end
+if ARGV[3] == '1' then
+    local names = {'tenant_tokens', 'agent_tokens', 'daily_cost', 'monthly_cost'}
+    local amounts = {ARGV[1], ARGV[1], ARGV[2], ARGV[2]}
+    for i = 1, 4 do
+        if tonumber(usage[i]) + tonumber(amounts[i]) > tonumber(ARGV[3 + i]) then
+            return {'exceeded', names[i]}
+        end
+    end
+end
+usage[1] = redis.call('INCRBYFLOAT', KEYS[1], ARGV[1])
+usage[2] = redis.call('INCRBYFLOAT', KEYS[2], ARGV[1])
+usage[3] = redis.call('INCRBYFLOAT', KEYS[3], ARGV[2])
+usage[4] = redis.call('INCRBYFLOAT', KEYS[4], ARGV[2])
+redis.call('SET', KEYS[5], ARGV[8], 'EX', ARGV[9])
+return {'ok', usage[1], usage[2], usage[3], usage[4]}
+"""
 
     def __init__(self, redis_client: Any) -> None:
         self.redis = redis_client
+        self._debit_script = redis_client.register_script(self.DEBIT_SCRIPT)
 
     def _k(self, tenant_id: str, agent_id: str, day_key: str, month_key: str) -> list[str]:
         return [
@@ -109,27 +176,48 @@ class RedisQuotaStore:
             "monthly_cost": float(values[3] or 0),
         }
 
-    def atomic_debit(self, tenant_id: str, agent_id: str, day_key: str, month_key: str, tokens: int, cost: float, request_id: str) -> dict[str, float]:
+    def atomic_debit(
+        self,
+        tenant_id: str,
+        agent_id: str,
+        day_key: str,
+        month_key: str,
+        tokens: int,
+        cost: float,
+        request_id: str,
+        policy: QuotaPolicy | None = None,
+    ) -> dict[str, float]:
         keys = self._k(tenant_id, agent_id, day_key, month_key)
-        audit_key = f"quota:audit:{request_id}"
-        with self.redis.pipeline() as pipe:
-            while True:
-                try:
-                    pipe.watch(*keys, audit_key)
-                    if pipe.get(audit_key):
-                        pipe.unwatch()
-                        return self.read_usage(tenant_id, agent_id, day_key, month_key)
-                    pipe.multi()
-                    pipe.incrbyfloat(keys[0], float(tokens))
-                    pipe.incrbyfloat(keys[1], float(tokens))
-                    pipe.incrbyfloat(keys[2], float(cost))
-                    pipe.incrbyfloat(keys[3], float(cost))
-                    pipe.set(audit_key, json.dumps({"tenant_id": tenant_id, "agent_id": agent_id, "tokens": tokens, "cost": cost, "ts": time.time()}), ex=60 * 60 * 24 * 90)
-                    pipe.execute()
-                    break
-                except Exception:
-                    continue
-        return self.read_usage(tenant_id, agent_id, day_key, month_key)
+        audit_record = json.dumps({"tenant_id": tenant_id, "agent_id": agent_id, "tokens": tokens, "cost": cost, "ts": time.time()})
+        ceilings = (
+            [policy.tenant_token_quota, policy.agent_token_quota, policy.daily_cost_ceiling, policy.monthly_cost_ceiling]
+            if policy is not None
+            else [0, 0, 0, 0]
+        )
+        result = self._debit_script(
+            keys=[*keys, f"quota:audit:{request_id}"],
+            args=[
+                repr(float(tokens)),
+                repr(float(cost)),
+                "1" if policy is not None else "0",
+                *(repr(float(ceiling)) for ceiling in ceilings),
+                audit_record,
+                self.AUDIT_TTL_SECONDS,
+            ],
+        )
+        status = _decode(result[0])
+        if status == "exceeded":
+            raise QuotaExceededError(_EXCEEDED_MESSAGES[_decode(result[1])])
+        return {
+            "tenant_tokens": float(result[1]),
+            "agent_tokens": float(result[2]),
+            "daily_cost": float(result[3]),
+            "monthly_cost": float(result[4]),
+        }
+
+
+def _decode(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
 
 
 class PostgresQuotaStore:
@@ -183,7 +271,17 @@ class PostgresQuotaStore:
             "monthly_cost": self._get("monthly_cost", f"{tenant_id}:{month_key}"),
         }
 
-    def atomic_debit(self, tenant_id: str, agent_id: str, day_key: str, month_key: str, tokens: int, cost: float, request_id: str) -> dict[str, float]:
+    def atomic_debit(
+        self,
+        tenant_id: str,
+        agent_id: str,
+        day_key: str,
+        month_key: str,
+        tokens: int,
+        cost: float,
+        request_id: str,
+        policy: QuotaPolicy | None = None,
+    ) -> dict[str, float]:
         self._ensure_schema()
         self.conn.autocommit = False
         with self.conn:
@@ -191,6 +289,7 @@ class PostgresQuotaStore:
                 cur.execute("SELECT request_id FROM quota_audit WHERE request_id=%s", (request_id,))
                 if cur.fetchone() is not None:
                     return self.read_usage(tenant_id, agent_id, day_key, month_key)
+            _enforce_policy(self.read_usage(tenant_id, agent_id, day_key, month_key), tokens, cost, policy)
             self._upsert_increment("tenant_tokens", tenant_id, float(tokens))
             self._upsert_increment("agent_tokens", f"{tenant_id}:{agent_id}", float(tokens))
             self._upsert_increment("daily_cost", f"{tenant_id}:{day_key}", float(cost))
@@ -204,11 +303,26 @@ class PostgresQuotaStore:
 
 
 class DurableQuotaLedger:
+    """Enforces quota policies by delegating checked debits to a ``QuotaStore``.
+
+    Each store checks the ceilings and debits in one atomic step. The ledger
+    additionally serializes debits per tenant, so contention on one tenant
+    never blocks another.
+    """
+
     def __init__(self, store: QuotaStore, *, policies: dict[str, QuotaPolicy] | None = None, default_policy: QuotaPolicy | None = None) -> None:
         self.store = store
         self.policies = policies or {}
         self.default_policy = default_policy or QuotaPolicy(tenant_token_quota=1_000_000, agent_token_quota=250_000, daily_cost_ceiling=1000.0, monthly_cost_ceiling=20_000.0)
-        self._lock = threading.Lock()
+        self._tenant_locks: dict[str, threading.Lock] = {}
+        self._tenant_locks_guard = threading.Lock()
+
+    def _tenant_lock(self, tenant_id: str) -> threading.Lock:
+        lock = self._tenant_locks.get(tenant_id)
+        if lock is None:
+            with self._tenant_locks_guard:
+                lock = self._tenant_locks.setdefault(tenant_id, threading.Lock())
+        return lock
 
     def _time_keys(self, now: float | None = None) -> tuple[str, str]:
         dt = datetime.fromtimestamp(now or time.time(), tz=UTC)
@@ -220,16 +334,7 @@ class DurableQuotaLedger:
     def debit(self, debit: QuotaDebit) -> dict[str, float]:
         day_key, month_key = self._time_keys(debit.timestamp)
         policy = self.policy_for(debit.tenant_id)
-        with self._lock:
-            current = self.store.read_usage(debit.tenant_id, debit.agent_id, day_key, month_key)
-            if current["tenant_tokens"] + debit.tokens > policy.tenant_token_quota:
-                raise QuotaExceededError("tenant token quota exceeded")
-            if current["agent_tokens"] + debit.tokens > policy.agent_token_quota:
-                raise QuotaExceededError("agent token quota exceeded")
-            if current["daily_cost"] + debit.cost > policy.daily_cost_ceiling:
-                raise QuotaExceededError("daily cost ceiling exceeded")
-            if current["monthly_cost"] + debit.cost > policy.monthly_cost_ceiling:
-                raise QuotaExceededError("monthly cost ceiling exceeded")
+        with self._tenant_lock(debit.tenant_id):
             return self.store.atomic_debit(
                 debit.tenant_id,
                 debit.agent_id,
@@ -238,4 +343,5 @@ class DurableQuotaLedger:
                 debit.tokens,
                 debit.cost,
                 debit.request_id,
+                policy=policy,
             )
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import random
 import time
 from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any, Awaitable, Callable
 
 from monitoring.structured_logging import log_event
 from monitoring.tracing import get_tracer
@@ -88,49 +89,79 @@ class RetryEngine:
             try:
                 return func(*args, **kwargs)
             except Exception as exc:  # noqa: BLE001
-                classification = self.classify_failure(operation, exc, context=context_fields)
-                trace_context = self._tracer.current_context()
-                log_event(
-                    self._logger,
-                    component="retry_engine",
-                    event="retry_attempt_failed",
-                    severity="warning",
-                    operation=operation,
-                    attempt=attempt,
-                    max_retries=policy.max_retries,
-                    classification=classification,
-                    error=str(exc),
-                    trace_id=trace_context.trace_id if trace_context else None,
-                    span_id=trace_context.span_id if trace_context else None,
-                    **context_fields,
-                )
-                if classification == PERMANENT or attempt > policy.max_retries:
-                    log_event(
-                        self._logger,
-                        component="retry_engine",
-                        event="retry_exhausted",
-                        severity="error",
-                        operation=operation,
-                        attempt=attempt,
-                        classification=classification,
-                        error=str(exc),
-                        **context_fields,
-                    )
-                    raise
-                delay = self.compute_delay(operation, attempt)
-                log_event(
-                    self._logger,
-                    component="retry_engine",
-                    event="retry_scheduled",
-                    severity="info",
-                    operation=operation,
-                    attempt=attempt,
-                    delay_seconds=round(delay, 3),
-                    classification=classification,
-                    **context_fields,
-                )
+                delay = self._handle_failure(operation, policy, attempt, exc, context_fields)
                 self._sleep_fn(delay)
 
+    async def execute_async(
+        self,
+        operation: str,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        context: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Awaits ``func`` under the same policy as ``execute``, backing off with ``asyncio.sleep``."""
+        policy = self.get_policy(operation)
+        context_fields = dict(context or {})
+        for attempt in range(1, policy.max_retries + 2):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as exc:  # noqa: BLE001
+                delay = self._handle_failure(operation, policy, attempt, exc, context_fields)
+                await asyncio.sleep(delay)
+
+    def _handle_failure(
+        self,
+        operation: str,
+        policy: RetryPolicy,
+        attempt: int,
+        exc: Exception,
+        context_fields: dict[str, Any],
+    ) -> float:
+        """Logs a failed attempt and returns the backoff delay, or re-raises when retries are exhausted."""
+        classification = self.classify_failure(operation, exc, context=context_fields)
+        trace_context = self._tracer.current_context()
+        log_event(
+            self._logger,
+            component="retry_engine",
+            event="retry_attempt_failed",
+            severity="warning",
+            operation=operation,
+            attempt=attempt,
+            max_retries=policy.max_retries,
+            classification=classification,
+            error=str(exc),
+            trace_id=trace_context.trace_id if trace_context else None,
+            span_id=trace_context.span_id if trace_context else None,
+            **context_fields,
+        )
+        if classification == PERMANENT or attempt > policy.max_retries:
+            log_event(
+                self._logger,
+                component="retry_engine",
+                event="retry_exhausted",
+                severity="error",
+                operation=operation,
+                attempt=attempt,
+                classification=classification,
+                error=str(exc),
+                **context_fields,
+            )
+            raise exc
+        delay = self.compute_delay(operation, attempt)
+        log_event(
+            self._logger,
+            component="retry_engine",
+            event="retry_scheduled",
+            severity="info",
+            operation=operation,
+            attempt=attempt,
+            delay_seconds=round(delay, 3),
+            classification=classification,
+            **context_fields,
+        )
+        return delay
+
 
 def get_default_retry_engine() -> RetryEngine:
     return RetryEngine(
@@ -145,6 +145,7 @@ class RuntimePipeline:
             action.handler,
             *action.args,
             policy=action.sandbox_policy or SandboxPolicy(),
+            tenant_id=action.tenant_id,
             **action.kwargs,
         )
         if not sandbox_result.ok:
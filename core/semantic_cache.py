@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 import hashlib
+import heapq
+import itertools
 import math
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from typing import Any, Callable, Protocol
 
 from monitoring.runtime_metrics import runtime_metrics
 
@@ -16,13 +22,11 @@ def _default_embedding(text: str) -> list[float]:
     return [byte / 255.0 for byte in digest[:32]]
 
 
-def _cosine_similarity(left: list[float], right: list[float]) -> float:
-    numerator = sum(a * b for a, b in zip(left, right))
-    left_norm = math.sqrt(sum(a * a for a in left))
-    right_norm = math.sqrt(sum(b * b for b in right))
-    if not left_norm or not right_norm:
-        return 0.0
-    return numerator / (left_norm * right_norm)
+def _normalize(vector: list[float]) -> list[float]:
+    norm = math.sqrt(sum(value * value for value in vector))
+    if not norm:
+        return [0.0 for _ in vector]
+    return [value / norm for value in vector]
 
 
 @dataclass(slots=True)
@@ -32,41 +36,229 @@ class SemanticCacheEntry:
     embedding: list[float]
     tenant_id: str = "default"
     model: str = "default"
+    expires_at: float | None = None
+
+
+class SemanticIndex(Protocol):
+    """Nearest-neighbour index over unit vectors keyed by integer entry ids."""
+
+    def add(self, key: int, vector: list[float]) -> None: ...
+
+    def remove(self, key: int) -> None: ...
+
+    def best_match(self, vector: list[float]) -> tuple[int, float] | None: ...
+
+    def top_k(self, vector: list[float], k: int) -> list[tuple[int, float]]: ...
+
+    def __len__(self) -> int: ...
+
+
+class PythonSemanticIndex:
+    """Dependency-free index storing pre-normalized vectors, so scoring is a plain dot product."""
+
+    def __init__(self) -> None:
+        self._vectors: dict[int, list[float]] = {}
+
+    def add(self, key: int, vector: list[float]) -> None:
+        self._vectors[key] = _normalize(vector)
+
+    def remove(self, key: int) -> None:
+        self._vectors.pop(key, None)
+
+    def best_match(self, vector: list[float]) -> tuple[int, float] | None:
+        query = _normalize(vector)
+        best: tuple[int, float] | None = None
+        for key, candidate in self._vectors.items():
+            score = sum(a * b for a, b in zip(query, candidate))
+            if best is None or score > best[1]:
+                best = (key, score)
+        return best
+
+    def top_k(self, vector: list[float], k: int) -> list[tuple[int, float]]:
+        query = _normalize(vector)
+        scored = ((key, sum(a * b for a, b in zip(query, candidate))) for key, candidate in self._vectors.items())
+        return heapq.nlargest(k, scored, key=lambda item: item[1])
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+
+class NumpySemanticIndex:
+    """Contiguous float32 matrix of unit vectors scored with one batched matrix-vector product.
+
+    Removal swaps the last row into the freed slot, so live rows always stay
+    packed at the front of the matrix.
+    """
+
+    def __init__(self, initial_capacity: int = 256) -> None:
+        try:
+            import numpy as np
+        except ModuleNotFoundError as exc:  # pragma: no cover - runtime dependency check
+            raise RuntimeError("numpy package is required for NumpySemanticIndex") from exc
+        self._np = np
+        self._matrix: Any = None
+        self._initial_capacity = max(1, initial_capacity)
+        self._row_by_key: dict[int, int] = {}
+        self._key_by_row: list[int] = []
+
+    def add(self, key: int, vector: list[float]) -> None:
+        np = self._np
+        row_vector = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(row_vector))
+        if norm:
+            row_vector = row_vector / norm
+        if key in self._row_by_key:
+            self._matrix[self._row_by_key[key]] = row_vector
+            return
+        size = len(self._key_by_row)
+        if self._matrix is None:
+            self._matrix = np.zeros((self._initial_capacity, row_vector.shape[0]), dtype=np.float32)
+        elif size == self._matrix.shape[0]:
+            grown = np.zeros((size * 2, self._matrix.shape[1]), dtype=np.float32)
+            grown[:size] = self._matrix
+            self._matrix = grown
+        self._matrix[size] = row_vector
+        self._row_by_key[key] = size
+        self._key_by_row.append(key)
+
+    def remove(self, key: int) -> None:
+        row = self._row_by_key.pop(key, None)
+        if row is None:
+            return
+        last_row = len(self._key_by_row) - 1
+        last_key = self._key_by_row.pop()
+        if row != last_row:
+            self._matrix[row] = self._matrix[last_row]
+            self._key_by_row[row] = last_key
+            self._row_by_key[last_key] = row
+
+    def best_match(self, vector: list[float]) -> tuple[int, float] | None:
+        size = len(self._key_by_row)
+        if not size:
+            return None
+        np = self._np
+        query = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if not norm:
+            return None
+        scores = self._matrix[:size] @ (query / norm)
+        row = int(np.argmax(scores))
+        return self._key_by_row[row], float(scores[row])
+
+    def top_k(self, vector: list[float], k: int) -> list[tuple[int, float]]:
+        size = len(self._key_by_row)
+        if not size or k <= 0:
+            return []
+        np = self._np
+        query = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm:
+            query = query / norm
+        scores = self._matrix[:size] @ query
+        if k < size:
+            rows = np.argpartition(-scores, k - 1)[:k]
+        else:
+            rows = np.arange(size)
+        rows = rows[np.argsort(-scores[rows])]
+        return [(self._key_by_row[int(row)], float(scores[row])) for row in rows]
+
+    def __len__(self) -> int:
+        return len(self._key_by_row)
+
+
+def default_index_factory() -> SemanticIndex:
+    """Uses the NumPy index when numpy is installed, otherwise the pure-Python one."""
+
+    try:
+        return NumpySemanticIndex()
+    except RuntimeError:
+        return PythonSemanticIndex()
 
 
 class SemanticLLMCache:
-    """Stores prompt/response pairs and reuses responses by similarity."""
+    """Stores prompt/response pairs and reuses responses by similarity.
+
+    Entries live in per-(tenant, model) partitions, each with its own vector
+    index, so a lookup only scores candidates it is allowed to return. A
+    global ``OrderedDict`` gives O(1) LRU eviction across partitions, and
+    ``ttl_seconds`` expires entries lazily on lookup. Lookups and stores are
+    serialized by a lock so a background writer can share the cache.
+    """
 
-    def __init__(self, similarity_threshold: float = 0.92, max_entries: int = 2_000) -> None:
+    def __init__(
+        self,
+        similarity_threshold: float = 0.92,
+        max_entries: int = 2_000,
+        *,
+        ttl_seconds: float | None = None,
+        index_factory: Callable[[], SemanticIndex] | None = None,
+        time_fn: Callable[[], float] | None = None,
+    ) -> None:
         self.similarity_threshold = similarity_threshold
         self.max_entries = max_entries
-        self._entries: list[SemanticCacheEntry] = []
+        self.ttl_seconds = ttl_seconds
+        self._index_factory = index_factory or default_index_factory
+        self.time_fn = time_fn or time.monotonic
+        self._partitions: dict[tuple[str, str], SemanticIndex] = {}
+        self._entries: OrderedDict[int, SemanticCacheEntry] = OrderedDict()
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
 
     def lookup(self, prompt: str, embedding: list[float] | None = None, *, tenant_id: str = "default", model: str = "default") -> str | None:
         vector = embedding or _default_embedding(prompt)
-        best_score = 0.0
-        best_response: str | None = None
+        with self._lock:
+            return self._lookup(vector, tenant_id=tenant_id, model=model)
 
-        for entry in self._entries:
-            if entry.tenant_id != tenant_id or entry.model != model:
+    def _lookup(self, vector: list[float], *, tenant_id: str, model: str) -> str | None:
+        index = self._partitions.get((tenant_id, model))
+        now = self.time_fn()
+        while index is not None:
+            match = index.best_match(vector)
+            if match is None:
+                break
+            entry_id, score = match
+            entry = self._entries[entry_id]
+            if entry.expires_at is not None and entry.expires_at <= now:
+                self._evict(entry_id)
+                runtime_metrics.inc("semantic_cache.expired")
                 continue
-            score = _cosine_similarity(vector, entry.embedding)
-            if score > best_score:
-                best_score = score
-                best_response = entry.response
-
-        if best_score >= self.similarity_threshold:
-            runtime_metrics.inc("semantic_cache.hit")
-            return best_response
+            if score >= self.similarity_threshold:
+                self._entries.move_to_end(entry_id)
+                runtime_metrics.inc("semantic_cache.hit")
+                return entry.response
+            break
         runtime_metrics.inc("semantic_cache.miss")
         return None
 
     def store(self, prompt: str, response: str, embedding: list[float] | None = None, *, tenant_id: str = "default", model: str = "default") -> None:
         vector = embedding or _default_embedding(prompt)
-        self._entries.append(SemanticCacheEntry(prompt=prompt, response=response, embedding=vector, tenant_id=tenant_id, model=model))
-        if len(self._entries) > self.max_entries:
-            self._entries.pop(0)
-        runtime_metrics.set_gauge("semantic_cache.size", float(len(self._entries)))
+        with self._lock:
+            expires_at = self.time_fn() + self.ttl_seconds if self.ttl_seconds is not None else None
+            entry_id = next(self._ids)
+            self._entries[entry_id] = SemanticCacheEntry(
+                prompt=prompt,
+                response=response,
+                embedding=vector,
+                tenant_id=tenant_id,
+                model=model,
+                expires_at=expires_at,
+            )
+            partition = self._partitions.get((tenant_id, model))
+            if partition is None:
+                partition = self._partitions[(tenant_id, model)] = self._index_factory()
+            partition.add(entry_id, vector)
+            while len(self._entries) > self.max_entries:
+                self._evict(next(iter(self._entries)))
+            size = len(self._entries)
+        runtime_metrics.set_gauge("semantic_cache.size", float(size))
 
     def size(self) -> int:
         return len(self._entries)
+
+    def _evict(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id)
+        key = (entry.tenant_id, entry.model)
+        partition = self._partitions[key]
+        partition.remove(entry_id)
+        if not len(partition):
+            del self._partitions[key]
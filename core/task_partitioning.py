@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Callable
 
 from core.task_queue import DistributedTaskQueue, QueueTask
+from monitoring.runtime_metrics import runtime_metrics
 from security.tenant_context import require_tenant_context
 
 
@@ -21,19 +23,41 @@ class TaskPartition:
 
 
 class PartitionedTaskQueue:
-    """Thin wrapper around DistributedTaskQueue with deterministic partition routing."""
+    """Routes tasks into one sub-queue per partition on the wrapped queue's backend.
 
-    def __init__(self, queue: DistributedTaskQueue, *, enforce_tenant_context: bool = False) -> None:
+    Workers claim from the sub-queues they subscribe to, so a dequeue never
+    touches other partitions' tasks. With ``work_stealing`` enabled, a worker
+    whose partitions are empty takes from the deepest partition known to this
+    process instead.
+    """
+
+    def __init__(
+        self,
+        queue: DistributedTaskQueue,
+        *,
+        enforce_tenant_context: bool = False,
+        work_stealing: bool = True,
+        queue_factory: Callable[[str], DistributedTaskQueue] | None = None,
+    ) -> None:
         self.queue = queue
         self.enforce_tenant_context = enforce_tenant_context
+        self.work_stealing = work_stealing
+        self._queue_factory = queue_factory or self._default_partition_queue
         self._tenant_weights: dict[str, int] = {}
         self._worker_affinity: dict[str, set[str]] = {}
+        self._partition_queues: dict[str, DistributedTaskQueue] = {}
 
     def partition_for(self, task: QueueTask) -> TaskPartition:
         tenant_id = str(task.metadata.get("tenant_id", "default"))
         goal_id = str(task.metadata.get("goal_id", "general"))
         return TaskPartition(tenant_id=tenant_id, goal_id=goal_id, priority=task.priority)
 
+    def partition_queue(self, partition_key: str) -> DistributedTaskQueue:
+        queue = self._partition_queues.get(partition_key)
+        if queue is None:
+            queue = self._partition_queues[partition_key] = self._queue_factory(partition_key)
+        return queue
+
     def enqueue(self, task: QueueTask) -> QueueTask:
         require_tenant_context(strict=self.enforce_tenant_context)
         partition = self.partition_for(task)
@@ -41,7 +65,7 @@ class PartitionedTaskQueue:
         tenant_weight = self._tenant_weights.get(partition.tenant_id, 1)
         adjusted_priority = max(1, int(task.priority / max(1, tenant_weight)))
         task.priority = adjusted_priority
-        return self.queue.enqueue_task(task)
+        return self.partition_queue(partition.key).enqueue_task(task)
 
     def set_tenant_weight(self, tenant_id: str, weight: int) -> None:
         self._tenant_weights[tenant_id] = max(1, weight)
@@ -53,14 +77,63 @@ class PartitionedTaskQueue:
         return self._worker_affinity.get(worker_id, default_subscriptions)
 
     def dequeue_for_worker(self, subscriptions: set[str], timeout_seconds: int = 1) -> QueueTask | None:
-        # Simple selective consume loop; tasks outside subscription are re-queued.
-        for _ in range(max(1, len(subscriptions) * 2)):
-            task = self.queue.dequeue_task(timeout_seconds=timeout_seconds)
-            if task is None:
-                return None
-            partition = str(task.metadata.get("partition", ""))
-            if partition in subscriptions:
-                return task
-            self.queue.enqueue_task(task)
-            self.queue.acknowledge_task(task)
+        """Claims from the subscribed partitions, then steals, then blocks on the first subscription."""
+        ordered = sorted(subscriptions)
+        for partition_key in ordered:
+            claimed = self.partition_queue(partition_key).dequeue_many(1)
+            if claimed:
+                return claimed[0]
+        if self.work_stealing:
+            stolen = self._steal(subscriptions)
+            if stolen is not None:
+                return stolen
+        if ordered and timeout_seconds > 0:
+            return self.partition_queue(ordered[0]).dequeue_task(timeout_seconds=timeout_seconds)
         return None
+
+    def acknowledge_task(self, task: QueueTask) -> None:
+        self._queue_for_task(task).acknowledge_task(task)
+
+    def fail_task(self, task: QueueTask, *, error: str, exc: BaseException | None = None) -> None:
+        self._queue_for_task(task).fail_task(task, error=error, exc=exc)
+
+    def queue_size(self) -> int:
+        return sum(queue.queue_size() for queue in self._partition_queues.values())
+
+    def _steal(self, subscriptions: set[str]) -> QueueTask | None:
+        candidates = [
+            (queue.ready_size(), key)
+            for key, queue in self._partition_queues.items()
+            if key not in subscriptions
+        ]
+        for depth, key in sorted(candidates, reverse=True):
+            if depth <= 0:
+                break
+            claimed = self._partition_queues[key].dequeue_many(1)
+            if claimed:
+                runtime_metrics.inc("queue.partition.stolen")
+                return claimed[0]
+        return None
+
+    def _queue_for_task(self, task: QueueTask) -> DistributedTaskQueue:
+        partition_key = task.metadata.get("partition")
+        return self.partition_queue(str(partition_key)) if partition_key else self.queue
+
+    def _default_partition_queue(self, partition_key: str) -> DistributedTaskQueue:
+        base = self.queue
+        return DistributedTaskQueue(
+            base.backend,
+            queue_name=f"{base.queue_name}:partition:{partition_key}",
+            queue_high_watermark=base.queue_high_watermark,
+            queue_low_watermark=base.queue_low_watermark,
+            max_retries=base.max_retries,
+            visibility_timeout_seconds=base.visibility_timeout_seconds,
+            max_inflight_tasks=base.max_inflight_tasks,
+            tenant_queue_limits=base.tenant_queue_limits,
+            tenant_priority_boost=base.tenant_priority_boost,
+            max_tasks_per_dequeue_cycle=base.max_tasks_per_dequeue_cycle,
+            retry_engine=base.retry_engine,
+            enforce_tenant_context=base.enforce_tenant_context,
+            delayed_promotion_batch_size=base.delayed_promotion_batch_size,
+            time_fn=base.time_fn,
+        )
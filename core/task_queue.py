@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import threading
 import time
 import uuid
 from dataclasses import dataclass, field
-from typing import Any, Protocol
+from heapq import heappop, heappush
+from typing import Any, Callable, Protocol
 
 from core.retry_engine import PERMANENT, RetryEngine, get_default_retry_engine
 from monitoring.runtime_metrics import runtime_metrics
@@ -55,7 +58,7 @@ class QueueTask:
 
 
 class QueueBackend(Protocol):
-    def push(self, queue_name: str, item: str) -> None: ...
+    def push(self, queue_name: str, item: str, priority: int = 50) -> None: ...
 
     def pop(self, queue_name: str, timeout_seconds: int = 1) -> str | None: ...
 
@@ -63,6 +66,20 @@ class QueueBackend(Protocol):
 
     def length(self, queue_name: str) -> int: ...
 
+    def push_many(self, queue_name: str, items: list[str], priorities: list[int] | None = None) -> None: ...
+
+    def pop_many(self, queue_name: str, count: int) -> list[str]: ...
+
+    def ack_many(self, processing_queue_name: str, items: list[str]) -> None: ...
+
+    def push_delayed(self, delayed_queue_name: str, item: str, eligible_at: float) -> None: ...
+
+    def push_delayed_many(self, delayed_queue_name: str, items: dict[str, float]) -> None: ...
+
+    def promote_due(self, delayed_queue_name: str, queue_name: str, now: float, limit: int = 100) -> int: ...
+
+    def delayed_length(self, delayed_queue_name: str) -> int: ...
+
 
 class InMemoryQueueBackend:
     """Simple fallback backend for local/dev use."""
@@ -71,13 +88,15 @@ class InMemoryQueueBackend:
         from collections import deque
 
         self._queues: dict[str, deque[str]] = {}
+        self._delayed: dict[str, list[tuple[float, int, str]]] = {}
+        self._delayed_sequence = 0
 
     def _get(self, queue_name: str):
         from collections import deque
 
         return self._queues.setdefault(queue_name, deque())
 
-    def push(self, queue_name: str, item: str) -> None:
+    def push(self, queue_name: str, item: str, priority: int = 50) -> None:
         self._get(queue_name).append(item)
 
     def pop(self, queue_name: str, timeout_seconds: int = 1) -> str | None:
@@ -96,12 +115,78 @@ class InMemoryQueueBackend:
     def length(self, queue_name: str) -> int:
         return len(self._get(queue_name))
 
+    def push_many(self, queue_name: str, items: list[str], priorities: list[int] | None = None) -> None:
+        self._get(queue_name).extend(items)
 
-class RedisQueueBackend:
-    """Redis backend using BRPOPLPUSH semantics for at-least-once delivery."""
+    def pop_many(self, queue_name: str, count: int) -> list[str]:
+        queue = self._get(queue_name)
+        return [queue.popleft() for _ in range(min(count, len(queue)))]
+
+    def ack_many(self, processing_queue_name: str, items: list[str]) -> None:
+        for item in items:
+            self.ack(processing_queue_name, item)
+
+    def push_delayed(self, delayed_queue_name: str, item: str, eligible_at: float) -> None:
+        self.push_delayed_many(delayed_queue_name, {item: eligible_at})
+
+    def push_delayed_many(self, delayed_queue_name: str, items: dict[str, float]) -> None:
+        heap = self._delayed.setdefault(delayed_queue_name, [])
+        for item, eligible_at in items.items():
+            self._delayed_sequence += 1
+            heappush(heap, (eligible_at, self._delayed_sequence, item))
+
+    def promote_due(self, delayed_queue_name: str, queue_name: str, now: float, limit: int = 100) -> int:
+        heap = self._delayed.get(delayed_queue_name)
+        promoted = 0
+        while heap and heap[0][0] <= now and promoted < limit:
+            _, _, item = heappop(heap)
+            self.push(queue_name, item)
+            promoted += 1
+        return promoted
+
+    def delayed_length(self, delayed_queue_name: str) -> int:
+        return len(self._delayed.get(delayed_queue_name, ()))
+
+
+class _RedisDelayedTaskStore:
+    """Delayed-task sorted set scored by eligible-at time, shared by the Redis backends.
+
+    Subclasses provide ``PROMOTE_DUE_SCRIPT``, a Lua script that moves due
+    items into the ready queue in one server-side step so a crash can never
+    drop a task between the delayed set and the ready queue.
+    """
+
+    PROMOTE_DUE_SCRIPT: str
 
     def __init__(self, redis_client: Any) -> None:
         self.redis = redis_client
+        self._promote_due_script = redis_client.register_script(self.PROMOTE_DUE_SCRIPT)
+
+    def push_delayed(self, delayed_queue_name: str, item: str, eligible_at: float) -> None:
+        self.redis.zadd(delayed_queue_name, {item: eligible_at})
+
+    def push_delayed_many(self, delayed_queue_name: str, items: dict[str, float]) -> None:
+        if items:
+            self.redis.zadd(delayed_queue_name, items)
+
+    def promote_due(self, delayed_queue_name: str, queue_name: str, now: float, limit: int = 100) -> int:
+        return int(self._promote_due_script(keys=[delayed_queue_name, queue_name], args=[now, limit]))
+
+    def delayed_length(self, delayed_queue_name: str) -> int:
+        return int(self.redis.zcard(delayed_queue_name))
+
+
+class RedisQueueBackend(_RedisDelayedTaskStore):
+    """Redis backend using BRPOPLPUSH semantics for at-least-once delivery."""
+
+    PROMOTE_DUE_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+for _, item in ipairs(due) do
+    redis.call('ZREM', KEYS[1], item)
+    redis.call('LPUSH', KEYS[2], item)
+end
+return #due
+"""
 
     @classmethod
     def from_url(cls, redis_url: str) -> "RedisQueueBackend":
@@ -111,7 +196,7 @@ class RedisQueueBackend:
             raise RuntimeError("redis package is required for RedisQueueBackend") from exc
         return cls(redis.Redis.from_url(redis_url, decode_responses=True))
 
-    def push(self, queue_name: str, item: str) -> None:
+    def push(self, queue_name: str, item: str, priority: int = 50) -> None:
         self.redis.lpush(queue_name, item)
 
     def pop(self, queue_name: str, timeout_seconds: int = 1) -> str | None:
@@ -124,6 +209,124 @@ class RedisQueueBackend:
     def length(self, queue_name: str) -> int:
         return int(self.redis.llen(queue_name))
 
+    def push_many(self, queue_name: str, items: list[str], priorities: list[int] | None = None) -> None:
+        if items:
+            self.redis.lpush(queue_name, *items)
+
+    def pop_many(self, queue_name: str, count: int) -> list[str]:
+        processing = f"{queue_name}:processing"
+        pipe = self.redis.pipeline(transaction=False)
+        for _ in range(max(0, count)):
+            pipe.rpoplpush(queue_name, processing)
+        return [item for item in pipe.execute() if item is not None]
+
+    def ack_many(self, processing_queue_name: str, items: list[str]) -> None:
+        if not items:
+            return
+        pipe = self.redis.pipeline(transaction=False)
+        for item in items:
+            pipe.lrem(processing_queue_name, 1, item)
+        pipe.execute()
+
+
+class PriorityRedisQueueBackend(_RedisDelayedTaskStore):
+    """Redis backend storing each queue as a sorted set ordered by task priority.
+
+    Scores are exact integers: ``priority * PRIORITY_SCORE_STRIDE`` plus the
+    enqueue time in milliseconds, so lower priorities run first and equal
+    priorities stay FIFO (ties within one millisecond fall back to member
+    order). The stride of 10**13 ms (about 317 years) keeps timestamps inside
+    their band, and ``MAX_PRIORITY`` caps the largest score at roughly 8.0e15,
+    below 2**53 where doubles stop representing every integer. Priorities
+    outside ``0..MAX_PRIORITY`` are rejected rather than clamped.
+
+    Claims run as Lua scripts that pop from the queue and record the item in
+    the ``:processing`` set in one step, matching the at-least-once guarantee
+    of ``RedisQueueBackend``. Redis cannot block inside a script, so ``pop``
+    with a timeout polls the claim script every ``BLOCKING_POLL_INTERVAL_SECONDS``.
+    """
+
+    PRIORITY_SCORE_STRIDE = 10**13
+    MAX_PRIORITY = 800
+    DEFAULT_PRIORITY = 50
+    BLOCKING_POLL_INTERVAL_SECONDS = 0.05
+
+    CLAIM_SCRIPT = """
+local items = redis.call('ZRANGE', KEYS[1], 0, tonumber(ARGV[1]) - 1)
+for _, item in ipairs(items) do
+    redis.call('ZREM', KEYS[1], item)
+    redis.call('ZADD', KEYS[2], ARGV[2], item)
+end
+return items
+"""
+
+    PROMOTE_DUE_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+local enqueued_ms = math.floor(tonumber(ARGV[1]) * 1000)
+for _, item in ipairs(due) do
+    local ok, task = pcall(cjson.decode, item)
+    local priority = 50
+    if ok and type(task) == 'table' and tonumber(task['priority']) then
+        priority = tonumber(task['priority'])
+    end
+    redis.call('ZREM', KEYS[1], item)
+    redis.call('ZADD', KEYS[2], string.format('%.0f', priority * 1e13 + enqueued_ms), item)
+end
+return #due
+"""
+
+    def __init__(self, redis_client: Any) -> None:
+        super().__init__(redis_client)
+        self._claim_script = redis_client.register_script(self.CLAIM_SCRIPT)
+
+    @classmethod
+    def from_url(cls, redis_url: str) -> "PriorityRedisQueueBackend":
+        try:
+            import redis
+        except ModuleNotFoundError as exc:  # pragma: no cover - runtime dependency check
+            raise RuntimeError("redis package is required for PriorityRedisQueueBackend") from exc
+        return cls(redis.Redis.from_url(redis_url, decode_responses=True))
+
+    def score_for(self, priority: int) -> int:
+        if not 0 <= priority <= self.MAX_PRIORITY:
+            raise ValueError(f"priority must be between 0 and {self.MAX_PRIORITY}, got {priority}")
+        return priority * self.PRIORITY_SCORE_STRIDE + int(time.time() * 1000)
+
+    def push(self, queue_name: str, item: str, priority: int = DEFAULT_PRIORITY) -> None:
+        self.redis.zadd(queue_name, {item: self.score_for(priority)})
+
+    def pop(self, queue_name: str, timeout_seconds: int = 1) -> str | None:
+        deadline = time.monotonic() + max(0, timeout_seconds)
+        while True:
+            items = self.pop_many(queue_name, 1)
+            if items:
+                return items[0]
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(self.BLOCKING_POLL_INTERVAL_SECONDS)
+
+    def ack(self, processing_queue_name: str, item: str) -> None:
+        self.redis.zrem(processing_queue_name, item)
+
+    def length(self, queue_name: str) -> int:
+        return int(self.redis.zcard(queue_name))
+
+    def push_many(self, queue_name: str, items: list[str], priorities: list[int] | None = None) -> None:
+        if not items:
+            return
+        priorities = priorities or [self.DEFAULT_PRIORITY] * len(items)
+        self.redis.zadd(queue_name, {item: self.score_for(priority) for item, priority in zip(items, priorities)})
+
+    def pop_many(self, queue_name: str, count: int) -> list[str]:
+        if count <= 0:
+            return []
+        items = self._claim_script(keys=[queue_name, f"{queue_name}:processing"], args=[count, time.time()])
+        return list(items or [])
+
+    def ack_many(self, processing_queue_name: str, items: list[str]) -> None:
+        if items:
+            self.redis.zrem(processing_queue_name, *items)
+
 
 class DistributedTaskQueue:
     """Distributed task queue that decouples planning from execution."""
@@ -143,6 +346,8 @@ class DistributedTaskQueue:
         max_tasks_per_dequeue_cycle: int = 1000,
         retry_engine: RetryEngine | None = None,
         enforce_tenant_context: bool = False,
+        delayed_promotion_batch_size: int = 100,
+        time_fn: Callable[[], float] | None = None,
     ) -> None:
         if queue_high_watermark <= 0:
             raise ValueError("queue_high_watermark must be positive")
@@ -162,12 +367,17 @@ class DistributedTaskQueue:
         self.tenant_priority_boost = tenant_priority_boost or {}
         self.max_tasks_per_dequeue_cycle = max(1, max_tasks_per_dequeue_cycle)
         self._inflight: dict[str, tuple[QueueTask, float]] = {}
+        # dequeue_task_async runs dequeue_task in a worker thread while acks and
+        # failures happen on the event loop, so every _inflight access takes this lock.
+        self._inflight_lock = threading.Lock()
         self._tenant_queued_counts: dict[str, int] = {}
         self._tenant_dequeue_streak: dict[str, int] = {}
         self._last_dequeued_tenant: str | None = None
         self._logger = logging.getLogger(__name__)
         self.retry_engine = retry_engine or get_default_retry_engine()
         self.enforce_tenant_context = enforce_tenant_context
+        self.delayed_promotion_batch_size = max(1, delayed_promotion_batch_size)
+        self.time_fn = time_fn or time.time
 
     @property
     def processing_queue_name(self) -> str:
@@ -177,71 +387,133 @@ class DistributedTaskQueue:
     def dead_letter_queue_name(self) -> str:
         return f"{self.queue_name}:dlq"
 
-    def enqueue_task(self, task: QueueTask | dict[str, Any]) -> QueueTask:
-        enforce_context_in_metadata(task.get("metadata", {}) if isinstance(task, dict) else task.metadata, strict=self.enforce_tenant_context)
-        if isinstance(task, dict):
-            task = QueueTask(
-                task_id=task.get("task_id", f"task-{uuid.uuid4().hex[:12]}"),
-                name=task.get("name", task.get("description", "task")),
-                payload=task.get("payload", {}),
-                priority=int(task.get("priority", 50)),
-                dependencies=list(task.get("dependencies", [])),
-                metadata=task.get("metadata", {}),
-            )
+    @property
+    def delayed_queue_name(self) -> str:
+        return f"{self.queue_name}:delayed"
 
+    def enqueue_task(self, task: QueueTask | dict[str, Any]) -> QueueTask:
+        task = self._admit_for_enqueue(task)
+        self.backend.push(self.queue_name, task.to_json(), priority=task.priority)
         tenant_id = str(task.metadata.get("tenant_id", "default"))
-        priority_boost = self.tenant_priority_boost.get(tenant_id, 0)
-        if priority_boost:
-            task.priority = max(1, task.priority - priority_boost)
-        tenant_limit = self.tenant_queue_limits.get(tenant_id)
-        if tenant_limit is not None and self.tenant_depth(tenant_id) >= tenant_limit:
-            runtime_metrics.inc("queue.tenant_backpressure_rejections")
-            raise OverflowError(f"tenant queue saturation for {tenant_id}")
-
-        if len(self._inflight) >= self.max_inflight_tasks:
-            runtime_metrics.inc("queue.inflight_backpressure_rejections")
-            raise OverflowError("queue inflight saturation")
-
-        self.backend.push(self.queue_name, task.to_json())
         self._tenant_queued_counts[tenant_id] = self._tenant_queued_counts.get(tenant_id, 0) + 1
         runtime_metrics.inc("queue.enqueued")
         self._refresh_pressure_state()
         return task
 
+    def enqueue_many(self, tasks: list[QueueTask | dict[str, Any]]) -> list[QueueTask]:
+        """Enqueue a batch with a single backend call; rejects the whole batch on saturation."""
+        admitted: list[QueueTask] = []
+        batch_counts: dict[str, int] = {}
+        for item in tasks:
+            task = self._admit_for_enqueue(item, pending_tenant_counts=batch_counts)
+            tenant_id = str(task.metadata.get("tenant_id", "default"))
+            batch_counts[tenant_id] = batch_counts.get(tenant_id, 0) + 1
+            admitted.append(task)
+        if not admitted:
+            return []
+        self.backend.push_many(
+            self.queue_name,
+            [task.to_json() for task in admitted],
+            priorities=[task.priority for task in admitted],
+        )
+        for tenant_id, count in batch_counts.items():
+            self._tenant_queued_counts[tenant_id] = self._tenant_queued_counts.get(tenant_id, 0) + count
+        runtime_metrics.inc("queue.enqueued", float(len(admitted)))
+        self._refresh_pressure_state()
+        return admitted
+
     def dequeue_task(self, timeout_seconds: int = 1) -> QueueTask | None:
         self._requeue_expired_inflight()
+        self._promote_due_tasks()
         raw = self.backend.pop(self.queue_name, timeout_seconds=timeout_seconds)
         self._refresh_pressure_state()
         if raw is None:
             runtime_metrics.set_gauge(f"queue.depth.{self.queue_name}", float(self.queue_size()))
             return None
         task = QueueTask.from_json(raw)
-        if not self._is_tenant_eligible(task):
-            self.backend.push(self.queue_name, task.to_json())
+        eligible_at = self._next_attempt_at(task)
+        if eligible_at > self.time_fn():
+            self.backend.push_delayed(self.delayed_queue_name, raw, eligible_at)
             self.backend.ack(self.processing_queue_name, raw)
-            runtime_metrics.inc("queue.tenant_fairness_deferred")
             return None
-        next_attempt_at = float(task.metadata.get("next_attempt_at", 0.0) or 0.0)
-        if next_attempt_at > time.time():
-            self.backend.push(self.queue_name, task.to_json())
+        if not self._is_tenant_eligible(task):
+            self.backend.push(self.queue_name, task.to_json(), priority=task.priority)
             self.backend.ack(self.processing_queue_name, raw)
+            runtime_metrics.inc("queue.tenant_fairness_deferred")
             return None
-        self._inflight[task.task_id] = (task, time.time() + self.visibility_timeout_seconds)
-        tenant_id = str(task.metadata.get("tenant_id", "default"))
-        current = self._tenant_queued_counts.get(tenant_id, 0)
-        self._tenant_queued_counts[tenant_id] = max(0, current - 1)
-        self._record_tenant_dequeue(tenant_id)
+        self._mark_dispatched(task)
         runtime_metrics.inc("queue.dequeued")
         runtime_metrics.set_gauge(f"queue.depth.{self.queue_name}", float(self.queue_size()))
         return task
 
+    async def dequeue_task_async(self, timeout_seconds: int = 1) -> QueueTask | None:
+        """Awaitable ``dequeue_task``; blocking backend pops run in a worker thread."""
+        return await asyncio.to_thread(self.dequeue_task, timeout_seconds)
+
+    def dequeue_many(self, max_tasks: int) -> list[QueueTask]:
+        """Claim up to ``max_tasks`` ready tasks with batched backend calls."""
+        self._requeue_expired_inflight()
+        self._promote_due_tasks()
+        raws = self.backend.pop_many(self.queue_name, max(0, max_tasks))
+        dispatched: list[QueueTask] = []
+        deferred: list[tuple[str, QueueTask]] = []
+        parked: dict[str, float] = {}
+        now = self.time_fn()
+        for raw in raws:
+            task = QueueTask.from_json(raw)
+            eligible_at = self._next_attempt_at(task)
+            if eligible_at > now:
+                parked[raw] = eligible_at
+                continue
+            if not self._is_tenant_eligible(task):
+                runtime_metrics.inc("queue.tenant_fairness_deferred")
+                deferred.append((raw, task))
+                continue
+            self._mark_dispatched(task)
+            dispatched.append(task)
+        if parked:
+            self.backend.push_delayed_many(self.delayed_queue_name, parked)
+        if deferred:
+            self.backend.push_many(
+                self.queue_name,
+                [raw for raw, _ in deferred],
+                priorities=[task.priority for _, task in deferred],
+            )
+        if parked or deferred:
+            self.backend.ack_many(self.processing_queue_name, [*parked, *(raw for raw, _ in deferred)])
+        self._refresh_pressure_state()
+        if dispatched:
+            runtime_metrics.inc("queue.dequeued", float(len(dispatched)))
+        runtime_metrics.set_gauge(f"queue.depth.{self.queue_name}", float(self.queue_size()))
+        return dispatched
+
     def acknowledge_task(self, task: QueueTask) -> None:
-        self._inflight.pop(task.task_id, None)
+        with self._inflight_lock:
+            self._inflight.pop(task.task_id, None)
         self.backend.ack(self.processing_queue_name, task.to_json())
         runtime_metrics.inc("queue.acked")
 
+    def acknowledge_many(self, tasks: list[QueueTask]) -> None:
+        with self._inflight_lock:
+            for task in tasks:
+                self._inflight.pop(task.task_id, None)
+        self.backend.ack_many(self.processing_queue_name, [task.to_json() for task in tasks])
+        runtime_metrics.inc("queue.acked", float(len(tasks)))
+
+    def release_task(self, task: QueueTask) -> None:
+        """Returns a dispatched task to the ready queue without counting an attempt (e.g. on shutdown)."""
+        with self._inflight_lock:
+            self._inflight.pop(task.task_id, None)
+        raw = task.to_json()
+        self.backend.push(self.queue_name, raw, priority=task.priority)
+        self.backend.ack(self.processing_queue_name, raw)
+        tenant_id = str(task.metadata.get("tenant_id", "default"))
+        self._tenant_queued_counts[tenant_id] = self._tenant_queued_counts.get(tenant_id, 0) + 1
+        runtime_metrics.inc("queue.released")
+
     def fail_task(self, task: QueueTask, *, error: str, exc: BaseException | None = None) -> None:
-        self._inflight.pop(task.task_id, None)
+        with self._inflight_lock:
+            self._inflight.pop(task.task_id, None)
         attempts = int(task.metadata.get("attempts", 0)) + 1
         task.metadata["attempts"] = attempts
         task.metadata["last_error"] = error
@@ -252,7 +524,7 @@ class DistributedTaskQueue:
         )
         task.metadata["retry_classification"] = classification
         if classification == PERMANENT or attempts >= self.max_retries:
-            self.backend.push(self.dead_letter_queue_name, task.to_json())
+            self.backend.push(self.dead_letter_queue_name, task.to_json(), priority=task.priority)
             self.backend.ack(self.processing_queue_name, task.to_json())
             runtime_metrics.inc("queue.dead_lettered")
             log_event(
@@ -266,8 +538,12 @@ class DistributedTaskQueue:
             )
             return
         delay_seconds = self.retry_engine.compute_delay("queue_worker", attempts)
-        task.metadata["next_attempt_at"] = time.time() + delay_seconds
-        self.backend.push(self.queue_name, task.to_json())
+        eligible_at = self.time_fn() + delay_seconds
+        task.metadata["next_attempt_at"] = eligible_at
+        if delay_seconds > 0:
+            self.backend.push_delayed(self.delayed_queue_name, task.to_json(), eligible_at)
+        else:
+            self.backend.push(self.queue_name, task.to_json(), priority=task.priority)
         self.backend.ack(self.processing_queue_name, task.to_json())
         runtime_metrics.inc("queue.retried")
         log_event(
@@ -282,8 +558,14 @@ class DistributedTaskQueue:
         )
 
     def queue_size(self) -> int:
+        return self.backend.length(self.queue_name) + self.delayed_size()
+
+    def ready_size(self) -> int:
         return self.backend.length(self.queue_name)
 
+    def delayed_size(self) -> int:
+        return self.backend.delayed_length(self.delayed_queue_name)
+
     def is_under_pressure(self) -> bool:
         return self._refresh_pressure_state()
 
@@ -296,14 +578,71 @@ class DistributedTaskQueue:
     def tenant_depth(self, tenant_id: str) -> int:
         tenant = tenant_id.strip() or "default"
         queued = self._tenant_queued_counts.get(tenant, 0)
-        inflight = sum(1 for task, _ in self._inflight.values() if str(task.metadata.get("tenant_id", "default")) == tenant)
+        with self._inflight_lock:
+            inflight_tasks = [task for task, _ in self._inflight.values()]
+        inflight = sum(1 for task in inflight_tasks if str(task.metadata.get("tenant_id", "default")) == tenant)
         return queued + inflight
 
+    def _admit_for_enqueue(
+        self,
+        task: QueueTask | dict[str, Any],
+        *,
+        pending_tenant_counts: dict[str, int] | None = None,
+    ) -> QueueTask:
+        enforce_context_in_metadata(task.get("metadata", {}) if isinstance(task, dict) else task.metadata, strict=self.enforce_tenant_context)
+        if isinstance(task, dict):
+            task = QueueTask(
+                task_id=task.get("task_id", f"task-{uuid.uuid4().hex[:12]}"),
+                name=task.get("name", task.get("description", "task")),
+                payload=task.get("payload", {}),
+                priority=int(task.get("priority", 50)),
+                dependencies=list(task.get("dependencies", [])),
+                metadata=task.get("metadata", {}),
+            )
+
+        tenant_id = str(task.metadata.get("tenant_id", "default"))
+        priority_boost = self.tenant_priority_boost.get(tenant_id, 0)
+        if priority_boost:
+            task.priority = max(1, task.priority - priority_boost)
+        tenant_limit = self.tenant_queue_limits.get(tenant_id)
+        pending_for_tenant = (pending_tenant_counts or {}).get(tenant_id, 0)
+        if tenant_limit is not None and self.tenant_depth(tenant_id) + pending_for_tenant >= tenant_limit:
+            runtime_metrics.inc("queue.tenant_backpressure_rejections")
+            raise OverflowError(f"tenant queue saturation for {tenant_id}")
+
+        if len(self._inflight) >= self.max_inflight_tasks:
+            runtime_metrics.inc("queue.inflight_backpressure_rejections")
+            raise OverflowError("queue inflight saturation")
+        return task
+
+    @staticmethod
+    def _next_attempt_at(task: QueueTask) -> float:
+        return float(task.metadata.get("next_attempt_at", 0.0) or 0.0)
+
+    def _promote_due_tasks(self) -> None:
+        promoted = self.backend.promote_due(
+            self.delayed_queue_name,
+            self.queue_name,
+            self.time_fn(),
+            limit=self.delayed_promotion_batch_size,
+        )
+        if promoted:
+            runtime_metrics.inc("queue.delayed_promoted", float(promoted))
+
+    def _mark_dispatched(self, task: QueueTask) -> None:
+        with self._inflight_lock:
+            self._inflight[task.task_id] = (task, self.time_fn() + self.visibility_timeout_seconds)
+        tenant_id = str(task.metadata.get("tenant_id", "default"))
+        current = self._tenant_queued_counts.get(tenant_id, 0)
+        self._tenant_queued_counts[tenant_id] = max(0, current - 1)
+        self._record_tenant_dequeue(tenant_id)
+
     def _requeue_expired_inflight(self) -> None:
-        now = time.time()
-        expired = [task_id for task_id, (_, deadline) in self._inflight.items() if deadline <= now]
-        for task_id in expired:
-            task, _ = self._inflight.pop(task_id)
+        now = self.time_fn()
+        with self._inflight_lock:
+            expired_ids = [task_id for task_id, (_, deadline) in self._inflight.items() if deadline <= now]
+            expired = [self._inflight.pop(task_id)[0] for task_id in expired_ids]
+        for task in expired:
             self.fail_task(task, error="visibility_timeout")
 
     def _is_tenant_eligible(self, task: QueueTask) -> bool:
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
-from threading import Condition, RLock
+from threading import Event, RLock
 from typing import Any, Literal
 
-from governance.approval_store import ApprovalStore
+from governance.approval_store import ApprovalRecord, ApprovalStore
 
 DecisionType = Literal["approved", "rejected"]
 
@@ -33,67 +34,109 @@ class ApprovalRequest:
 
 
 class ApprovalQueue:
-    """Thread-safe approval queue persisted via ApprovalStore."""
+    """Thread-safe approval queue persisted via ApprovalStore.
 
-    def __init__(self, store: ApprovalStore | None = None) -> None:
+    Waiters block on a per-token ``Event`` that ``record_decision`` sets, so a
+    decision made through this instance wakes them immediately and unrelated
+    activity never does. Decisions written to the store by another instance or
+    process cannot set that event, so waiters also re-read the store every
+    ``poll_interval_seconds``. The event is dropped once its last waiter
+    leaves, including on timeout.
+    """
+
+    RESOLVED_STATUSES = frozenset({"approved", "rejected"})
+
+    def __init__(self, store: ApprovalStore | None = None, *, poll_interval_seconds: float = 1.0) -> None:
         self._lock = RLock()
-        self._condition = Condition(self._lock)
         self._store = store or ApprovalStore()
+        self.poll_interval_seconds = max(0.01, poll_interval_seconds)
         self._reviewers: dict[str, list[str]] = {}
+        self._resolution_events: dict[str, Event] = {}
+        self._waiter_counts: dict[str, int] = {}
 
     def submit(self, *, token: str, reason: str, payload: dict[str, Any] | None = None) -> ApprovalRequest:
-        with self._condition:
+        with self._lock:
             self._store.create(token=token, reason=reason, payload=payload or {})
-            self._condition.notify_all()
             return self.get(token)  # type: ignore[return-value]
 
     def assign_reviewer(self, *, token: str, reviewer: str, assigned_by: str = "system") -> ApprovalRequest:
-        with self._condition:
+        with self._lock:
             reviewers = self._reviewers.setdefault(token, [])
             if reviewer not in reviewers:
                 reviewers.append(reviewer)
                 self._store.add_history(token=token, action="reviewer_assigned", actor=assigned_by, details={"reviewer": reviewer})
-                self._condition.notify_all()
             return self.get(token)  # type: ignore[return-value]
 
     def record_decision(self, *, token: str, decision: DecisionType, reviewer: str, comment: str = "") -> ApprovalRequest:
-        with self._condition:
+        with self._lock:
             self._store.record_decision(token=token, decision=decision, reviewer=reviewer, comment=comment)
-            self._condition.notify_all()
+            event = self._resolution_events.pop(token, None)
+            if event is not None:
+                event.set()
             return self.get(token)  # type: ignore[return-value]
 
     def get(self, token: str) -> ApprovalRequest | None:
         with self._lock:
             try:
-                record = self._store.get(token)
+                record, history = self._store.get_with_history(token)
             except KeyError:
                 return None
-            history = [AuditEntry(timestamp=h["created_at"], action=h["action"], actor=h["actor"], details=h["details"]) for h in self._store.history(token)]
-            return ApprovalRequest(
-                token=record.token,
-                reason=record.reason,
-                payload=record.payload,
-                reviewers=list(self._reviewers.get(token, [])),
-                status=record.status,
-                decision=record.decision,  # type: ignore[assignment]
-                decision_by=record.decision_by,
-                decision_comment=record.decision_comment,
-                created_at=record.created_at,
-                resolved_at=record.resolved_at,
-                audit_history=history,
-            )
+            return self._to_request(record, history)
 
     def pending(self) -> list[ApprovalRequest]:
         with self._lock:
-            return [self.get(record.token) for record in self._store.pending() if self.get(record.token) is not None]  # type: ignore[misc]
+            return [self._to_request(record, history) for record, history in self._store.pending_with_history()]
 
     def wait_for_resolution(self, token: str, timeout_seconds: float | None = None) -> ApprovalRequest:
-        with self._condition:
-            self._condition.wait_for(lambda: (req := self.get(token)) is not None and req.status in {"approved", "rejected"}, timeout=timeout_seconds)
+        with self._lock:
             request = self.get(token)
             if request is None:
                 raise KeyError(token)
-            return request
+            if request.status in self.RESOLVED_STATUSES:
+                return request
+            event = self._resolution_events.setdefault(token, Event())
+            self._waiter_counts[token] = self._waiter_counts.get(token, 0) + 1
+        deadline = None if timeout_seconds is None else time.monotonic() + timeout_seconds
+        try:
+            while True:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                wait_for = self.poll_interval_seconds if remaining is None else min(remaining, self.poll_interval_seconds)
+                if event.wait(timeout=wait_for):
+                    break
+                request = self.get(token)
+                if request is None or request.status in self.RESOLVED_STATUSES:
+                    break
+        finally:
+            with self._lock:
+                waiters = self._waiter_counts.pop(token, 1) - 1
+                if waiters:
+                    self._waiter_counts[token] = waiters
+                elif self._resolution_events.get(token) is event:
+                    del self._resolution_events[token]
+        request = self.get(token)
+        if request is None:
+            raise KeyError(token)
+        return request
+
+    def _to_request(self, record: ApprovalRecord, history: list[dict[str, Any]]) -> ApprovalRequest:
+        return ApprovalRequest(
+            token=record.token,
+            reason=record.reason,
+            payload=record.payload,
+            reviewers=list(self._reviewers.get(record.token, [])),
+            status=record.status,
+            decision=record.decision,  # type: ignore[arg-type]
+            decision_by=record.decision_by,
+            decision_comment=record.decision_comment,
+            created_at=record.created_at,
+            resolved_at=record.resolved_at,
+            audit_history=[
+                AuditEntry(timestamp=h["created_at"], action=h["action"], actor=h["actor"], details=h["details"])
+                for h in history
+            ],
+        )
 
 
 GLOBAL_APPROVAL_QUEUE = ApprovalQueue()
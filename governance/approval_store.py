@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -27,18 +28,70 @@ class ApprovalRecord:
     resolved_at: str | None
 
 
+_RECORD_COLUMNS = (
+    "a.token, a.reason, a.payload_json, a.status, a.decision, a.decision_by, "
+    "a.decision_comment, a.created_at, a.resolved_at"
+)
+_HISTORY_COLUMNS = "h.action, h.actor, h.details_json, h.created_at AS history_created_at"
+
+
+def _record_from_row(row: sqlite3.Row) -> ApprovalRecord:
+    return ApprovalRecord(
+        token=row["token"],
+        reason=row["reason"],
+        payload=json.loads(row["payload_json"]),
+        status=row["status"],
+        decision=row["decision"],
+        decision_by=row["decision_by"],
+        decision_comment=row["decision_comment"],
+        created_at=row["created_at"],
+        resolved_at=row["resolved_at"],
+    )
+
+
+def _history_from_row(row: sqlite3.Row) -> dict[str, Any]:
+    return {
+        "action": row["action"],
+        "actor": row["actor"],
+        "details": json.loads(row["details_json"]),
+        "created_at": row["history_created_at"],
+    }
+
+
 class ApprovalStore:
+    """SQLite-backed approvals with their audit history.
+
+    One persistent connection in WAL mode is shared by all threads and
+    serialized by a lock. ``pending_with_history`` and ``get_with_history``
+    load approvals and their history in a single JOIN instead of one query
+    per approval.
+    """
+
     def __init__(self, db_path: str = "governance_approvals.db") -> None:
         self.db_path = Path(db_path)
+        self._lock = threading.RLock()
+        self._connection: sqlite3.Connection | None = None
         self._init_db()
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def _conn(self) -> sqlite3.Connection:
+        if self._connection is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._connection = conn
+        return self._connection
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
 
     def _init_db(self) -> None:
-        with self._connect() as conn:
+        with self._lock:
+            conn = self._conn()
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS approvals (
@@ -67,67 +120,103 @@ class ApprovalStore:
                 )
                 """
             )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_approvals_status ON approvals(status, created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_approval_history_token ON approval_history(token, id)")
 
     def create(self, *, token: str, reason: str, payload: dict[str, Any] | None = None) -> ApprovalRecord:
         now = _now()
-        with self._connect() as conn:
-            conn.execute("BEGIN")
-            conn.execute(
-                "INSERT OR IGNORE INTO approvals(token, reason, payload_json, status, created_at) VALUES (?, ?, ?, 'pending', ?)",
-                (token, reason, json.dumps(payload or {}), now),
-            )
-            conn.execute(
-                "INSERT INTO approval_history(token, action, actor, details_json, created_at) VALUES (?, 'submitted', 'system', ?, ?)",
-                (token, json.dumps({"reason": reason}), now),
-            )
-            conn.commit()
-        return self.get(token)
+        with self._lock:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT OR IGNORE INTO approvals(token, reason, payload_json, status, created_at) VALUES (?, ?, ?, 'pending', ?)",
+                    (token, reason, json.dumps(payload or {}), now),
+                )
+                conn.execute(
+                    "INSERT INTO approval_history(token, action, actor, details_json, created_at) VALUES (?, 'submitted', 'system', ?, ?)",
+                    (token, json.dumps({"reason": reason}), now),
+                )
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            return self.get(token)
 
     def add_history(self, *, token: str, action: str, actor: str, details: dict[str, Any] | None = None) -> None:
-        with self._connect() as conn:
-            conn.execute(
+        with self._lock:
+            self._conn().execute(
                 "INSERT INTO approval_history(token, action, actor, details_json, created_at) VALUES (?, ?, ?, ?, ?)",
                 (token, action, actor, json.dumps(details or {}), _now()),
             )
 
     def record_decision(self, *, token: str, decision: str, reviewer: str, comment: str = "") -> ApprovalRecord:
         resolved_at = _now()
-        with self._connect() as conn:
-            conn.execute("BEGIN")
-            conn.execute(
-                "UPDATE approvals SET status=?, decision=?, decision_by=?, decision_comment=?, resolved_at=? WHERE token=?",
-                (decision, decision, reviewer, comment, resolved_at, token),
-            )
-            conn.execute(
-                "INSERT INTO approval_history(token, action, actor, details_json, created_at) VALUES (?, 'decision_recorded', ?, ?, ?)",
-                (token, reviewer, json.dumps({"decision": decision, "comment": comment}), resolved_at),
-            )
-            conn.commit()
-        return self.get(token)
+        with self._lock:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "UPDATE approvals SET status=?, decision=?, decision_by=?, decision_comment=?, resolved_at=? WHERE token=?",
+                    (decision, decision, reviewer, comment, resolved_at, token),
+                )
+                conn.execute(
+                    "INSERT INTO approval_history(token, action, actor, details_json, created_at) VALUES (?, 'decision_recorded', ?, ?, ?)",
+                    (token, reviewer, json.dumps({"decision": decision, "comment": comment}), resolved_at),
+                )
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            return self.get(token)
 
     def get(self, token: str) -> ApprovalRecord:
-        with self._connect() as conn:
-            row = conn.execute("SELECT * FROM approvals WHERE token=?", (token,)).fetchone()
+        with self._lock:
+            row = self._conn().execute(f"SELECT {_RECORD_COLUMNS} FROM approvals a WHERE a.token=?", (token,)).fetchone()
         if row is None:
             raise KeyError(token)
-        return ApprovalRecord(
-            token=row["token"],
-            reason=row["reason"],
-            payload=json.loads(row["payload_json"]),
-            status=row["status"],
-            decision=row["decision"],
-            decision_by=row["decision_by"],
-            decision_comment=row["decision_comment"],
-            created_at=row["created_at"],
-            resolved_at=row["resolved_at"],
-        )
+        return _record_from_row(row)
+
+    def get_with_history(self, token: str) -> tuple[ApprovalRecord, list[dict[str, Any]]]:
+        results = self._select_with_history("a.token = ?", (token,))
+        if not results:
+            raise KeyError(token)
+        return results[0]
 
     def pending(self) -> list[ApprovalRecord]:
-        with self._connect() as conn:
-            rows = conn.execute("SELECT * FROM approvals WHERE status='pending'").fetchall()
-        return [self.get(row["token"]) for row in rows]
+        with self._lock:
+            rows = self._conn().execute(
+                f"SELECT {_RECORD_COLUMNS} FROM approvals a WHERE a.status='pending' ORDER BY a.created_at, a.token"
+            ).fetchall()
+        return [_record_from_row(row) for row in rows]
+
+    def pending_with_history(self) -> list[tuple[ApprovalRecord, list[dict[str, Any]]]]:
+        return self._select_with_history("a.status = 'pending'", ())
 
     def history(self, token: str) -> list[dict[str, Any]]:
-        with self._connect() as conn:
-            rows = conn.execute("SELECT action, actor, details_json, created_at FROM approval_history WHERE token=? ORDER BY id", (token,)).fetchall()
-        return [{"action": r["action"], "actor": r["actor"], "details": json.loads(r["details_json"]), "created_at": r["created_at"]} for r in rows]
+        with self._lock:
+            rows = self._conn().execute(
+                "SELECT action, actor, details_json, created_at AS history_created_at FROM approval_history WHERE token=? ORDER BY id",
+                (token,),
+            ).fetchall()
+        return [_history_from_row(row) for row in rows]
+
+    def _select_with_history(self, where: str, params: tuple[Any, ...]) -> list[tuple[ApprovalRecord, list[dict[str, Any]]]]:
+        with self._lock:
+            rows = self._conn().execute(
+                f"""
+                SELECT {_RECORD_COLUMNS}, h.id AS history_id, {_HISTORY_COLUMNS}
+                FROM approvals a
+                LEFT JOIN approval_history h ON h.token = a.token
+                WHERE {where}
+                ORDER BY a.created_at, a.token, h.id
+                """,
+                params,
+            ).fetchall()
+        results: list[tuple[ApprovalRecord, list[dict[str, Any]]]] = []
+        for row in rows:
+            if not results or results[-1][0].token != row["token"]:
+                results.append((_record_from_row(row), []))
+            if row["history_id"] is not None:
+                results[-1][1].append(_history_from_row(row))
+        return results
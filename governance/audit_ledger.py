@@ -6,10 +6,13 @@ import base64
 import hashlib
 import hmac
 import json
+import os
+import re
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 
 EVENT_APPROVAL_DECISION = "approval_decision"
@@ -39,24 +42,51 @@ class AuditLedger:
 
     Entries are chained by hash and signed with HMAC so any mutation, deletion,
     or insertion is detectable during verification.
+
+    ``ledger_path`` is the active segment. Once it holds ``max_segment_entries``
+    entries it is sealed as ``<stem>.<segment:06d><suffix>`` and a new active
+    segment starts. The chain head (last hash, index, timestamp, segment and
+    byte offset) is persisted in ``<ledger_path>.head.json`` so appends never
+    re-read the ledger. ``verify(incremental=True)`` resumes from a signed
+    checkpoint in ``<ledger_path>.verified.json`` and only checks segments
+    sealed since then, plus the active segment.
+
+    Before each append the in-memory head is checked against the active
+    segment's size (and against a rotation done elsewhere) and rebuilt when
+    another instance has written in the meantime. Instances in the same
+    process that share a ledger path also share one lock; writers in
+    separate processes must still be serialized externally.
     """
 
+    _path_locks: dict[Path, threading.Lock] = {}
+    _path_locks_guard = threading.Lock()
+
     def __init__(
         self,
         ledger_path: str = "governance_audit_ledger.jsonl",
         *,
         signing_key: str | bytes,
         max_future_skew_seconds: int = 60,
+        max_segment_entries: int = 10_000,
     ) -> None:
         if not signing_key:
             raise ValueError("signing_key is required")
 
         self.ledger_path = Path(ledger_path)
         self.max_future_skew_seconds = max_future_skew_seconds
+        self.max_segment_entries = max(1, max_segment_entries)
         self._signing_key = signing_key.encode("utf-8") if isinstance(signing_key, str) else signing_key
+        self._head_path = self.ledger_path.with_name(f"{self.ledger_path.name}.head.json")
+        self._verified_path = self.ledger_path.with_name(f"{self.ledger_path.name}.verified.json")
+        self._segment_pattern = re.compile(
+            rf"^{re.escape(self.ledger_path.stem)}\.(\d{{6}}){re.escape(self.ledger_path.suffix)}$"
+        )
+        with self._path_locks_guard:
+            self._lock = self._path_locks.setdefault(self.ledger_path.resolve(), threading.Lock())
         self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
         if not self.ledger_path.exists():
             self.ledger_path.touch()
+        self._head = self._load_head()
 
     def record_approval_decision(
         self,
@@ -128,13 +158,40 @@ class AuditLedger:
         )
 
     def append(self, *, event_type: str, actor: str, details: dict[str, Any]) -> AuditEntry:
-        entries = self._load_entries()
-        index = len(entries)
-        previous_hash = entries[-1]["entry_hash"] if entries else "GENESIS"
+        return self.append_many([(event_type, actor, details)])[0]
+
+    def append_many(self, events: list[tuple[str, str, dict[str, Any]]]) -> list[AuditEntry]:
+        """Appends ``(event_type, actor, details)`` events with one write and one head update per segment."""
+        records: list[dict[str, Any]] = []
+        with self._lock:
+            if self._head_is_stale():
+                self._head = self._rebuild_head()
+            # Chain against a working copy; ``self._head`` only advances once the lines are on disk.
+            head = dict(self._head)
+            pending: list[bytes] = []
+            for event_type, actor, details in events:
+                if head["segment_entries"] >= self.max_segment_entries:
+                    self._commit_lines(pending, head)
+                    pending = []
+                    self._rotate_segment()
+                    head = dict(self._head)
+                record, line = self._chain_record(head, event_type=event_type, actor=actor, details=details)
+                records.append(record)
+                pending.append(line)
+            self._commit_lines(pending, head)
+
+        return [self._row_to_entry(record) for record in records]
+
+    def _chain_record(
+        self, head: dict[str, Any], *, event_type: str, actor: str, details: dict[str, Any]
+    ) -> tuple[dict[str, Any], bytes]:
+        """Builds the next signed record after ``head`` and advances that head past it."""
+        index = head["index"] + 1
+        previous_hash = head["entry_hash"]
 
         timestamp = datetime.now(timezone.utc)
-        if entries:
-            previous_ts = self._parse_timestamp(entries[-1]["timestamp"])
+        if head["timestamp"] is not None:
+            previous_ts = self._parse_timestamp(head["timestamp"])
             if timestamp < previous_ts:
                 raise AuditLedgerIntegrityError("timestamp regression detected while appending")
 
@@ -156,47 +213,97 @@ class AuditLedger:
             "signature": signature,
         }
 
-        with self.ledger_path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record, sort_keys=True) + "\n")
-            f.flush()
-
-        return self._row_to_entry(record)
-
-    def verify(self) -> None:
-        entries = self._load_entries()
+        line = (json.dumps(record, sort_keys=True) + "\n").encode("utf-8")
+        head.update(
+            index=index,
+            entry_hash=entry_hash,
+            timestamp=payload["timestamp"],
+            offset=head["offset"] + len(line),
+            segment_entries=head["segment_entries"] + 1,
+        )
+        return record, line
+
+    def _commit_lines(self, lines: list[bytes], head: dict[str, Any]) -> None:
+        """Writes chained lines and only then makes ``head`` the current chain head."""
+        if not lines:
+            return
+        try:
+            with self.ledger_path.open("ab") as f:
+                f.write(b"".join(lines))
+                f.flush()
+        except BaseException:
+            # Drop any partially written line so the file still ends at the committed head.
+            try:
+                os.truncate(self.ledger_path, self._head["offset"])
+            except OSError:
+                pass
+            raise
+        self._head = head
+        self._write_json_atomic(self._head_path, head)
+
+    def verify(self, *, incremental: bool = False) -> None:
+        """Validates the hash chain, signatures and timestamps.
+
+        With ``incremental=True`` verification starts after the last sealed
+        segment recorded in the signed checkpoint, and the checkpoint advances
+        to the newest sealed segment once it passes.
+        """
+        segments = self._sealed_segments()
         previous_hash = "GENESIS"
         previous_ts: datetime | None = None
+        expected_index = 0
+        if incremental:
+            checkpoint = self._load_verified_checkpoint()
+            if checkpoint is not None:
+                segments = [(number, path) for number, path in segments if number > checkpoint["segment"]]
+                previous_hash = checkpoint["entry_hash"]
+                previous_ts = self._parse_timestamp(checkpoint["timestamp"]) if checkpoint["timestamp"] else None
+                expected_index = checkpoint["index"] + 1
         now = datetime.now(timezone.utc)
 
-        for i, row in enumerate(entries):
-            if row.get("index") != i:
-                raise AuditLedgerIntegrityError(f"entry index mismatch at position {i}")
-            if row.get("previous_hash") != previous_hash:
-                raise AuditLedgerIntegrityError(f"hash chain broken at index {i}")
-
-            ts = self._parse_timestamp(row["timestamp"])
-            if previous_ts is not None and ts < previous_ts:
-                raise AuditLedgerIntegrityError(f"timestamp regression at index {i}")
-            if (ts - now).total_seconds() > self.max_future_skew_seconds:
-                raise AuditLedgerIntegrityError(f"timestamp integrity violation at index {i}")
-
-            payload = {
-                "index": row["index"],
-                "timestamp": row["timestamp"],
-                "event_type": row["event_type"],
-                "actor": row["actor"],
-                "details": row["details"],
-                "previous_hash": row["previous_hash"],
-            }
-            canonical = self._canonical_json(payload)
-            expected_hash = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
-            if row.get("entry_hash") != expected_hash:
-                raise AuditLedgerIntegrityError(f"entry hash mismatch at index {i}")
-            if not hmac.compare_digest(row.get("signature", ""), self._sign(expected_hash)):
-                raise AuditLedgerIntegrityError(f"signature mismatch at index {i}")
-
-            previous_hash = row["entry_hash"]
-            previous_ts = ts
+        last_sealed: dict[str, Any] | None = None
+        for path, sealed_number in [*((path, number) for number, path in segments), (self.ledger_path, None)]:
+            for row in self._read_rows(path):
+                i = expected_index
+                if row.get("index") != i:
+                    raise AuditLedgerIntegrityError(f"entry index mismatch at position {i}")
+                if row.get("previous_hash") != previous_hash:
+                    raise AuditLedgerIntegrityError(f"hash chain broken at index {i}")
+
+                ts = self._parse_timestamp(row["timestamp"])
+                if previous_ts is not None and ts < previous_ts:
+                    raise AuditLedgerIntegrityError(f"timestamp regression at index {i}")
+                if (ts - now).total_seconds() > self.max_future_skew_seconds:
+                    raise AuditLedgerIntegrityError(f"timestamp integrity violation at index {i}")
+
+                payload = {
+                    "index": row["index"],
+                    "timestamp": row["timestamp"],
+                    "event_type": row["event_type"],
+                    "actor": row["actor"],
+                    "details": row["details"],
+                    "previous_hash": row["previous_hash"],
+                }
+                canonical = self._canonical_json(payload)
+                expected_hash = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+                if row.get("entry_hash") != expected_hash:
+                    raise AuditLedgerIntegrityError(f"entry hash mismatch at index {i}")
+                if not hmac.compare_digest(row.get("signature", ""), self._sign(expected_hash)):
+                    raise AuditLedgerIntegrityError(f"signature mismatch at index {i}")
+
+                previous_hash = row["entry_hash"]
+                previous_ts = ts
+                expected_index += 1
+            if sealed_number is not None:
+                last_sealed = {
+                    "segment": sealed_number,
+                    "index": expected_index - 1,
+                    "entry_hash": previous_hash,
+                    "timestamp": previous_ts.isoformat() if previous_ts else None,
+                }
+
+        if last_sealed is not None:
+            self._write_verified_checkpoint(last_sealed)
 
     def query(
         self,
@@ -232,13 +339,99 @@ class AuditLedger:
 
     def _load_entries(self) -> list[dict[str, Any]]:
         rows: list[dict[str, Any]] = []
-        with self.ledger_path.open("r", encoding="utf-8") as f:
+        for _, path in self._sealed_segments():
+            rows.extend(self._read_rows(path))
+        rows.extend(self._read_rows(self.ledger_path))
+        return rows
+
+    @staticmethod
+    def _read_rows(path: Path) -> Iterator[dict[str, Any]]:
+        with path.open("r", encoding="utf-8") as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
-                rows.append(json.loads(line))
-        return rows
+                yield json.loads(line)
+
+    def _sealed_segments(self) -> list[tuple[int, Path]]:
+        segments = []
+        for path in self.ledger_path.parent.iterdir():
+            match = self._segment_pattern.match(path.name)
+            if match:
+                segments.append((int(match.group(1)), path))
+        return sorted(segments)
+
+    def _rotate_segment(self) -> None:
+        head = self._head
+        sealed_path = self._sealed_segment_path(head["segment"])
+        os.replace(self.ledger_path, sealed_path)
+        self.ledger_path.touch()
+        head.update(segment=head["segment"] + 1, offset=0, segment_entries=0)
+        self._write_json_atomic(self._head_path, head)
+
+    def _head_is_stale(self) -> bool:
+        head = self._head
+        if self.ledger_path.stat().st_size != head["offset"]:
+            return True
+        # An empty active segment matches a fresh head, so also look for a rotation made elsewhere.
+        return head["offset"] == 0 and self._sealed_segment_path(head["segment"]).exists()
+
+    def _sealed_segment_path(self, segment: int) -> Path:
+        return self.ledger_path.with_name(f"{self.ledger_path.stem}.{segment:06d}{self.ledger_path.suffix}")
+
+    def _load_head(self) -> dict[str, Any]:
+        """Loads the persisted chain head, reconciling it with the active segment's size."""
+        active_size = self.ledger_path.stat().st_size
+        head: dict[str, Any] | None = None
+        if self._head_path.exists():
+            try:
+                head = json.loads(self._head_path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError:
+                head = None
+        if head is not None and head.get("offset") == active_size:
+            return head
+        return self._rebuild_head()
+
+    def _rebuild_head(self) -> dict[str, Any]:
+        # Only reached when the sidecar is missing or stale (e.g. a crash between
+        # the ledger write and the head update); reads at most one segment per side.
+        sealed = self._sealed_segments()
+        active_rows = list(self._read_rows(self.ledger_path))
+        last_row = active_rows[-1] if active_rows else None
+        if last_row is None and sealed:
+            for last_row in self._read_rows(sealed[-1][1]):
+                pass
+        head = {
+            "index": last_row["index"] if last_row else -1,
+            "entry_hash": last_row["entry_hash"] if last_row else "GENESIS",
+            "timestamp": last_row["timestamp"] if last_row else None,
+            "segment": sealed[-1][0] + 1 if sealed else 0,
+            "offset": self.ledger_path.stat().st_size,
+            "segment_entries": len(active_rows),
+        }
+        self._write_json_atomic(self._head_path, head)
+        return head
+
+    def _load_verified_checkpoint(self) -> dict[str, Any] | None:
+        if not self._verified_path.exists():
+            return None
+        record = json.loads(self._verified_path.read_text(encoding="utf-8"))
+        checkpoint = record.get("checkpoint", {})
+        if not hmac.compare_digest(record.get("signature", ""), self._sign(self._canonical_json(checkpoint))):
+            raise AuditLedgerIntegrityError("verification checkpoint signature mismatch")
+        return checkpoint
+
+    def _write_verified_checkpoint(self, checkpoint: dict[str, Any]) -> None:
+        self._write_json_atomic(
+            self._verified_path,
+            {"checkpoint": checkpoint, "signature": self._sign(self._canonical_json(checkpoint))},
+        )
+
+    @staticmethod
+    def _write_json_atomic(path: Path, value: dict[str, Any]) -> None:
+        temp_path = path.with_name(f"{path.name}.tmp")
+        temp_path.write_text(json.dumps(value, sort_keys=True), encoding="utf-8")
+        os.replace(temp_path, path)
 
     def _sign(self, digest: str) -> str:
         sig = hmac.new(self._signing_key, digest.encode("utf-8"), hashlib.sha256).digest()
@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import hashlib
-import math
+import itertools
+import json
+import random
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from pathlib import Path
+from typing import Any, Callable
+
+from core.semantic_cache import SemanticIndex, default_index_factory
 
 
 @dataclass(slots=True, frozen=True)
@@ -20,11 +26,45 @@ class ExperienceRecord:
 
 
 class ExperienceStore:
-    """In-memory continuous learning store with vector-style retrieval."""
+    """In-memory continuous learning store with vector-style retrieval.
+
+    Records are indexed per kind in a ``SemanticIndex`` (NumPy-backed when
+    available), so ``query_similar`` scores only the requested kinds and
+    selects the top-k without sorting everything. At most ``capacity``
+    records are kept: ``"fifo"`` retention evicts the oldest, ``"reservoir"``
+    keeps a uniform sample of everything recorded. With ``persist_path`` set,
+    records are appended to a JSONL log and reloaded on start; embeddings are
+    derived from record content, so they are recomputed rather than stored.
+    """
+
+    RETENTION_POLICIES = ("fifo", "reservoir")
 
-    def __init__(self, *, embedding_dimensions: int = 48) -> None:
+    def __init__(
+        self,
+        *,
+        embedding_dimensions: int = 48,
+        capacity: int | None = 50_000,
+        retention: str = "fifo",
+        persist_path: str | Path | None = None,
+        index_factory: Callable[[], SemanticIndex] | None = None,
+        random_fn: Callable[[], float] | None = None,
+    ) -> None:
+        if retention not in self.RETENTION_POLICIES:
+            raise ValueError(f"retention must be one of {self.RETENTION_POLICIES}")
         self.embedding_dimensions = max(8, embedding_dimensions)
-        self._records: list[ExperienceRecord] = []
+        self.capacity = max(1, capacity) if capacity is not None else None
+        self.retention = retention
+        self.persist_path = Path(persist_path) if persist_path is not None else None
+        self._index_factory = index_factory or default_index_factory
+        self._random_fn = random_fn or random.random
+        self._records: OrderedDict[int, ExperienceRecord] = OrderedDict()
+        self._reservoir_slots: list[int] = []
+        self._indexes: dict[str, SemanticIndex] = {}
+        self._ids = itertools.count()
+        self._seen = 0
+        self._persisted_lines = 0
+        if self.persist_path is not None:
+            self._load()
 
     def _embed(self, text: str) -> list[float]:
         digest = hashlib.sha256(text.encode("utf-8")).digest()
@@ -37,9 +77,82 @@ class ExperienceStore:
             embedding=self._embed(f"{kind}:{payload}"),
             timestamp=datetime.now(timezone.utc).isoformat(),
         )
-        self._records.append(record)
+        self._admit(record)
+        if self.persist_path is not None:
+            self._persist(record)
         return record
 
+    def _admit(self, record: ExperienceRecord) -> None:
+        self._seen += 1
+        record_id = next(self._ids)
+        full = self.capacity is not None and len(self._records) >= self.capacity
+        if self.retention == "reservoir":
+            if not full:
+                self._reservoir_slots.append(record_id)
+            else:
+                # Algorithm R: the new record displaces a random one with probability capacity / seen.
+                slot = int(self._random_fn() * self._seen)
+                if slot >= len(self._reservoir_slots):
+                    return
+                self._evict(self._reservoir_slots[slot])
+                self._reservoir_slots[slot] = record_id
+        elif full:
+            self._evict(next(iter(self._records)))
+
+        self._records[record_id] = record
+        index = self._indexes.get(record.kind)
+        if index is None:
+            index = self._indexes[record.kind] = self._index_factory()
+        index.add(record_id, record.embedding)
+
+    def _evict(self, record_id: int) -> None:
+        record = self._records.pop(record_id)
+        index = self._indexes[record.kind]
+        index.remove(record_id)
+        if not len(index):
+            del self._indexes[record.kind]
+
+    def _persist(self, record: ExperienceRecord) -> None:
+        assert self.persist_path is not None
+        self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.persist_path.open("a", encoding="utf-8") as handle:
+            handle.write(self._serialize(record) + "\n")
+        self._persisted_lines += 1
+        if self.capacity is not None and self._persisted_lines > 2 * self.capacity:
+            self._compact()
+
+    def _compact(self) -> None:
+        assert self.persist_path is not None
+        temp_path = self.persist_path.with_name(f"{self.persist_path.name}.tmp")
+        with temp_path.open("w", encoding="utf-8") as handle:
+            for record in self._records.values():
+                handle.write(self._serialize(record) + "\n")
+        temp_path.replace(self.persist_path)
+        self._persisted_lines = len(self._records)
+
+    def _load(self) -> None:
+        assert self.persist_path is not None
+        if not self.persist_path.exists():
+            return
+        with self.persist_path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                self._admit(
+                    ExperienceRecord(
+                        kind=row["kind"],
+                        payload=row["payload"],
+                        embedding=self._embed(f"{row['kind']}:{row['payload']}"),
+                        timestamp=row["timestamp"],
+                    )
+                )
+                self._persisted_lines += 1
+
+    @staticmethod
+    def _serialize(record: ExperienceRecord) -> str:
+        return json.dumps({"kind": record.kind, "payload": record.payload, "timestamp": record.timestamp}, default=str)
+
     def store_task_outcome(self, task_id: str, outcome: dict[str, Any]) -> ExperienceRecord:
         return self._store("task_outcome", {"task_id": task_id, "outcome": outcome})
 
@@ -106,21 +219,14 @@ class ExperienceStore:
             return []
 
         query_embedding = self._embed(text)
-
-        def cosine(a: list[float], b: list[float]) -> float:
-            numerator = sum(x * y for x, y in zip(a, b, strict=False))
-            a_norm = math.sqrt(sum(x * x for x in a))
-            b_norm = math.sqrt(sum(y * y for y in b))
-            if a_norm == 0 or b_norm == 0:
-                return 0.0
-            return numerator / (a_norm * b_norm)
-
-        filtered = self._records
-        if kinds:
-            filtered = [record for record in self._records if record.kind in kinds]
-
-        ranked = sorted(filtered, key=lambda record: cosine(query_embedding, record.embedding), reverse=True)
-        return ranked[: max(1, limit)]
+        limit = max(1, limit)
+        candidates: list[tuple[float, int]] = []
+        for kind, index in self._indexes.items():
+            if kinds and kind not in kinds:
+                continue
+            candidates.extend((score, record_id) for record_id, score in index.top_k(query_embedding, limit))
+        candidates.sort(key=lambda item: (-item[0], item[1]))
+        return [self._records[record_id] for _, record_id in candidates[:limit]]
 
     def retrieve_for_planning(self, objective: str, *, limit: int = 5) -> list[ExperienceRecord]:
         """Fetch relevant past experiences before plan generation."""
@@ -132,4 +238,4 @@ class ExperienceStore:
         )
 
     def all_records(self) -> list[ExperienceRecord]:
-        return list(self._records)
+        return list(self._records.values())
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections import defaultdict, deque
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from typing import Any
 
@@ -15,17 +15,72 @@ class PerformanceSnapshot:
     repeated_failures: bool
 
 
-class PerformanceFeedback:
-    """Aggregates execution results and computes planning signals."""
+class _RunningStats:
+    """Run/success/time/cost sums, decayed lazily up to the tick of each new record.
+
+    Reads need no decay: every sum shares the same factor, so ratios are unaffected.
+    """
+
+    __slots__ = ("runs", "success", "total_time", "total_cost", "tick")
+
+    def __init__(self) -> None:
+        self.runs = 0.0
+        self.success = 0.0
+        self.total_time = 0.0
+        self.total_cost = 0.0
+        self.tick = 0
+
+    def decay_to(self, tick: int, decay: float) -> None:
+        if decay < 1.0 and tick > self.tick:
+            factor = decay ** (tick - self.tick)
+            self.runs *= factor
+            self.success *= factor
+            self.total_time *= factor
+            self.total_cost *= factor
+        self.tick = tick
+
+    def add(self, tick: int, decay: float, *, success: bool, execution_time: float, cost: float) -> None:
+        self.decay_to(tick, decay)
+        self.runs += 1
+        self.success += 1 if success else 0
+        self.total_time += execution_time
+        self.total_cost += cost
+
+    def rates(self) -> tuple[float, float, float]:
+        if not self.runs:
+            return 0.0, 0.0, 0.0
+        return self.success / self.runs, self.total_time / self.runs, self.total_cost / self.runs
+
 
-    def __init__(self, *, failure_window: int = 5, failure_threshold: int = 3) -> None:
+class PerformanceFeedback:
+    """Aggregates execution results and computes planning signals.
+
+    Results are folded into running aggregates on record instead of being
+    kept, so memory is bounded by the number of tracked agents, tools and
+    strategies (each capped at ``max_tracked_keys``, evicting the least
+    recently updated). With ``decay_half_life`` set, every aggregate weights
+    a result by ``0.5 ** (records_since / decay_half_life)``, favouring recent
+    behaviour; without it the aggregates are plain lifetime averages.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_window: int = 5,
+        failure_threshold: int = 3,
+        decay_half_life: float | None = None,
+        max_tracked_keys: int = 1024,
+    ) -> None:
         self.failure_window = max(1, failure_window)
         self.failure_threshold = max(1, failure_threshold)
-        self._task_results: list[dict[str, Any]] = []
-        self._agent_stats: dict[str, dict[str, float]] = defaultdict(
-            lambda: {"runs": 0.0, "success": 0.0, "total_time": 0.0, "total_cost": 0.0}
-        )
-        self._tool_stats: dict[str, dict[str, float]] = defaultdict(lambda: {"runs": 0.0, "success": 0.0})
+        self.decay_half_life = decay_half_life
+        self.max_tracked_keys = max(1, max_tracked_keys)
+        self._decay = 0.5 ** (1.0 / decay_half_life) if decay_half_life else 1.0
+        self._tick = 0
+        self._global_stats = _RunningStats()
+        self._agent_stats: OrderedDict[str, _RunningStats] = OrderedDict()
+        self._tool_stats: OrderedDict[str, _RunningStats] = OrderedDict()
+        self._strategy_stats: OrderedDict[str, _RunningStats] = OrderedDict()
         self._failures = deque(maxlen=self.failure_window)
 
     def evaluate_task_success(self, result: dict[str, Any]) -> bool:
@@ -41,27 +96,15 @@ class PerformanceFeedback:
         cost = float(result.get("cost", 0.0))
         agent_id = str(result.get("agent_id", "unknown"))
         tool_id = str(result.get("tool", result.get("tool_id", "unknown")))
+        strategy_id = result.get("strategy_id")
 
-        self._task_results.append(
-            {
-                "success": success,
-                "execution_time": execution_time,
-                "cost": cost,
-                "agent_id": agent_id,
-                "tool_id": tool_id,
-                "task_id": result.get("task_id"),
-            }
-        )
-
-        agent = self._agent_stats[agent_id]
-        agent["runs"] += 1
-        agent["success"] += 1 if success else 0
-        agent["total_time"] += execution_time
-        agent["total_cost"] += cost
-
-        tool = self._tool_stats[tool_id]
-        tool["runs"] += 1
-        tool["success"] += 1 if success else 0
+        self._tick += 1
+        sample = {"success": success, "execution_time": execution_time, "cost": cost}
+        self._global_stats.add(self._tick, self._decay, **sample)
+        self._tracked(self._agent_stats, agent_id).add(self._tick, self._decay, **sample)
+        self._tracked(self._tool_stats, tool_id).add(self._tick, self._decay, **sample)
+        if strategy_id is not None:
+            self._tracked(self._strategy_stats, str(strategy_id)).add(self._tick, self._decay, **sample)
 
         self._failures.append(0 if success else 1)
         return success
@@ -70,30 +113,37 @@ class PerformanceFeedback:
         return sum(self._failures) >= self.failure_threshold
 
     def planner_signals(self) -> dict[str, Any]:
-        runs = len(self._task_results)
-        successes = sum(1 for item in self._task_results if item["success"])
-        avg_time = sum(item["execution_time"] for item in self._task_results) / runs if runs else 0.0
-        avg_cost = sum(item["cost"] for item in self._task_results) / runs if runs else 0.0
-
+        success_rate, avg_time, avg_cost = self._global_stats.rates()
         return {
-            "global_success_rate": (successes / runs) if runs else 0.0,
+            "global_success_rate": success_rate,
             "average_execution_time": avg_time,
             "average_cost": avg_cost,
             "repeated_failures": self.detect_repeated_failures(),
             "agent_performance": {
-                agent_id: {
-                    "success_rate": (stats["success"] / stats["runs"]) if stats["runs"] else 0.0,
-                    "avg_execution_time": (stats["total_time"] / stats["runs"]) if stats["runs"] else 0.0,
-                    "avg_cost": (stats["total_cost"] / stats["runs"]) if stats["runs"] else 0.0,
-                }
-                for agent_id, stats in self._agent_stats.items()
+                agent_id: self._performance(stats) for agent_id, stats in self._agent_stats.items()
             },
             "tool_effectiveness": {
-                tool_id: (stats["success"] / stats["runs"]) if stats["runs"] else 0.0
-                for tool_id, stats in self._tool_stats.items()
+                tool_id: stats.rates()[0] for tool_id, stats in self._tool_stats.items()
+            },
+            "strategy_performance": {
+                strategy_id: self._performance(stats) for strategy_id, stats in self._strategy_stats.items()
             },
         }
 
+    def _tracked(self, table: OrderedDict[str, _RunningStats], key: str) -> _RunningStats:
+        stats = table.get(key)
+        if stats is None:
+            stats = table[key] = _RunningStats()
+            if len(table) > self.max_tracked_keys:
+                table.popitem(last=False)
+        else:
+            table.move_to_end(key)
+        return stats
+
+    def _performance(self, stats: _RunningStats) -> dict[str, float]:
+        success_rate, avg_time, avg_cost = stats.rates()
+        return {"success_rate": success_rate, "avg_execution_time": avg_time, "avg_cost": avg_cost}
+
     def snapshot(self) -> PerformanceSnapshot:
         signals = self.planner_signals()
         return PerformanceSnapshot(
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import itertools
 import json
-import math
 import sqlite3
+import struct
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-from memory.memory_governor import MemoryGovernor
+from core.semantic_cache import SemanticIndex, default_index_factory
+from memory.memory_governor import MemoryGovernor, tenant_for_namespace
 from security.tenant_context import require_tenant_context
 
 
@@ -23,15 +25,46 @@ class MemoryEntry:
     created_at: float = field(default_factory=time.time)
 
 
-class DistributedMemory:
-    """Persists task history/state in SQL and supports semantic retrieval via vector similarity."""
+def _pack_embedding(embedding: list[float]) -> bytes:
+    return struct.pack(f"<{len(embedding)}f", *embedding)
+
+
+def _unpack_embedding(blob: bytes) -> list[float]:
+    return list(struct.unpack(f"<{len(blob) // 4}f", blob))
 
-    def __init__(self, db_path: str = "agentos_memory.db", *, memory_governor: MemoryGovernor | None = None, enforce_tenant_context: bool = False) -> None:
+
+class DistributedMemory:
+    """Persists task history/state in SQL and supports semantic retrieval via vector similarity.
+
+    Embeddings are stored as little-endian float32 BLOBs. Vector search is
+    served by in-process ``SemanticIndex`` partitions keyed by namespace and
+    dimension. They are built lazily on the first search and then kept in sync
+    through a rowid high-water mark: every search first indexes rows with a
+    rowid above the mark, which covers inserts and ``INSERT OR REPLACE``
+    rewrites made by other connections. Rows removed behind the index's back
+    (e.g. by ``MemoryGovernor.compact``) are pruned when a search fails to
+    load them.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "agentos_memory.db",
+        *,
+        memory_governor: MemoryGovernor | None = None,
+        enforce_tenant_context: bool = False,
+        index_factory: Callable[[], SemanticIndex] | None = None,
+    ) -> None:
         self.db_path = Path(db_path)
         self._conn = sqlite3.connect(self.db_path)
         self.memory_governor = memory_governor or MemoryGovernor(str(self.db_path))
         self.enforce_tenant_context = enforce_tenant_context
         self._conn.row_factory = sqlite3.Row
+        self._index_factory = index_factory or default_index_factory
+        self._vector_indexes: dict[tuple[str, int], SemanticIndex] = {}
+        self._indexed_keys: dict[str, tuple[int, str, int]] = {}
+        self._keys_by_id: dict[int, str] = {}
+        self._vector_ids = itertools.count()
+        self._indexed_rowid = 0
         self._bootstrap()
 
     def _bootstrap(self) -> None:
@@ -41,11 +74,27 @@ class DistributedMemory:
                 key TEXT PRIMARY KEY,
                 namespace TEXT NOT NULL,
                 value_json TEXT NOT NULL,
-                embedding_json TEXT NOT NULL,
-                created_at REAL NOT NULL
+                embedding_json TEXT NOT NULL DEFAULT '',
+                created_at REAL NOT NULL,
+                embedding_blob BLOB,
+                tenant_id TEXT
             )
             """
         )
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(task_history)")}
+        if "embedding_blob" not in columns:
+            self._conn.execute("ALTER TABLE task_history ADD COLUMN embedding_blob BLOB")
+        if "tenant_id" not in columns:
+            self._conn.execute("ALTER TABLE task_history ADD COLUMN tenant_id TEXT")
+            self._conn.execute(
+                """
+                UPDATE task_history
+                SET tenant_id = substr(namespace, 8, instr(substr(namespace, 8), ':') - 1)
+                WHERE namespace LIKE 'tenant:%:%'
+                """
+            )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_task_history_namespace ON task_history(namespace)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_task_history_tenant_created ON task_history(tenant_id, created_at)")
         self._conn.execute(
             """
             CREATE TABLE IF NOT EXISTS agent_state (
@@ -69,54 +118,112 @@ class DistributedMemory:
     def store_task_history(self, entry: MemoryEntry) -> None:
         ctx = require_tenant_context(strict=self.enforce_tenant_context)
         entry.embedding = self.memory_governor.prune_vector(entry.embedding, ctx.tenant_id)
-        self._conn.execute(
+        value_json = json.dumps(entry.value)
+        embedding_blob = _pack_embedding(entry.embedding)
+        cursor = self._conn.execute(
             """
-            INSERT OR REPLACE INTO task_history (key, namespace, value_json, embedding_json, created_at)
-            VALUES (?, ?, ?, ?, ?)
+            INSERT OR REPLACE INTO task_history (key, namespace, value_json, embedding_json, embedding_blob, created_at, tenant_id)
+            VALUES (?, ?, ?, '', ?, ?, ?)
             """,
             (
                 entry.key,
                 entry.namespace,
-                json.dumps(entry.value),
-                json.dumps(entry.embedding),
+                value_json,
+                embedding_blob,
                 entry.created_at,
+                tenant_for_namespace(entry.namespace),
             ),
         )
         self._conn.commit()
-        self.memory_governor.compact(ctx.tenant_id)
+        if self._indexed_rowid and cursor.lastrowid == self._indexed_rowid + 1:
+            # No other writer got in between, so the mark can advance without a re-scan.
+            self._index_vector(entry.key, entry.namespace, entry.embedding)
+            self._indexed_rowid = cursor.lastrowid
+        self.memory_governor.record_write(ctx.tenant_id, bytes_written=len(value_json) + len(embedding_blob))
+
+    def delete_task_history(self, key: str) -> bool:
+        deleted = self._conn.execute("DELETE FROM task_history WHERE key = ?", (key,)).rowcount
+        self._conn.commit()
+        self._unindex_vector(key)
+        return bool(deleted)
 
     def semantic_vector_search(self, query_embedding: list[float], *, limit: int = 5, namespace: str | None = None) -> list[dict[str, Any]]:
+        self._ensure_vector_index()
+        limit = max(1, limit)
+        partitions = [
+            index
+            for (index_namespace, dimensions), index in self._vector_indexes.items()
+            if dimensions == len(query_embedding) and (namespace is None or index_namespace == namespace)
+        ]
+        while True:
+            candidates = sorted(
+                (match for index in partitions for match in index.top_k(query_embedding, limit)),
+                key=lambda match: match[1],
+                reverse=True,
+            )[:limit]
+            keys = [self._keys_by_id[vector_id] for vector_id, _ in candidates]
+            rows = {
+                row["key"]: row
+                for row in self._conn.execute(
+                    f"SELECT key, namespace, value_json, created_at FROM task_history WHERE key IN ({','.join('?' * len(keys))})",
+                    keys,
+                )
+            } if keys else {}
+            stale = [key for key in keys if key not in rows]
+            if not stale:
+                break
+            for key in stale:
+                self._unindex_vector(key)
+        return [
+            {
+                "key": rows[key]["key"],
+                "namespace": rows[key]["namespace"],
+                "value": json.loads(rows[key]["value_json"]),
+                "score": score,
+                "created_at": rows[key]["created_at"],
+            }
+            for key, (_, score) in zip(keys, candidates)
+        ]
+
+    def _ensure_vector_index(self) -> None:
         rows = self._conn.execute(
-            "SELECT key, namespace, value_json, embedding_json, created_at FROM task_history"
-            + (" WHERE namespace = ?" if namespace else ""),
-            ((namespace,) if namespace else ()),
-        ).fetchall()
-
-        def cosine(a: list[float], b: list[float]) -> float:
-            if not a or not b or len(a) != len(b):
-                return -1.0
-            dot = sum(x * y for x, y in zip(a, b))
-            a_norm = math.sqrt(sum(x * x for x in a))
-            b_norm = math.sqrt(sum(y * y for y in b))
-            if a_norm == 0 or b_norm == 0:
-                return -1.0
-            return dot / (a_norm * b_norm)
-
-        ranked = sorted(
-            (
-                {
-                    "key": row["key"],
-                    "namespace": row["namespace"],
-                    "value": json.loads(row["value_json"]),
-                    "score": cosine(query_embedding, json.loads(row["embedding_json"])),
-                    "created_at": row["created_at"],
-                }
-                for row in rows
-            ),
-            key=lambda item: item["score"],
-            reverse=True,
+            """
+            SELECT rowid, key, namespace, embedding_json, embedding_blob
+            FROM task_history
+            WHERE rowid > ?
+            ORDER BY rowid
+            """,
+            (self._indexed_rowid,),
         )
-        return ranked[: max(1, limit)]
+        for row in rows:
+            blob = row["embedding_blob"]
+            embedding = _unpack_embedding(blob) if blob is not None else json.loads(row["embedding_json"] or "[]")
+            self._index_vector(row["key"], row["namespace"], embedding)
+            self._indexed_rowid = row["rowid"]
+
+    def _index_vector(self, key: str, namespace: str, embedding: list[float]) -> None:
+        self._unindex_vector(key)
+        if not embedding:
+            return
+        vector_id = next(self._vector_ids)
+        partition_key = (namespace, len(embedding))
+        index = self._vector_indexes.get(partition_key)
+        if index is None:
+            index = self._vector_indexes[partition_key] = self._index_factory()
+        index.add(vector_id, embedding)
+        self._indexed_keys[key] = (vector_id, namespace, len(embedding))
+        self._keys_by_id[vector_id] = key
+
+    def _unindex_vector(self, key: str) -> None:
+        indexed = self._indexed_keys.pop(key, None)
+        if indexed is None:
+            return
+        vector_id, namespace, dimensions = indexed
+        del self._keys_by_id[vector_id]
+        index = self._vector_indexes[(namespace, dimensions)]
+        index.remove(vector_id)
+        if not len(index):
+            del self._vector_indexes[(namespace, dimensions)]
 
     def save_agent_state(self, agent_id: str, state: dict[str, Any]) -> None:
         self._conn.execute(
@@ -7,7 +7,7 @@ import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Callable, Iterable
 
 
 @dataclass(slots=True)
@@ -15,53 +15,174 @@ class MemoryGovernancePolicy:
     tenant_max_records: int = 20_000
     record_ttl_seconds: int = 60 * 60 * 24 * 30
     max_vector_dimensions: int = 512
+    compaction_write_threshold: int = 500
+    compaction_bytes_threshold: int = 8 * 1024 * 1024
+    compaction_max_interval_seconds: int = 300
+    compaction_row_budget: int = 5_000
+    compaction_time_budget_seconds: float = 0.05
+
+
+@dataclass(slots=True)
+class _TenantWriteStats:
+    writes: int = 0
+    bytes_written: int = 0
+    last_compacted_at: float = 0.0
+    backlog: bool = False
+
+
+def tenant_for_namespace(namespace: str) -> str | None:
+    """Returns ``x`` for ``tenant:x:...`` namespaces, the scope compaction applies to."""
+    if not namespace.startswith("tenant:"):
+        return None
+    tenant_id, separator, _ = namespace[len("tenant:") :].partition(":")
+    return tenant_id if separator else None
 
 
 class MemoryGovernor:
-    def __init__(self, db_path: str = "agentos_memory.db", *, policies: dict[str, MemoryGovernancePolicy] | None = None) -> None:
+    """Applies per-tenant TTL and record quotas to ``task_history``.
+
+    Writes are reported through ``record_write``, which only bumps counters.
+    A tenant becomes due for compaction once its writes, written bytes or
+    time since the last run cross the policy thresholds. In ``"inline"``
+    mode the reporting write then runs one budgeted pass; in ``"deferred"``
+    mode due tenants are left to ``run_due_compactions`` (driven by
+    ``CompactionScheduler``). Each pass deletes in small batches via the
+    indexed ``tenant_id`` column and stops at the policy's row/time budget,
+    leaving the tenant due if work remains.
+    """
+
+    COMPACTION_MODES = ("inline", "deferred")
+    DELETE_BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        db_path: str = "agentos_memory.db",
+        *,
+        policies: dict[str, MemoryGovernancePolicy] | None = None,
+        compaction_mode: str = "inline",
+        time_fn: Callable[[], float] | None = None,
+    ) -> None:
+        if compaction_mode not in self.COMPACTION_MODES:
+            raise ValueError(f"compaction_mode must be one of {self.COMPACTION_MODES}")
         self.db_path = Path(db_path)
         self.policies = policies or {}
         self.default_policy = MemoryGovernancePolicy()
+        self.compaction_mode = compaction_mode
+        self.time_fn = time_fn or time.time
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+        self._write_stats: dict[str, _TenantWriteStats] = {}
 
     def _conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._connection.row_factory = sqlite3.Row
+        return self._connection
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
 
     def policy_for(self, tenant_id: str) -> MemoryGovernancePolicy:
         return self.policies.get(tenant_id, self.default_policy)
 
-    def compact(self, tenant_id: str) -> dict[str, int]:
+    def record_write(self, tenant_id: str, *, bytes_written: int = 0) -> dict[str, int] | None:
+        """Accounts a write and, in inline mode, compacts once the tenant is due."""
+        with self._lock:
+            stats = self._write_stats.get(tenant_id)
+            if stats is None:
+                stats = self._write_stats[tenant_id] = _TenantWriteStats(last_compacted_at=self.time_fn())
+            stats.writes += 1
+            stats.bytes_written += bytes_written
+        if self.compaction_mode == "inline" and self.is_due(tenant_id):
+            return self.compact(tenant_id, budgeted=True)
+        return None
+
+    def is_due(self, tenant_id: str) -> bool:
+        stats = self._write_stats.get(tenant_id)
+        if stats is None:
+            return False
         policy = self.policy_for(tenant_id)
-        cutoff = time.time() - policy.record_ttl_seconds
-        with self._conn() as conn:
-            deleted_ttl = conn.execute(
-                "DELETE FROM task_history WHERE namespace LIKE ? AND created_at < ?",
-                (f"tenant:{tenant_id}:%", cutoff),
-            ).rowcount
-
-            count_row = conn.execute(
-                "SELECT COUNT(*) AS n FROM task_history WHERE namespace LIKE ?",
-                (f"tenant:{tenant_id}:%",),
-            ).fetchone()
-            current_count = int(count_row["n"] if count_row else 0)
-            over = max(0, current_count - policy.tenant_max_records)
-            deleted_quota = 0
-            if over:
-                deleted_quota = conn.execute(
-                    """
-                    DELETE FROM task_history
-                    WHERE key IN (
-                        SELECT key FROM task_history
-                        WHERE namespace LIKE ?
-                        ORDER BY created_at ASC
-                        LIMIT ?
+        return (
+            stats.backlog
+            or stats.writes >= policy.compaction_write_threshold
+            or stats.bytes_written >= policy.compaction_bytes_threshold
+            or (stats.writes > 0 and self.time_fn() - stats.last_compacted_at >= policy.compaction_max_interval_seconds)
+        )
+
+    def run_due_compactions(self, tenant_ids: Iterable[str] = ()) -> dict[str, dict[str, int]]:
+        """Compacts every due tenant plus ``tenant_ids``, each within its budget."""
+        due = [tenant_id for tenant_id in list(self._write_stats) if self.is_due(tenant_id)]
+        targets = dict.fromkeys([*due, *tenant_ids])
+        return {tenant_id: self.compact(tenant_id, budgeted=True) for tenant_id in targets}
+
+    def compact(self, tenant_id: str, *, budgeted: bool = False) -> dict[str, int]:
+        policy = self.policy_for(tenant_id)
+        now = self.time_fn()
+        cutoff = now - policy.record_ttl_seconds
+        row_budget = policy.compaction_row_budget if budgeted else None
+        deadline = time.monotonic() + policy.compaction_time_budget_seconds if budgeted else None
+        with self._lock:
+            conn = self._conn()
+            deleted_ttl, ttl_complete = self._delete_in_batches(
+                conn,
+                "SELECT key FROM task_history WHERE tenant_id = ? AND created_at < ? ORDER BY created_at ASC LIMIT ?",
+                (tenant_id, cutoff),
+                limit=None,
+                row_budget=row_budget,
+                deadline=deadline,
+            )
+            deleted_quota, quota_complete = 0, ttl_complete
+            if ttl_complete:
+                count_row = conn.execute("SELECT COUNT(*) AS n FROM task_history WHERE tenant_id = ?", (tenant_id,)).fetchone()
+                over = max(0, int(count_row["n"] if count_row else 0) - policy.tenant_max_records)
+                if over:
+                    deleted_quota, quota_complete = self._delete_in_batches(
+                        conn,
+                        "SELECT key FROM task_history WHERE tenant_id = ? ORDER BY created_at ASC LIMIT ?",
+                        (tenant_id,),
+                        limit=over,
+                        row_budget=None if row_budget is None else row_budget - deleted_ttl,
+                        deadline=deadline,
                     )
-                    """,
-                    (f"tenant:{tenant_id}:%", over),
-                ).rowcount
+            stats = self._write_stats.setdefault(tenant_id, _TenantWriteStats())
+            stats.writes = 0
+            stats.bytes_written = 0
+            stats.last_compacted_at = now
+            stats.backlog = not quota_complete
+        return {"deleted_ttl": deleted_ttl, "deleted_quota": deleted_quota, "complete": int(quota_complete)}
+
+    def _delete_in_batches(
+        self,
+        conn: sqlite3.Connection,
+        select_sql: str,
+        params: tuple[Any, ...],
+        *,
+        limit: int | None,
+        row_budget: int | None,
+        deadline: float | None,
+    ) -> tuple[int, bool]:
+        deleted = 0
+        while True:
+            batch = self.DELETE_BATCH_SIZE
+            if limit is not None:
+                batch = min(batch, limit - deleted)
+            if row_budget is not None:
+                batch = min(batch, row_budget - deleted)
+            if batch <= 0:
+                return deleted, limit is not None and deleted >= limit
+            removed = conn.execute(
+                f"DELETE FROM task_history WHERE key IN ({select_sql})",
+                (*params, batch),
+            ).rowcount
             conn.commit()
-        return {"deleted_ttl": deleted_ttl, "deleted_quota": deleted_quota}
+            deleted += removed
+            if removed < batch:
+                return deleted, True
+            if deadline is not None and time.monotonic() >= deadline:
+                return deleted, limit is not None and deleted >= limit
 
     def prune_vector(self, embedding: list[float], tenant_id: str) -> list[float]:
         max_dims = self.policy_for(tenant_id).max_vector_dimensions
@@ -82,8 +203,7 @@ class CompactionScheduler:
 
         def _run() -> None:
             while not self._stop.wait(self.interval_seconds):
-                for tenant_id in self.tenant_ids:
-                    self.governor.compact(tenant_id)
+                self.governor.run_due_compactions(self.tenant_ids)
 
         self._thread = threading.Thread(target=_run, name='memory-compaction', daemon=True)
         self._thread.start()
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import hashlib
-import math
+import heapq
+import itertools
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable
 
+from core.semantic_cache import SemanticIndex, default_index_factory
 from monitoring.tracing import get_tracer
 
 
@@ -19,12 +22,56 @@ class MemoryRecord:
     timestamp: str
 
 
+def _is_valid_record(record: object, dimensions: int) -> bool:
+    if not isinstance(record, MemoryRecord):
+        return False
+    if not isinstance(record.payload, dict):
+        return False
+    if not isinstance(record.embedding, list) or len(record.embedding) != dimensions:
+        return False
+    return all(isinstance(value, int | float) for value in record.embedding)
+
+
 class VectorMemory:
-    def __init__(self) -> None:
-        self._records: list[MemoryRecord] = []
+    """Capacity-bounded vector memory with per-kind indexes and top-k retrieval.
+
+    Records live in a private slot list: evicted slots are reused, so it
+    never grows past ``capacity``. Each kind has its own ``SemanticIndex``
+    over the slot numbers. A ``kinds`` filter selects partitions, and a
+    ``where`` predicate is applied to index candidates fetched in growing
+    batches until ``limit`` of them pass. ``eviction`` picks the record
+    dropped when full: ``"lru"`` (least recently stored or retrieved),
+    ``"age"`` (oldest) or ``"importance"`` (lowest ``payload["importance"]``,
+    oldest first). Records built elsewhere go through ``add_record`` and
+    ``replace_record``, which reject malformed entries; ``records()`` lists
+    the live ones.
+    """
+
+    EMBEDDING_DIMENSIONS = 32
+    EVICTION_POLICIES = ("lru", "age", "importance")
+
+    def __init__(
+        self,
+        *,
+        capacity: int = 10_000,
+        eviction: str = "lru",
+        index_factory: Callable[[], SemanticIndex] | None = None,
+    ) -> None:
+        if eviction not in self.EVICTION_POLICIES:
+            raise ValueError(f"eviction must be one of {self.EVICTION_POLICIES}")
+        self.capacity = max(1, capacity)
+        self.eviction = eviction
+        self._index_factory = index_factory or default_index_factory
+        self._slots: list[MemoryRecord | None] = []
         self._tracer = get_tracer()
-
-    def _embed(self, text: str, dimensions: int = 32) -> list[float]:
+        self._indexes: dict[str, SemanticIndex] = {}
+        self._order: OrderedDict[int, None] = OrderedDict()
+        self._importance_heap: list[tuple[float, int, int]] = []
+        self._slot_seq: dict[int, int] = {}
+        self._free_slots: list[int] = []
+        self._seq = itertools.count()
+
+    def _embed(self, text: str, dimensions: int = EMBEDDING_DIMENSIONS) -> list[float]:
         digest = hashlib.sha256(text.encode("utf-8")).digest()
         vector = []
         for i in range(dimensions):
@@ -41,9 +88,31 @@ class VectorMemory:
                 embedding=self._embed(content),
                 timestamp=datetime.now(timezone.utc).isoformat(),
             )
-            self._records.append(record)
+            self._insert(record)
             return record
 
+    def add_record(self, record: MemoryRecord) -> bool:
+        """Stores a prebuilt record; returns ``False`` and skips it when malformed."""
+        if not _is_valid_record(record, self.EMBEDDING_DIMENSIONS):
+            return False
+        self._insert(record)
+        return True
+
+    def replace_record(self, old: MemoryRecord, new: MemoryRecord) -> bool:
+        """Swaps a stored record for ``new`` in place; ``False`` if ``old`` is not stored or ``new`` is malformed."""
+        if not _is_valid_record(new, self.EMBEDDING_DIMENSIONS):
+            return False
+        for slot in self._order:
+            if self._slots[slot] is old:
+                self._unindex_slot(slot)
+                self._slots[slot] = new
+                self._index_slot(slot, new)
+                return True
+        return False
+
+    def records(self) -> list[MemoryRecord]:
+        return [self._slots[slot] for slot in self._order]
+
     def store_task_result(self, task_id: str, result: dict[str, Any]) -> MemoryRecord:
         return self._store("task_result", {"task_id": task_id, "result": result})
 
@@ -56,31 +125,97 @@ class VectorMemory:
     def store_environment_state(self, state: dict[str, Any]) -> MemoryRecord:
         return self._store("environment_state", state)
 
-    def semantic_retrieve(self, query: str, *, limit: int = 5) -> list[MemoryRecord]:
+    def semantic_retrieve(
+        self,
+        query: str,
+        *,
+        limit: int = 5,
+        kinds: set[str] | None = None,
+        where: Callable[[MemoryRecord], bool] | None = None,
+    ) -> list[MemoryRecord]:
         with self._tracer.start_span("memory.retrieve", kind="memory_access", attributes={"limit": limit}):
-            if not self._records:
+            if not self._order:
                 return []
             q_embedding = self._embed(query)
-
-            def is_valid_record(record: object) -> bool:
-                if not isinstance(record, MemoryRecord):
-                    return False
-                if not isinstance(record.payload, dict):
-                    return False
-                if not isinstance(record.embedding, list):
-                    return False
-                return all(isinstance(value, int | float) for value in record.embedding)
-
-            def cosine(a: list[float], b: list[float]) -> float:
-                numerator = sum(x * y for x, y in zip(a, b, strict=False))
-                a_norm = math.sqrt(sum(x * x for x in a))
-                b_norm = math.sqrt(sum(y * y for y in b))
-                if a_norm == 0 or b_norm == 0:
-                    return 0.0
-                return numerator / (a_norm * b_norm)
-
-            valid_records = [record for record in self._records if is_valid_record(record)]
-            if not valid_records:
-                return []
-            ranked = sorted(valid_records, key=lambda r: cosine(q_embedding, r.embedding), reverse=True)
-            return ranked[: max(1, limit)]
+            limit = max(1, limit)
+            partitions = [
+                (kind, index) for kind, index in self._indexes.items() if not kinds or kind in kinds
+            ]
+            scored = [match for _, index in partitions for match in self._top_k(index, q_embedding, limit, where)]
+            best = heapq.nsmallest(limit, scored, key=lambda match: (-match[1], self._slot_seq[match[0]]))
+            if self.eviction == "lru":
+                for slot, _ in best:
+                    self._order.move_to_end(slot)
+            return [self._slots[slot] for slot, _ in best]
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def _top_k(
+        self,
+        index: SemanticIndex,
+        query: list[float],
+        limit: int,
+        where: Callable[[MemoryRecord], bool] | None,
+    ) -> list[tuple[int, float]]:
+        if where is None:
+            return index.top_k(query, limit)
+        k = limit
+        while True:
+            candidates = index.top_k(query, k)
+            matches = [(slot, score) for slot, score in candidates if where(self._slots[slot])]
+            if len(matches) >= limit or len(candidates) < k:
+                return matches
+            k *= 4
+
+    def _insert(self, record: MemoryRecord) -> None:
+        if len(self._order) >= self.capacity:
+            self._evict(self._eviction_victim())
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._slots[slot] = record
+        else:
+            slot = len(self._slots)
+            self._slots.append(record)
+        self._index_slot(slot, record)
+
+    def _index_slot(self, slot: int, record: MemoryRecord) -> None:
+        seq = next(self._seq)
+        self._slot_seq[slot] = seq
+        self._order[slot] = None
+        if self.eviction == "importance":
+            heapq.heappush(self._importance_heap, (self._importance(record), seq, slot))
+        index = self._indexes.get(record.kind)
+        if index is None:
+            index = self._indexes[record.kind] = self._index_factory()
+        index.add(slot, record.embedding)
+
+    def _eviction_victim(self) -> int:
+        if self.eviction != "importance":
+            return next(iter(self._order))
+        while True:
+            _, seq, slot = heapq.heappop(self._importance_heap)
+            if self._slot_seq.get(slot) == seq:
+                return slot
+
+    def _evict(self, slot: int) -> None:
+        self._unindex_slot(slot)
+        self._slots[slot] = None
+        self._free_slots.append(slot)
+
+    def _unindex_slot(self, slot: int) -> None:
+        record = self._slots[slot]
+        assert record is not None
+        del self._order[slot]
+        del self._slot_seq[slot]
+        index = self._indexes[record.kind]
+        index.remove(slot)
+        if not len(index):
+            del self._indexes[record.kind]
+
+    @staticmethod
+    def _importance(record: MemoryRecord) -> float:
+        try:
+            return float(record.payload.get("importance", 0.0))
+        except (TypeError, ValueError):
+            return 0.0
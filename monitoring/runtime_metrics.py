@@ -2,41 +2,133 @@
 
 from __future__ import annotations
 
+import math
 from collections import defaultdict
 from threading import Lock
 
+SNAPSHOT_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class StreamingHistogram:
+    """Log-bucketed quantile sketch (DDSketch-style) with constant memory.
+
+    Positive values land in bucket ``ceil(log(v) / log(gamma))`` so every
+    quantile estimate is within ``relative_accuracy`` of the true value. When
+    more than ``max_buckets`` are in use the lowest buckets are merged, which
+    only degrades accuracy for the smallest observations.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048) -> None:
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._max_buckets = max_buckets
+        self._positive: dict[int, int] = defaultdict(int)
+        self._negative: dict[int, int] = defaultdict(int)
+        self._zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._lock = Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total += value
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+            if value > 0:
+                self._add(self._positive, value)
+            elif value < 0:
+                self._add(self._negative, -value)
+            else:
+                self._zero_count += 1
+
+    def quantile(self, q: float) -> float:
+        with self._lock:
+            if not self.count:
+                return 0.0
+            if q <= 0:
+                return self.min
+            if q >= 1:
+                return self.max
+            rank = q * (self.count - 1)
+            seen = 0
+            for key in sorted(self._negative, reverse=True):
+                seen += self._negative[key]
+                if seen > rank:
+                    return max(-self._bucket_value(key), self.min)
+            seen += self._zero_count
+            if seen > rank:
+                return 0.0
+            for key in sorted(self._positive):
+                seen += self._positive[key]
+                if seen > rank:
+                    return min(self._bucket_value(key), self.max)
+            return self.max
+
+    def summary(self, quantiles: tuple[float, ...] = SNAPSHOT_QUANTILES) -> dict[str, float]:
+        with self._lock:
+            count, total = self.count, self.total
+        values = {"avg": total / count if count else 0.0, "count": float(count)}
+        for q in quantiles:
+            values[f"p{round(q * 100):g}"] = self.quantile(q)
+        return values
+
+    def _add(self, buckets: dict[int, int], magnitude: float) -> None:
+        buckets[math.ceil(math.log(magnitude) / self._log_gamma)] += 1
+        if len(buckets) > self._max_buckets:
+            lowest, second = sorted(buckets)[:2]
+            buckets[second] += buckets.pop(lowest)
+
+    def _bucket_value(self, key: int) -> float:
+        return 2 * self._gamma**key / (self._gamma + 1)
+
 
 class RuntimeMetrics:
+    """Thread-safe registry of counters, gauges and streaming histograms.
+
+    Counters and gauges are guarded by a fixed set of lock shards chosen by
+    metric name, and each histogram carries its own lock, so unrelated
+    metrics never contend and a scrape never blocks every writer at once.
+    """
+
+    LOCK_SHARDS = 16
+
     def __init__(self) -> None:
         self._lock = Lock()
+        self._shard_locks = [Lock() for _ in range(self.LOCK_SHARDS)]
         self._counters: dict[str, float] = defaultdict(float)
         self._gauges: dict[str, float] = defaultdict(float)
-        self._histograms: dict[str, list[float]] = defaultdict(list)
+        self._histograms: dict[str, StreamingHistogram] = {}
 
     def inc(self, name: str, amount: float = 1.0) -> None:
-        with self._lock:
+        with self._shard_lock(name):
             self._counters[name] += amount
 
     def set_gauge(self, name: str, value: float) -> None:
-        with self._lock:
+        with self._shard_lock(name):
             self._gauges[name] = value
 
     def observe(self, name: str, value: float) -> None:
-        with self._lock:
-            self._histograms[name].append(float(value))
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, StreamingHistogram())
+        histogram.observe(float(value))
 
     def snapshot(self) -> dict[str, dict[str, float]]:
         with self._lock:
-            histogram_avg = {
-                f"{name}_avg": (sum(values) / len(values) if values else 0.0)
-                for name, values in self._histograms.items()
-            }
-            histogram_count = {f"{name}_count": float(len(values)) for name, values in self._histograms.items()}
-            return {
-                "counters": dict(self._counters),
-                "gauges": dict(self._gauges),
-                "histograms": {**histogram_avg, **histogram_count},
-            }
+            histograms = dict(self._histograms)
+        histogram_values: dict[str, float] = {}
+        for name, histogram in histograms.items():
+            for suffix, value in histogram.summary().items():
+                histogram_values[f"{name}_{suffix}"] = value
+        return {
+            "counters": dict(self._counters),
+            "gauges": dict(self._gauges),
+            "histograms": histogram_values,
+        }
 
     def to_prometheus(self) -> str:
         snapshot = self.snapshot()
@@ -48,5 +140,8 @@ class RuntimeMetrics:
                 lines.append(f"{sanitized} {value}")
         return "\n".join(lines) + "\n"
 
+    def _shard_lock(self, name: str) -> Lock:
+        return self._shard_locks[hash(name) % self.LOCK_SHARDS]
+
 
 runtime_metrics = RuntimeMetrics()
@@ -19,7 +19,7 @@ from langchain_openai import ChatOpenAI
 from models.schemas import AgentType, FlowConfig, LLMProvider, NodeConfig
 from observability.logging import log_structured
 from observability.metrics import metrics_store
-from orchestrator.event_stream import make_event, publish_event
+from orchestrator.event_stream import make_event, publish_event, publish_event_threadsafe
 from tools.runtime_tools import resolve_tools
 
 
@@ -27,6 +27,7 @@ logger = logging.getLogger("agentos-orchestrator")
 
 
 DEFAULT_TEMPERATURE = 0.2
+PUBLISH_TIMEOUT_SECONDS = 10.0
 
 
 class ExecutionCancelledError(RuntimeError):
@@ -86,7 +87,7 @@ def _publish_event_sync(
         loop = asyncio.get_running_loop()
         loop.create_task(publish_event(session_id, event))
     except RuntimeError:
-        asyncio.run(publish_event(session_id, event))
+        publish_event_threadsafe(session_id, event).result(timeout=PUBLISH_TIMEOUT_SECONDS)
 
 
 def _make_step_callback(
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import json
 import logging
 import os
+import threading
 from datetime import datetime
 from typing import AsyncGenerator
 
@@ -14,11 +17,179 @@ from models.schemas import AgentEvent
 from observability.logging import log_structured
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+REDIS_MAX_CONNECTIONS = int(os.getenv("EVENT_STREAM_REDIS_MAX_CONNECTIONS", "16"))
+SUBSCRIBER_QUEUE_SIZE = int(os.getenv("EVENT_STREAM_SUBSCRIBER_QUEUE_SIZE", "256"))
+SUBSCRIBE_TIMEOUT_SECONDS = float(os.getenv("EVENT_STREAM_SUBSCRIBE_TIMEOUT_SECONDS", "10"))
+SESSION_CHANNEL_PREFIX = "session:"
+TERMINAL_EVENT_TYPES = frozenset({"done", "error"})
 logger = logging.getLogger("agentos-orchestrator")
 
+# Clientes asyncio ficam presos ao event loop que os criou, então há um cliente
+# (com pool) e um hub por loop. Uma tarefa sentinela fecha os dois quando o loop
+# termina (``asyncio.run`` cancela as tarefas pendentes antes de fechar o loop).
+_clients: dict[asyncio.AbstractEventLoop, Redis] = {}
+_hubs: dict[asyncio.AbstractEventLoop, SessionEventHub] = {}
+_sentinels: dict[asyncio.AbstractEventLoop, asyncio.Task[None]] = {}
+
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_lock = threading.Lock()
+
 
 def _get_redis_client() -> Redis:
-    return Redis.from_url(REDIS_URL, decode_responses=True)
+    """Retorna o cliente compartilhado (pool de conexões) do event loop atual."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = Redis.from_url(REDIS_URL, decode_responses=True, max_connections=REDIS_MAX_CONNECTIONS)
+        _clients[loop] = client
+        _ensure_loop_cleanup(loop)
+    return client
+
+
+def _ensure_loop_cleanup(loop: asyncio.AbstractEventLoop) -> None:
+    if loop not in _sentinels:
+        _sentinels[loop] = loop.create_task(_close_on_loop_exit(loop))
+
+
+async def _close_on_loop_exit(loop: asyncio.AbstractEventLoop) -> None:
+    try:
+        await asyncio.Event().wait()
+    finally:
+        _sentinels.pop(loop, None)
+        hub = _hubs.pop(loop, None)
+        if hub is not None:
+            await hub.close()
+        client = _clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Loop de longa duração para publicar a partir de código síncrono."""
+    global _background_loop
+    with _background_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="event-stream-publisher", daemon=True).start()
+            _background_loop = loop
+        return _background_loop
+
+
+class SessionEventHub:
+    """Um único ``PSUBSCRIBE session:*`` distribuído para filas asyncio por sessão.
+
+    Cada viewer recebe uma fila limitada a ``queue_size``. Um consumidor lento
+    com a fila cheia perde o evento mais antigo, nunca o mais novo, então
+    ``done``/``error`` sempre chegam. Mensagens de sessões sem viewers são
+    descartadas sem desserializar. ``subscribe`` só retorna depois que o
+    Redis confirma o PSUBSCRIBE (ou levanta ``TimeoutError``). Se a conexão cair, cada viewer recebe um
+    evento terminal ``error`` (eventos publicados durante a queda seriam
+    perdidos) e o leitor reconecta com backoff.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        *,
+        queue_size: int = SUBSCRIBER_QUEUE_SIZE,
+        subscribe_timeout_seconds: float = SUBSCRIBE_TIMEOUT_SECONDS,
+    ) -> None:
+        self._redis = redis
+        self.queue_size = max(1, queue_size)
+        self.subscribe_timeout_seconds = subscribe_timeout_seconds
+        self._subscribers: dict[str, set[asyncio.Queue[AgentEvent]]] = {}
+        self._reader: asyncio.Task[None] | None = None
+        self._ready = asyncio.Event()
+        self.dropped_events = 0
+
+    async def subscribe(self, session_id: str) -> asyncio.Queue[AgentEvent]:
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.create_task(self._read_forever())
+        await asyncio.wait_for(self._ready.wait(), timeout=self.subscribe_timeout_seconds)
+        queue: asyncio.Queue[AgentEvent] = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(session_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, session_id: str, queue: asyncio.Queue[AgentEvent]) -> None:
+        queues = self._subscribers.get(session_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[session_id]
+
+    def dispatch(self, channel: str, data: str) -> None:
+        queues = self._subscribers.get(channel.removeprefix(SESSION_CHANNEL_PREFIX))
+        if not queues:
+            return
+        event = AgentEvent.model_validate(json.loads(data))
+        for queue in queues:
+            self._offer(queue, event)
+
+    def disconnect_subscribers(self, reason: str) -> None:
+        """Encerra todos os viewers com um evento ``error``; eles não podem confiar no stream."""
+        subscribers, self._subscribers = self._subscribers, {}
+        for session_id, queues in subscribers.items():
+            event = make_event(session_id, "system", "event_stream", "error", {"error": reason})
+            for queue in queues:
+                self._offer(queue, event)
+
+    async def close(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+            self._reader = None
+        self.disconnect_subscribers("event stream closed")
+
+    def _offer(self, queue: asyncio.Queue[AgentEvent], event: AgentEvent) -> None:
+        if queue.full():
+            queue.get_nowait()
+            self.dropped_events += 1
+            log_structured(logger, "event_dropped_slow_consumer", session_id=event.session_id, agent_id=event.agent_id)
+        queue.put_nowait(event)
+
+    async def _read_forever(self) -> None:
+        backoff = 0.5
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.psubscribe(f"{SESSION_CHANNEL_PREFIX}*")
+                async for message in pubsub.listen():
+                    message_type = message.get("type")
+                    if message_type == "psubscribe":
+                        self._ready.set()
+                        backoff = 0.5
+                        continue
+                    if message_type != "pmessage":
+                        continue
+                    try:
+                        self.dispatch(message["channel"], message["data"])
+                    except (ValueError, TypeError) as exc:
+                        log_structured(logger, "event_stream_invalid_message", agent_id="system", error=str(exc))
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                log_structured(logger, "event_stream_subscriber_error", agent_id="system", error=str(exc))
+                self._ready.clear()
+                self.disconnect_subscribers(f"event stream disconnected: {exc}")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 10.0)
+            finally:
+                self._ready.clear()
+                await pubsub.aclose()
+
+
+def _get_event_hub() -> SessionEventHub:
+    loop = asyncio.get_running_loop()
+    hub = _hubs.get(loop)
+    if hub is None:
+        hub = SessionEventHub(_get_redis_client())
+        _hubs[loop] = hub
+        _ensure_loop_cleanup(loop)
+    return hub
 
 
 def make_event(
@@ -42,31 +213,26 @@ def make_event(
 async def publish_event(session_id: str, event: AgentEvent) -> None:
     """Publica evento em canal Redis session:{session_id}."""
     redis = _get_redis_client()
-    try:
-        channel = f"session:{session_id}"
-        await redis.publish(channel, event.model_dump_json())
-        log_structured(logger, "event_published", session_id=session_id, agent_id=event.agent_id)
-    finally:
-        await redis.close()
+    channel = f"{SESSION_CHANNEL_PREFIX}{session_id}"
+    await redis.publish(channel, event.model_dump_json())
+    log_structured(logger, "event_published", session_id=session_id, agent_id=event.agent_id)
+
+
+def publish_event_threadsafe(session_id: str, event: AgentEvent) -> concurrent.futures.Future[None]:
+    """Publica a partir de código síncrono usando o loop de fundo compartilhado (e seu pool)."""
+    return asyncio.run_coroutine_threadsafe(publish_event(session_id, event), _get_background_loop())
 
 
 async def subscribe_events(session_id: str) -> AsyncGenerator[AgentEvent, None]:
     """Escuta eventos de uma sessão até receber done/error."""
-    redis = _get_redis_client()
-    pubsub = redis.pubsub()
-    channel = f"session:{session_id}"
+    hub = _get_event_hub()
+    queue = await hub.subscribe(session_id)
     try:
-        await pubsub.subscribe(channel)
-        async for message in pubsub.listen():
-            if message.get("type") != "message":
-                continue
-            data = json.loads(message["data"])
-            event = AgentEvent.model_validate(data)
+        while True:
+            event = await queue.get()
             log_structured(logger, "event_received", session_id=session_id, agent_id=event.agent_id)
             yield event
-            if event.event_type in {"done", "error"}:
+            if event.event_type in TERMINAL_EVENT_TYPES:
                 break
     finally:
-        await pubsub.unsubscribe(channel)
-        await pubsub.close()
-        await redis.close()
+        hub.unsubscribe(session_id, queue)
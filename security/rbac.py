@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import itertools
 from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import Iterable
+from typing import Iterable, Mapping
 
 
 class Permission(StrEnum):
@@ -37,10 +38,81 @@ class RBACContext:
     scopes: tuple[str, ...] = ("tenant",)
 
 
+_PERMISSION_BITS: dict[Permission, int] = {permission: 1 << bit for bit, permission in enumerate(Permission)}
+
+
 @dataclass(frozen=True)
 class RolePolicy:
     permissions: frozenset[Permission]
     scopes: frozenset[str] = field(default_factory=lambda: frozenset({"tenant"}))
+    inherits: frozenset[str] = field(default_factory=frozenset)
+
+
+@dataclass(frozen=True)
+class EffectivePermissions:
+    """Permissions and scopes granted by a set of roles, with permissions packed into a bitmask."""
+
+    permission_mask: int
+    scopes: frozenset[str]
+
+    def allows(self, permission: Permission) -> bool:
+        return bool(self.permission_mask & _PERMISSION_BITS[permission])
+
+
+class RBACIndex:
+    """Immutable, versioned compilation of role policies.
+
+    Inheritance is flattened once at build time, so each role maps straight to
+    its effective permissions. Results for whole role sets are memoized up to
+    ``memo_size`` distinct sets; the memo belongs to the index, so replacing
+    the index drops it too.
+    """
+
+    def __init__(self, role_policies: Mapping[str, RolePolicy], *, version: int = 0, memo_size: int = 1024) -> None:
+        self.version = version
+        self.memo_size = max(1, memo_size)
+        self._roles = {role: self._compile(role, role_policies, ()) for role in role_policies}
+        self._memo: dict[frozenset[str], EffectivePermissions | None] = {}
+
+    def resolve(self, roles: Iterable[str]) -> EffectivePermissions | None:
+        key = frozenset(roles)
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+        compiled = [self._roles[role] for role in key if role in self._roles]
+        effective: EffectivePermissions | None = None
+        if compiled:
+            mask = 0
+            for role in compiled:
+                mask |= role.permission_mask
+            effective = EffectivePermissions(
+                permission_mask=mask,
+                scopes=frozenset(itertools.chain.from_iterable(role.scopes for role in compiled)),
+            )
+        if len(self._memo) >= self.memo_size:
+            self._memo.clear()
+        self._memo[key] = effective
+        return effective
+
+    @classmethod
+    def _compile(
+        cls, role: str, role_policies: Mapping[str, RolePolicy], chain: tuple[str, ...]
+    ) -> EffectivePermissions:
+        if role in chain:
+            raise ValueError(f"RBAC role inheritance cycle: {' -> '.join((*chain, role))}")
+        policy = role_policies.get(role)
+        if policy is None:
+            raise ValueError(f"RBAC role '{chain[-1]}' inherits unknown role '{role}'")
+        mask = 0
+        for permission in policy.permissions:
+            mask |= _PERMISSION_BITS[permission]
+        scopes = set(policy.scopes)
+        for parent in policy.inherits:
+            inherited = cls._compile(parent, role_policies, (*chain, role))
+            mask |= inherited.permission_mask
+            scopes |= inherited.scopes
+        return EffectivePermissions(permission_mask=mask, scopes=frozenset(scopes))
 
 
 DEFAULT_ROLE_POLICIES: dict[str, RolePolicy] = {
@@ -83,10 +155,28 @@ DEFAULT_ROLE_POLICIES: dict[str, RolePolicy] = {
 
 
 class RBACMiddleware:
-    """Central authorization gate for API and service-level access checks."""
+    """Central authorization gate for API and service-level access checks.
+
+    Role policies are compiled into an ``RBACIndex`` up front. ``reload``
+    builds a new index and swaps it in with one attribute assignment, so a
+    concurrent ``authorize`` sees either the old or the new policies, never
+    a mix.
+    """
 
     def __init__(self, role_policies: dict[str, RolePolicy] | None = None) -> None:
         self._role_policies = role_policies or DEFAULT_ROLE_POLICIES
+        self._index = RBACIndex(self._role_policies)
+
+    @property
+    def version(self) -> int:
+        return self._index.version
+
+    def reload(self, role_policies: dict[str, RolePolicy]) -> int:
+        """Compiles and atomically installs new role policies; returns the new index version."""
+        index = RBACIndex(role_policies, version=self._index.version + 1)
+        self._role_policies = role_policies
+        self._index = index
+        return index.version
 
     def context_from_user(self, user: dict, *, fallback_roles: Iterable[str] = ("viewer",)) -> RBACContext:
         role_value = user.get("role")
@@ -96,19 +186,16 @@ class RBACMiddleware:
         return RBACContext(user_id=str(user.get("id", "unknown")), roles=roles, tenant_id=tenant_id, scopes=scopes)
 
     def authorize(self, *, context: RBACContext, permission: Permission, resource: RBACResource) -> None:
-        policies = [self._role_policies.get(role) for role in context.roles]
-        effective = [policy for policy in policies if policy is not None]
-        if not effective:
+        effective = self._index.resolve(context.roles)
+        if effective is None:
             raise RBACAuthorizationError("No RBAC policy is attached to the caller role")
 
-        allowed_permissions = {perm for policy in effective for perm in policy.permissions}
-        if permission not in allowed_permissions:
+        if not effective.allows(permission):
             raise RBACAuthorizationError(f"Permission '{permission}' is required for this operation")
 
-        allowed_scopes = {scope for policy in effective for scope in policy.scopes}
-        if resource.scope not in allowed_scopes:
+        if resource.scope not in effective.scopes:
             raise RBACAuthorizationError(
-                f"Resource scope '{resource.scope}' is not accessible with caller scope {sorted(allowed_scopes)}"
+                f"Resource scope '{resource.scope}' is not accessible with caller scope {sorted(effective.scopes)}"
             )
 
         self._enforce_tenant_isolation(context=context, resource=resource)
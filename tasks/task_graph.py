@@ -27,9 +27,20 @@ class TaskNode:
 
 
 class TaskGraph:
+    """Dependency graph that tracks readiness with per-task remaining-dependency counters.
+
+    Completing a task only touches its direct dependents, so draining a plan
+    costs O(V + E) instead of rescanning every task on each completion.
+    """
+
     def __init__(self) -> None:
         self._tasks: dict[str, TaskNode] = {}
         self._ready_heap: list[tuple[int, str]] = []
+        self._remaining_dependencies: dict[str, int] = {}
+        self._dependents: dict[str, set[str]] = {}
+        self._incomplete_count = 0
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_workers = 0
 
     def add_task(
         self,
@@ -49,8 +60,20 @@ class TaskGraph:
             required_skill=required_skill,
             payload=payload or {},
         )
+        previous = self._tasks.get(task_id)
+        if previous is not None:
+            self._unlink(previous)
         self._tasks[task_id] = node
-        self._refresh_ready(task_id)
+        self._incomplete_count += 1
+        remaining = 0
+        for dep in node.dependencies:
+            self._dependents.setdefault(dep, set()).add(task_id)
+            dependency = self._tasks.get(dep)
+            if dependency is None or dependency.state != TaskState.COMPLETED:
+                remaining += 1
+        self._remaining_dependencies[task_id] = remaining
+        if remaining == 0:
+            heappush(self._ready_heap, (node.priority, task_id))
 
     def spawn_task(self, *, parent_task_id: str, task_id: str, description: str, priority: int = 50, payload: dict[str, Any] | None = None, required_skill: str | None = None) -> None:
         self.add_task(
@@ -62,13 +85,13 @@ class TaskGraph:
             required_skill=required_skill,
         )
 
-    def _refresh_ready(self, task_id: str) -> None:
-        task = self._tasks[task_id]
-        if task.state != TaskState.PENDING:
-            return
-        unresolved = [dep for dep in task.dependencies if self._tasks.get(dep, TaskNode(dep, "")).state != TaskState.COMPLETED]
-        if not unresolved:
-            heappush(self._ready_heap, (task.priority, task.task_id))
+    def _unlink(self, node: TaskNode) -> None:
+        for dep in node.dependencies:
+            dependents = self._dependents.get(dep)
+            if dependents is not None:
+                dependents.discard(node.task_id)
+        if node.state != TaskState.COMPLETED:
+            self._incomplete_count -= 1
 
     def get_ready_tasks(self, limit: int | None = None) -> list[TaskNode]:
         ready: list[TaskNode] = []
@@ -83,16 +106,36 @@ class TaskGraph:
 
     def mark_completed(self, task_id: str) -> None:
         task = self._tasks[task_id]
+        if task.state == TaskState.COMPLETED:
+            return
         task.state = TaskState.COMPLETED
-        for node in self._tasks.values():
-            self._refresh_ready(node.task_id)
+        self._incomplete_count -= 1
+        for dependent_id in self._dependents.get(task_id, ()):
+            remaining = self._remaining_dependencies[dependent_id] - 1
+            self._remaining_dependencies[dependent_id] = remaining
+            dependent = self._tasks[dependent_id]
+            if remaining == 0 and dependent.state == TaskState.PENDING:
+                heappush(self._ready_heap, (dependent.priority, dependent_id))
 
     def execute_parallel(self, worker: Callable[[TaskNode], Any], max_workers: int = 4) -> list[Any]:
         batch = self.get_ready_tasks(limit=max_workers)
         if not batch:
             return []
-        with ThreadPoolExecutor(max_workers=max_workers) as pool:
-            return list(pool.map(worker, batch))
+        return list(self._get_executor(max_workers).map(worker, batch))
+
+    def _get_executor(self, max_workers: int) -> ThreadPoolExecutor:
+        if self._executor is None or self._executor_workers != max_workers:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task-graph")
+            self._executor_workers = max_workers
+        return self._executor
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._executor_workers = 0
 
     def pending_count(self) -> int:
-        return sum(1 for task in self._tasks.values() if task.state != TaskState.COMPLETED)
+        return self._incomplete_count
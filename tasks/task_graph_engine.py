@@ -5,10 +5,11 @@ from __future__ import annotations
 import json
 import os
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from heapq import heappop, heappush
+from heapq import heapify, heappop, heappush
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from communication.event_bus import Event, EventBus
 from core.task_queue import DistributedTaskQueue, QueueTask
@@ -36,7 +37,17 @@ class TaskGraphSafetyLimits:
 
 
 class TaskGraphEngine:
-    """Converts high-level plans into executable queue tasks with dependency-aware parallelism."""
+    """Converts high-level plans into executable queue tasks with dependency-aware parallelism.
+
+    ``checkpoint_mode="snapshot"`` rewrites the full graph every
+    ``checkpoint_interval`` transitions. ``checkpoint_mode="wal"`` appends only
+    the changed tasks to ``<checkpoint_path>.wal``, fsyncs once per public call
+    (group commit) or every ``checkpoint_interval`` records, and compacts the
+    log into a snapshot every ``wal_compaction_interval`` records. Recovery
+    loads the snapshot and replays the log on top of it.
+    """
+
+    CHECKPOINT_MODES = {"snapshot", "wal"}
 
     def __init__(
         self,
@@ -48,7 +59,11 @@ class TaskGraphEngine:
         safety_limits: TaskGraphSafetyLimits | None = None,
         event_bus: EventBus | None = None,
         human_validation: HumanValidationController | None = None,
+        checkpoint_mode: str = "snapshot",
+        wal_compaction_interval: int = 1000,
     ) -> None:
+        if checkpoint_mode not in self.CHECKPOINT_MODES:
+            raise ValueError(f"checkpoint_mode must be one of {sorted(self.CHECKPOINT_MODES)}")
         self.queue = queue
         self.safety_limits = safety_limits or TaskGraphSafetyLimits()
         self.event_bus = event_bus
@@ -65,8 +80,21 @@ class TaskGraphEngine:
         self._checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
         self._checkpoint_interval = max(checkpoint_interval, 1)
         self._ops_since_checkpoint = 0
+        self._checkpoint_mode = checkpoint_mode
+        self._wal_path = (
+            self._checkpoint_path.with_suffix(f"{self._checkpoint_path.suffix}.wal")
+            if self._checkpoint_path and checkpoint_mode == "wal"
+            else None
+        )
+        self._wal_file: Any = None
+        self._wal_compaction_interval = max(wal_compaction_interval, 1)
+        self._wal_records_since_compaction = 0
+        self._wal_records_since_sync = 0
+        self._group_commit_depth = 0
 
-        if auto_resume and self._checkpoint_path and self._checkpoint_path.exists():
+        if auto_resume and self._checkpoint_path and (
+            self._checkpoint_path.exists() or (self._wal_path is not None and self._wal_path.exists())
+        ):
             self.load_checkpoint()
 
     def add_task(
@@ -95,24 +123,29 @@ class TaskGraphEngine:
             self._children.setdefault(dep, set()).add(task_id)
         if self._dependencies_satisfied(task):
             heappush(self._ready, (task.priority, task_id))
-        self._record_state_transition()
+        self._record_state_transition(task_id)
         return task
 
     def ingest_plan(self, plan: list[dict[str, Any]]) -> list[GraphTask]:
         tasks = []
-        for item in plan:
-            tasks.append(
-                self.add_task(
-                    task_id=item.get("task_id", f"task-{uuid.uuid4().hex[:10]}"),
-                    name=item.get("name", item.get("description", "planned-task")),
-                    payload=item.get("payload", {}),
-                    dependencies=item.get("dependencies", []),
-                    priority=int(item.get("priority", 50)),
+        with self._group_commit():
+            for item in plan:
+                tasks.append(
+                    self.add_task(
+                        task_id=item.get("task_id", f"task-{uuid.uuid4().hex[:10]}"),
+                        name=item.get("name", item.get("description", "planned-task")),
+                        payload=item.get("payload", {}),
+                        dependencies=item.get("dependencies", []),
+                        priority=int(item.get("priority", 50)),
+                    )
                 )
-            )
         return tasks
 
     def schedule_ready_tasks(self, limit: int | None = None) -> list[QueueTask]:
+        with self._group_commit():
+            return self._schedule_ready_tasks(limit)
+
+    def _schedule_ready_tasks(self, limit: int | None) -> list[QueueTask]:
         scheduled: list[QueueTask] = []
         self._execution_pointer["schedule_iterations"] += 1
         while self._ready and (limit is None or len(scheduled) < limit):
@@ -135,11 +168,15 @@ class TaskGraphEngine:
             scheduled.append(queue_task)
             self._execution_pointer["tasks_scheduled_total"] += 1
             self._execution_pointer["last_scheduled_task_id"] = task_id
-            self._record_state_transition()
+            self._record_state_transition(task_id)
         self._maybe_checkpoint()
         return scheduled
 
     def mark_task_completed(self, task_id: str, spawned_tasks: list[dict[str, Any]] | None = None) -> None:
+        with self._group_commit():
+            self._mark_task_completed(task_id, spawned_tasks)
+
+    def _mark_task_completed(self, task_id: str, spawned_tasks: list[dict[str, Any]] | None) -> None:
         task = self._tasks[task_id]
         task.status = "completed"
         if spawned_tasks:
@@ -156,39 +193,91 @@ class TaskGraphEngine:
             child = self._tasks[child_id]
             if child.status == "pending" and self._dependencies_satisfied(child):
                 heappush(self._ready, (child.priority, child.task_id))
-        self._record_state_transition()
+        self._record_state_transition(task_id)
 
     def _dependencies_satisfied(self, task: GraphTask) -> bool:
         return all(self._tasks.get(dep) and self._tasks[dep].status == "completed" for dep in task.dependencies)
 
-    def _record_state_transition(self) -> None:
+    def _record_state_transition(self, task_id: str) -> None:
         self._execution_pointer["event_seq"] += 1
         self._ops_since_checkpoint += 1
+        if self._wal_path is not None:
+            self._append_wal_record(task_id)
+            return
         self._maybe_checkpoint()
 
     def _maybe_checkpoint(self) -> None:
         if not self._checkpoint_path:
             return
+        if self._wal_path is not None:
+            if self._group_commit_depth == 0 and self._wal_records_since_sync:
+                self._sync_wal()
+            return
         if self._ops_since_checkpoint < self._checkpoint_interval:
             return
         self.save_checkpoint()
         self._ops_since_checkpoint = 0
 
+    @contextmanager
+    def _group_commit(self) -> Iterator[None]:
+        """Defers WAL fsyncs until the outermost public call finishes."""
+        self._group_commit_depth += 1
+        try:
+            yield
+        finally:
+            self._group_commit_depth -= 1
+            if self._group_commit_depth == 0:
+                self._maybe_checkpoint()
+
+    def _append_wal_record(self, task_id: str) -> None:
+        if self._wal_file is None:
+            self._wal_path.parent.mkdir(parents=True, exist_ok=True)
+            self._wal_file = self._wal_path.open("a", encoding="utf-8")
+        record = {
+            "seq": self._execution_pointer["event_seq"],
+            "task": self._task_record(self._tasks[task_id]),
+            "execution_pointer": dict(self._execution_pointer),
+        }
+        self._wal_file.write(json.dumps(record, sort_keys=True) + "\n")
+        self._wal_file.flush()
+        self._wal_records_since_compaction += 1
+        self._wal_records_since_sync += 1
+        if self._wal_records_since_compaction >= self._wal_compaction_interval:
+            self.save_checkpoint()
+        elif self._group_commit_depth == 0 and self._wal_records_since_sync >= self._checkpoint_interval:
+            self._sync_wal()
+
+    def _sync_wal(self) -> None:
+        if self._wal_file is None:
+            return
+        os.fsync(self._wal_file.fileno())
+        self._wal_records_since_sync = 0
+        self._ops_since_checkpoint = 0
+
+    def close(self) -> None:
+        """Flushes pending WAL records to disk and releases the log handle."""
+        if self._wal_file is None:
+            return
+        self._sync_wal()
+        self._wal_file.close()
+        self._wal_file = None
+
+    @staticmethod
+    def _task_record(task: GraphTask) -> dict[str, Any]:
+        return {
+            "task_id": task.task_id,
+            "name": task.name,
+            "payload": task.payload,
+            "dependencies": sorted(task.dependencies),
+            "priority": task.priority,
+            "status": task.status,
+        }
+
     def _checkpoint_payload(self) -> dict[str, Any]:
         pending_tasks = sorted(task_id for task_id, task in self._tasks.items() if task.status in {"pending", "queued"})
         completed_tasks = sorted(task_id for task_id, task in self._tasks.items() if task.status == "completed")
         return {
-            "tasks": {
-                task_id: {
-                    "task_id": task.task_id,
-                    "name": task.name,
-                    "payload": task.payload,
-                    "dependencies": sorted(task.dependencies),
-                    "priority": task.priority,
-                    "status": task.status,
-                }
-                for task_id, task in self._tasks.items()
-            },
+            "tasks": {task_id: self._task_record(task) for task_id, task in self._tasks.items()},
             "children": {task_id: sorted(children) for task_id, children in self._children.items()},
             "ready": [[priority, task_id] for priority, task_id in self._ready],
             "pending_tasks": pending_tasks,
@@ -212,12 +301,31 @@ class TaskGraphEngine:
             os.fsync(parent_fd)
         finally:
             os.close(parent_fd)
+        if self._wal_path is not None:
+            self._truncate_wal()
+
+    def _truncate_wal(self) -> None:
+        # Records up to the snapshot's event_seq are skipped on replay, so a
+        # crash between the snapshot rename and this truncate is harmless.
+        if self._wal_file is not None:
+            self._wal_file.close()
+            self._wal_file = None
+        with self._wal_path.open("w", encoding="utf-8") as wal_file:
+            wal_file.flush()
+            os.fsync(wal_file.fileno())
+        self._wal_records_since_compaction = 0
+        self._wal_records_since_sync = 0
 
     def load_checkpoint(self) -> bool:
-        if not self._checkpoint_path or not self._checkpoint_path.exists():
+        if not self._checkpoint_path:
+            return False
+        has_wal = self._wal_path is not None and self._wal_path.exists()
+        if not self._checkpoint_path.exists() and not has_wal:
             return False
-        with self._checkpoint_path.open("r", encoding="utf-8") as checkpoint_file:
-            payload = json.load(checkpoint_file)
+        payload: dict[str, Any] = {}
+        if self._checkpoint_path.exists():
+            with self._checkpoint_path.open("r", encoding="utf-8") as checkpoint_file:
+                payload = json.load(checkpoint_file)
 
         tasks_payload = payload.get("tasks", {})
         self._tasks = {
@@ -246,7 +354,50 @@ class TaskGraphEngine:
         }
         self._execution_pointer.update(payload.get("execution_pointer", {}))
         self._ops_since_checkpoint = 0
+        if has_wal:
+            self._replay_wal()
         return True
+
+    def _replay_wal(self) -> None:
+        snapshot_seq = int(self._execution_pointer.get("event_seq", 0))
+        replayed = 0
+        valid_bytes = 0
+        with self._wal_path.open("rb") as wal_file:
+            for line in wal_file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn tail from a crash mid-append: drop it so new records start on a clean line.
+                    os.truncate(self._wal_path, valid_bytes)
+                    break
+                valid_bytes += len(line)
+                if int(record.get("seq", 0)) <= snapshot_seq:
+                    continue
+                task_data = record["task"]
+                self._tasks[task_data["task_id"]] = GraphTask(
+                    task_id=task_data["task_id"],
+                    name=task_data["name"],
+                    payload=task_data.get("payload", {}),
+                    dependencies=set(task_data.get("dependencies", [])),
+                    priority=int(task_data.get("priority", 50)),
+                    status=task_data.get("status", "pending"),
+                )
+                self._execution_pointer.update(record.get("execution_pointer", {}))
+                replayed += 1
+        if not replayed:
+            return
+        self._children = {}
+        for task in self._tasks.values():
+            for dep in task.dependencies:
+                self._children.setdefault(dep, set()).add(task.task_id)
+        self._ready = [
+            (task.priority, task.task_id)
+            for task in self._tasks.values()
+            if task.status == "pending" and self._dependencies_satisfied(task)
+        ]
+        heapify(self._ready)
+        self._wal_records_since_compaction = replayed
+
     def _resolve_depth(self, parent_task_id: str | None) -> int:
         if parent_task_id is None:
             return 0
@@ -1,4 +1,4 @@
-from core.context_manager import ContextWindowConfig, LLMContextManager
+from core.context_manager import CachedTokenCounter, ContextWindowConfig, HeuristicTokenCounter, LLMContextManager
 from memory.vector_memory import VectorMemory
 
 
@@ -53,3 +53,65 @@ def test_assemble_context_pipeline_respects_budget():
     assert any(item.kind == "summary" for item in context)
     total_tokens = sum(manager._estimate_tokens(manager._record_text(item)) for item in context)
     assert total_tokens <= manager.config.prompt_budget_tokens
+
+
+class _WordCounter:
+    """Counts one token per whitespace-separated word and records every call."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def count(self, text: str) -> int:
+        self.calls += 1
+        return len(text.split())
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        return " ".join(text.split()[:max_tokens])
+
+
+def test_cached_token_counter_counts_each_text_once():
+    inner = _WordCounter()
+    counter = CachedTokenCounter(inner, max_entries=2)
+
+    assert counter.count("a b c") == 3
+    assert counter.count("a b c") == 3
+    assert inner.calls == 1 and counter.hits == 1
+
+    counter.count("d")
+    counter.count("e f")
+    assert counter.count("a b c") == 3
+    assert inner.calls == 4
+
+
+def test_context_manager_packs_to_exact_budget_with_pluggable_counter():
+    memory = VectorMemory()
+    memory.store_knowledge({"transcript": " ".join(["history"] * 600)})
+    memory.store_task_result("4", {"summary": "rollback restored checkout"})
+
+    counter = _WordCounter()
+    manager = LLMContextManager(
+        memory=memory,
+        config=ContextWindowConfig(max_context_tokens=512, reserved_response_tokens=256),
+        token_counter=counter,
+    )
+    context = manager.assemble_context(user_input=["stabilize checkout"])
+
+    summaries = [item for item in context if item.kind == "summary"]
+    assert summaries
+    total_tokens = sum(counter.count(manager._record_text(item)) for item in context)
+    assert total_tokens <= manager.config.prompt_budget_tokens
+
+
+def test_context_manager_skips_summarization_when_everything_fits():
+    memory = VectorMemory()
+    memory.store_knowledge({"transcript": " ".join(["history"] * 200)})
+
+    manager = LLMContextManager(
+        memory=memory,
+        config=ContextWindowConfig(max_context_tokens=4096, reserved_response_tokens=256),
+        token_counter=CachedTokenCounter(HeuristicTokenCounter()),
+    )
+    context = manager.assemble_context(user_input=["review history"])
+
+    assert not any(item.kind == "summary" for item in context)
+    assert any(item.kind == "knowledge" for item in context)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+
 from communication.event_bus import EventBus
 from core.execution_gateway import ExecutionGateway, GatewayPolicy
 from core.retry_engine import RetryEngine, RetryPolicy
@@ -62,6 +65,84 @@ def test_agent_worker_task_execution_uses_retry_engine() -> None:
     assert worker.telemetry.processed_tasks == 1
 
 
+class _SlowAsyncHandler:
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def execute_async(self, task: QueueTask) -> dict[str, str]:
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.05 if task.name == "quick" else 60)
+        finally:
+            self.active -= 1
+        return {"task_id": task.task_id}
+
+
+def test_async_agent_worker_bounds_in_flight_tasks_and_drains_on_stop() -> None:
+    queue = DistributedTaskQueue(InMemoryQueueBackend())
+    for idx in range(6):
+        queue.enqueue_task(QueueTask(task_id=f"quick-{idx}", name="quick"))
+    queue.enqueue_task(QueueTask(task_id="stuck", name="stuck"))
+    handler = _SlowAsyncHandler()
+    worker = AgentWorker(
+        worker_id="async-worker",
+        queue=queue,
+        event_bus=EventBus(),
+        task_handler=handler,
+        poll_interval_seconds=0.01,
+        max_in_flight=3,
+        drain_timeout_seconds=0.1,
+    )
+
+    async def _run() -> None:
+        runner = asyncio.create_task(worker.run_async())
+        while handler.calls < 7:
+            await asyncio.sleep(0.01)
+        worker.stop()
+        await runner
+
+    asyncio.run(_run())
+    assert handler.peak == 3
+    assert worker.telemetry.processed_tasks == 6
+    assert handler.active == 0
+    assert queue.ready_size() + queue.delayed_size() == 1
+
+
+def test_async_agent_worker_stops_when_every_slot_is_stuck() -> None:
+    queue = DistributedTaskQueue(InMemoryQueueBackend())
+    for idx in range(3):
+        queue.enqueue_task(QueueTask(task_id=f"stuck-{idx}", name="stuck"))
+    queue.enqueue_task(QueueTask(task_id="waiting", name="quick"))
+    handler = _SlowAsyncHandler()
+    worker = AgentWorker(
+        worker_id="async-worker",
+        queue=queue,
+        event_bus=EventBus(),
+        task_handler=handler,
+        poll_interval_seconds=0.01,
+        max_in_flight=2,
+        drain_timeout_seconds=0.1,
+    )
+
+    async def _run() -> float:
+        runner = asyncio.create_task(worker.run_async())
+        while handler.active < 2:
+            await asyncio.sleep(0.01)
+        started = asyncio.get_running_loop().time()
+        worker.stop()
+        await asyncio.wait_for(runner, timeout=2)
+        return asyncio.get_running_loop().time() - started
+
+    elapsed = asyncio.run(_run())
+    assert elapsed < 1
+    assert handler.calls == 2 and handler.active == 0
+    assert queue.ready_size() + queue.delayed_size() == 4
+
+
 def test_queue_worker_permanent_failures_dead_letter_immediately() -> None:
     retry_engine = RetryEngine(
         policies={"queue_worker": RetryPolicy(max_retries=3, base_delay_seconds=0.0, jitter_ratio=0.0)}
@@ -108,3 +189,67 @@ def test_execution_gateway_retries_external_api_tools(monkeypatch) -> None:
 
     assert result == {"ok": True}
     assert calls["count"] == 3
+
+
+def test_queue_parks_delayed_retries_until_due() -> None:
+    clock = {"now": 1000.0}
+    retry_engine = RetryEngine(
+        policies={"queue_worker": RetryPolicy(max_retries=3, base_delay_seconds=30.0, jitter_ratio=0.0)}
+    )
+    queue = DistributedTaskQueue(
+        InMemoryQueueBackend(),
+        max_retries=3,
+        retry_engine=retry_engine,
+        time_fn=lambda: clock["now"],
+    )
+    queue.enqueue_task(QueueTask(task_id="slow-retry", name="retry"))
+    inflight = queue.dequeue_task(timeout_seconds=0)
+    assert inflight is not None
+
+    queue.fail_task(inflight, error="temporary failure", exc=TimeoutError("temporary failure"))
+
+    assert queue.ready_size() == 0
+    assert queue.delayed_size() == 1
+    assert queue.dequeue_task(timeout_seconds=0) is None
+    assert queue.delayed_size() == 1
+
+    clock["now"] = inflight.metadata["next_attempt_at"]
+    retried = queue.dequeue_task(timeout_seconds=0)
+    assert retried is not None and retried.task_id == "slow-retry"
+    assert queue.delayed_size() == 0
+
+
+def test_inflight_tracking_is_safe_across_dequeue_threads() -> None:
+    clock = {"now": 0.0}
+    queue = DistributedTaskQueue(
+        InMemoryQueueBackend(),
+        queue_high_watermark=10_000,
+        queue_low_watermark=10,
+        visibility_timeout_seconds=1,
+        max_inflight_tasks=10_000,
+        time_fn=lambda: clock["now"],
+    )
+    errors: list[BaseException] = []
+    stop = threading.Event()
+
+    def expire_loop() -> None:
+        try:
+            while not stop.is_set():
+                queue._requeue_expired_inflight()
+        except BaseException as exc:  # pragma: no cover - only reached on regression
+            errors.append(exc)
+
+    expirer = threading.Thread(target=expire_loop)
+    expirer.start()
+    try:
+        for idx in range(3000):
+            task = QueueTask(task_id=f"t{idx}", name="n")
+            queue._mark_dispatched(task)
+            queue.tenant_depth("default")
+            if idx % 2:
+                queue.acknowledge_task(task)
+    finally:
+        stop.set()
+        expirer.join()
+
+    assert errors == []
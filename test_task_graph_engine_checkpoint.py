@@ -68,3 +68,39 @@ def test_checkpoint_write_failure_does_not_corrupt_previous_checkpoint(tmp_path,
         engine.save_checkpoint()
 
     assert checkpoint_path.read_text(encoding="utf-8") == baseline
+
+
+def test_wal_mode_appends_deltas_and_recovers_snapshot_plus_log(tmp_path):
+    checkpoint_path = tmp_path / "graph-checkpoint.json"
+    queue = DistributedTaskQueue(InMemoryQueueBackend())
+    engine = TaskGraphEngine(queue, checkpoint_path=checkpoint_path, checkpoint_mode="wal", wal_compaction_interval=4)
+    wal_path = tmp_path / "graph-checkpoint.json.wal"
+
+    engine.ingest_plan([
+        {"task_id": "prepare", "name": "prepare"},
+        {"task_id": "execute", "name": "execute", "dependencies": ["prepare"]},
+        {"task_id": "report", "name": "report", "dependencies": ["execute"]},
+    ])
+    assert not checkpoint_path.exists()
+    assert len(wal_path.read_text(encoding="utf-8").splitlines()) == 3
+
+    engine.schedule_ready_tasks(limit=1)
+    assert checkpoint_path.exists()
+    assert wal_path.read_text(encoding="utf-8") == ""
+
+    engine.mark_task_completed("prepare")
+    engine.close()
+    with wal_path.open("a", encoding="utf-8") as wal_file:
+        wal_file.write('{"seq": 99, "task": {"task_id"')
+
+    recovered = TaskGraphEngine(
+        DistributedTaskQueue(InMemoryQueueBackend()),
+        checkpoint_path=checkpoint_path,
+        checkpoint_mode="wal",
+    )
+    assert recovered._tasks["prepare"].status == "completed"
+    assert [task.task_id for task in recovered.schedule_ready_tasks()] == ["execute"]
+    recovered.close()
+
+    lines = wal_path.read_text(encoding="utf-8").splitlines()
+    assert all(json.loads(line)["seq"] for line in lines)
@@ -49,6 +49,6 @@ def test_api_failure_does_not_crash_worker() -> None:
 def test_memory_corruption_recovery() -> None:
     memory = VectorMemory()
     memory.store_knowledge({"id": "k1", "content": "stable"})
-    memory._records.append(memory._records[0])  # emulate corruption/duplicate entry
+    memory.add_record(memory.records()[0])  # emulate corruption/duplicate entry
     results = memory.semantic_retrieve("stable", limit=2)
     assert len(results) == 2
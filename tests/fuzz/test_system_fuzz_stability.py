@@ -78,9 +78,9 @@ def test_fuzz_random_memory_corruption_keeps_retrieval_stable() -> None:
 
     for idx in range(20):
         if random.random() < 0.5:
-            memory._records.append(f"corrupt-{idx}")
+            memory.add_record(f"corrupt-{idx}")
         else:
-            memory._records.append(
+            memory.add_record(
                 MemoryRecord(kind="knowledge", payload={"idx": idx}, embedding=["nan", None], timestamp="corrupt")
             )
 
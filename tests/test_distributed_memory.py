@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from memory.distributed_memory import DistributedMemory, MemoryEntry
+
+
+def test_vector_search_ranks_within_namespace_and_survives_restart(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "memory.db")
+    memory = DistributedMemory(db_path)
+    memory.store_task_history(MemoryEntry(key="east", value={"v": 1}, embedding=[1.0, 0.0], namespace="tenant:a:tasks"))
+    memory.store_task_history(MemoryEntry(key="north", value={"v": 2}, embedding=[0.0, 1.0], namespace="tenant:a:tasks"))
+    memory.store_task_history(MemoryEntry(key="other", value={"v": 3}, embedding=[1.0, 0.0], namespace="tenant:b:tasks"))
+
+    results = memory.semantic_vector_search([0.9, 0.1], limit=2, namespace="tenant:a:tasks")
+    assert [item["key"] for item in results] == ["east", "north"]
+    assert results[0]["score"] > results[1]["score"]
+
+    row = sqlite3.connect(db_path).execute("SELECT typeof(embedding_blob) FROM task_history WHERE key = 'east'").fetchone()
+    assert row == ("blob",)
+
+    reopened = DistributedMemory(db_path)
+    assert reopened.semantic_vector_search([1.0, 0.0], limit=1, namespace="tenant:b:tasks")[0]["key"] == "other"
+
+
+def test_vector_index_tracks_deletes_and_external_removals(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "memory.db")
+    memory = DistributedMemory(db_path)
+    for key, embedding in (("a", [1.0, 0.0]), ("b", [0.8, 0.2]), ("c", [0.0, 1.0])):
+        memory.store_task_history(MemoryEntry(key=key, value={}, embedding=embedding))
+    assert memory.semantic_vector_search([1.0, 0.0], limit=1)[0]["key"] == "a"
+
+    assert memory.delete_task_history("a")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DELETE FROM task_history WHERE key = 'b'")
+    assert [item["key"] for item in memory.semantic_vector_search([1.0, 0.0], limit=2)] == ["c"]
+
+
+def test_vector_index_picks_up_rows_written_by_other_connections(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "memory.db")
+    reader = DistributedMemory(db_path)
+    writer = DistributedMemory(db_path)
+    reader.store_task_history(MemoryEntry(key="east", value={"v": 1}, embedding=[1.0, 0.0]))
+    assert reader.semantic_vector_search([0.0, 1.0], limit=1)[0]["key"] == "east"
+
+    writer.store_task_history(MemoryEntry(key="north", value={"v": 2}, embedding=[0.0, 1.0]))
+    assert reader.semantic_vector_search([0.0, 1.0], limit=1)[0]["key"] == "north"
+
+    writer.store_task_history(MemoryEntry(key="east", value={"v": 3}, embedding=[0.0, 1.0]))
+    reader.store_task_history(MemoryEntry(key="west", value={"v": 4}, embedding=[-1.0, 0.0]))
+    results = reader.semantic_vector_search([0.0, 1.0], limit=3)
+    assert {item["key"]: item["value"]["v"] for item in results[:2]} == {"east": 3, "north": 2}
+    assert results[2]["key"] == "west"
@@ -1,5 +1,5 @@
 from core.autoscaling_adapter import AutoscalingSignal, KEDAQueueAdapter, KubernetesHPAAdapter
-from core.quota_ledger import DurableQuotaLedger, InMemoryQuotaStore, QuotaDebit, QuotaExceededError, QuotaPolicy
+from core.quota_ledger import DurableQuotaLedger, InMemoryQuotaStore, QuotaDebit, QuotaExceededError, QuotaPolicy, RedisQuotaStore
 from core.queue_router import QueueShardRouter
 from core.task_queue import DistributedTaskQueue, InMemoryQueueBackend, QueueTask
 from core.token_budget_scheduler import TokenBudgetConfig, TokenBudgetScheduler
@@ -19,6 +19,53 @@ def test_quota_ledger_enforces_limits() -> None:
         raise AssertionError("quota should have been exceeded")
 
 
+class _FakeQuotaRedis:
+    """Runs RedisQuotaStore's debit script as one Python step, counting calls."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.script_calls = 0
+
+    def register_script(self, source: str):
+        assert source == RedisQuotaStore.DEBIT_SCRIPT
+        return self._debit
+
+    def _debit(self, keys: list[str], args: list) -> list:
+        self.script_calls += 1
+        usage = [self.values.get(key, "0") for key in keys[:4]]
+        if keys[4] in self.values:
+            return [b"ok", *usage]
+        amounts = [float(args[0]), float(args[0]), float(args[1]), float(args[1])]
+        names = ["tenant_tokens", "agent_tokens", "daily_cost", "monthly_cost"]
+        if args[2] == "1":
+            for idx, name in enumerate(names):
+                if float(usage[idx]) + amounts[idx] > float(args[3 + idx]):
+                    return [b"exceeded", name.encode()]
+        for idx, key in enumerate(keys[:4]):
+            self.values[key] = str(float(usage[idx]) + amounts[idx])
+        self.values[keys[4]] = args[7]
+        return [b"ok", *(self.values[key] for key in keys[:4])]
+
+
+def test_redis_quota_store_checks_and_debits_in_one_script_call() -> None:
+    redis = _FakeQuotaRedis()
+    ledger = DurableQuotaLedger(
+        RedisQuotaStore(redis),
+        policies={"t1": QuotaPolicy(tenant_token_quota=10, agent_token_quota=8, daily_cost_ceiling=1.0, monthly_cost_ceiling=5.0)},
+    )
+    usage = ledger.debit(QuotaDebit(tenant_id="t1", agent_id="a1", request_id="r1", tokens=5, cost=0.5))
+    assert usage["tenant_tokens"] == 5.0 and redis.script_calls == 1
+
+    assert ledger.debit(QuotaDebit(tenant_id="t1", agent_id="a1", request_id="r1", tokens=5, cost=0.5))["tenant_tokens"] == 5.0
+    try:
+        ledger.debit(QuotaDebit(tenant_id="t1", agent_id="a1", request_id="r2", tokens=4, cost=0.1))
+    except QuotaExceededError as exc:
+        assert str(exc) == "agent token quota exceeded"
+    else:
+        raise AssertionError("agent quota should have been exceeded")
+    assert redis.script_calls == 3
+
+
 def test_queue_router_routes_to_assigned_shard() -> None:
     shards = {
         "task_queue_shard_A": DistributedTaskQueue(InMemoryQueueBackend(), queue_name="a"),
@@ -31,6 +78,48 @@ def test_queue_router_routes_to_assigned_shard() -> None:
     assert router.route_task(task) == "task_queue_shard_B"
 
 
+def test_queue_router_ring_moves_few_tenants_when_a_shard_is_added() -> None:
+    shards = {name: DistributedTaskQueue(InMemoryQueueBackend(), queue_name=name) for name in ("a", "b", "c", "d")}
+    router = QueueShardRouter(shards)
+    tenants = [f"tenant-{idx}" for idx in range(2000)]
+    before = {tenant: router.shard_for_tenant(tenant) for tenant in tenants}
+
+    router.scale_shards({**shards, "e": DistributedTaskQueue(InMemoryQueueBackend(), queue_name="e")})
+    after = {tenant: router.shard_for_tenant(tenant) for tenant in tenants}
+
+    moved = [tenant for tenant in tenants if before[tenant] != after[tenant]]
+    assert all(after[tenant] == "e" for tenant in moved)
+    assert len(moved) < len(tenants) * 0.35
+
+
+def test_queue_router_uses_cached_depth_sample_and_bounds_shard_load() -> None:
+    clock = {"now": 0.0}
+    shards = {name: DistributedTaskQueue(InMemoryQueueBackend(), queue_name=name, queue_high_watermark=1000) for name in ("a", "b")}
+    depth_reads = {"count": 0}
+    for queue in shards.values():
+        original = queue.queue_size
+
+        def counted(original=original) -> int:
+            depth_reads["count"] += 1
+            return original()
+
+        queue.queue_size = counted
+    router = QueueShardRouter(shards, load_factor=1.25, depth_refresh_seconds=5.0, time_fn=lambda: clock["now"])
+
+    for idx in range(40):
+        router.route_task(QueueTask(task_id=f"t{idx}", name="n", metadata={"tenant_id": "hot-tenant"}))
+    assert max(router._depths.values()) <= 26
+
+    depth_reads["count"] = 0
+    for _ in range(100):
+        router.shard_for_tenant("hot-tenant")
+    assert depth_reads["count"] == 0
+
+    clock["now"] = 10.0
+    router.shard_for_tenant("hot-tenant")
+    assert depth_reads["count"] == len(shards)
+
+
 def test_autoscaling_adapters_compute_replica_targets() -> None:
     signal = AutoscalingSignal(queue_depth=800, worker_utilization=0.9, p95_latency_ms=1200)
     assert KubernetesHPAAdapter().desired_replicas(signal) >= 2
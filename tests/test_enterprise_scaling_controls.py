@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+from pathlib import Path
+
 import pytest
 
 from core.agent_admission_controller import AdmissionLimits, AgentAdmissionController, AgentStartRequest
@@ -7,7 +10,9 @@ from core.model_gateway import ModelGateway, ModelRequest
 from core.quota_ledger import DurableQuotaLedger, InMemoryQuotaStore, QuotaPolicy
 from core.queue_router import QueueShardRouter
 from core.semantic_cache import SemanticLLMCache
+from core.task_partitioning import PartitionedTaskQueue
 from core.task_queue import DistributedTaskQueue, InMemoryQueueBackend, QueueTask
+from governance.audit_ledger import EVENT_TOOL_EXECUTION, AuditLedger
 from security.tenant_context import TenantContext
 
 
@@ -75,6 +80,119 @@ def test_model_gateway_enforces_allowlist_and_uses_semantic_cache() -> None:
         )
 
 
+def _gateway_with_audit(tmp_path: Path, **kwargs) -> tuple[ModelGateway, AuditLedger]:
+    quota = DurableQuotaLedger(
+        InMemoryQuotaStore(),
+        policies={
+            tenant: QuotaPolicy(tenant_token_quota=10_000, agent_token_quota=10_000, daily_cost_ceiling=100, monthly_cost_ceiling=500)
+            for tenant in ("tenant-a", "tenant-b")
+        },
+    )
+    audit = AuditLedger(tmp_path / "audit.jsonl", signing_key="secret")
+    gateway = ModelGateway(
+        quota_ledger=quota,
+        model_router={"fast": lambda req: f"answer:{req.prompt}"},
+        audit_ledger=audit,
+        semantic_cache=SemanticLLMCache(similarity_threshold=0.99),
+        **kwargs,
+    )
+    return gateway, audit
+
+
+def _request(prompt: str) -> ModelRequest:
+    return ModelRequest(prompt=prompt, model="fast", max_tokens=100, estimated_tokens=10, estimated_cost=0.1, metadata={})
+
+
+def test_model_gateway_defers_post_call_bookkeeping_per_tenant(tmp_path: Path) -> None:
+    gateway, audit = _gateway_with_audit(tmp_path, tenant_durability={"tenant-b": "deferred"})
+    gateway._ensure_post_call_thread = lambda: None  # keep records queued so the test controls the flush
+    ctx_a = TenantContext(tenant_id="tenant-a", agent_id="agent-1", request_id="req-a")
+    ctx_b = TenantContext(tenant_id="tenant-b", agent_id="agent-2", request_id="req-b")
+
+    gateway.call(_request("sync prompt"), context=ctx_a)
+    assert len(audit.query(event_type=EVENT_TOOL_EXECUTION)) == 1
+
+    for idx in range(5):
+        assert gateway.call(_request(f"deferred {idx}"), context=ctx_b)["output"] == f"answer:deferred {idx}"
+    assert len(audit.query(event_type=EVENT_TOOL_EXECUTION)) == 1
+    assert gateway.semantic_cache.size() == 1
+
+    assert gateway.flush() == 5
+    assert len(audit.query(event_type=EVENT_TOOL_EXECUTION)) == 6
+    assert gateway.semantic_cache.size() == 6
+    audit.verify()
+
+
+def test_model_gateway_processes_inline_when_post_call_queue_is_full(tmp_path: Path) -> None:
+    gateway, audit = _gateway_with_audit(tmp_path, default_durability="deferred", post_call_queue_size=2)
+    gateway._ensure_post_call_thread = lambda: None
+    ctx = TenantContext(tenant_id="tenant-a", agent_id="agent-1", request_id="req-1")
+
+    for idx in range(4):
+        gateway.call(_request(f"prompt {idx}"), context=ctx)
+
+    assert len(audit.query(event_type=EVENT_TOOL_EXECUTION)) == 2
+    gateway.close()
+    assert len(audit.query(event_type=EVENT_TOOL_EXECUTION)) == 4
+
+
+def test_model_gateway_retries_failed_audit_batch_one_entry_at_a_time(tmp_path: Path) -> None:
+    gateway, audit = _gateway_with_audit(
+        tmp_path, default_durability="deferred", post_call_retry_backoff_seconds=0
+    )
+    gateway._ensure_post_call_thread = lambda: None
+    ctx = TenantContext(tenant_id="tenant-a", agent_id="agent-1", request_id="req-1")
+    real_append_many = audit.append_many
+    calls: list[int] = []
+
+    def flaky_append_many(events):
+        calls.append(len(events))
+        if len(calls) in (1, 3):
+            raise OSError("ledger unavailable")
+        return real_append_many(events)
+
+    audit.append_many = flaky_append_many
+    for idx in range(3):
+        gateway.call(_request(f"prompt {idx}"), context=ctx)
+
+    assert gateway.flush() == 3
+    assert calls == [3, 1, 1, 1, 1]
+    assert len(audit.query(event_type=EVENT_TOOL_EXECUTION)) == 3
+    audit.verify()
+
+
+def test_model_gateway_acall_awaits_async_handlers_and_flushes_on_close(tmp_path: Path) -> None:
+    gateway, audit = _gateway_with_audit(tmp_path, default_durability="deferred")
+
+    async def reasoning(request: ModelRequest) -> str:
+        await asyncio.sleep(0)
+        return f"reasoned:{request.prompt}"
+
+    gateway.register_model("reasoning", reasoning)
+    ctx = TenantContext(tenant_id="tenant-a", agent_id="agent-1", request_id="req-1")
+
+    async def run() -> list[dict]:
+        return await asyncio.gather(
+            gateway.acall(
+                ModelRequest(prompt="plan", model="reasoning", max_tokens=100, estimated_tokens=10, estimated_cost=0.1, metadata={}),
+                context=ctx,
+            ),
+            gateway.acall(_request("quick"), context=ctx),
+        )
+
+    results = asyncio.run(run())
+    gateway.close()
+
+    assert [result["output"] for result in results] == ["reasoned:plan", "answer:quick"]
+    assert len(audit.query(event_type=EVENT_TOOL_EXECUTION)) == 2
+    assert gateway.semantic_cache.lookup("plan", tenant_id="tenant-a", model="reasoning") == "reasoned:plan"
+    with pytest.raises(TypeError):
+        gateway.call(
+            ModelRequest(prompt="other", model="reasoning", max_tokens=100, estimated_tokens=10, estimated_cost=0.1, metadata={}),
+            context=ctx,
+        )
+
+
 def test_queue_fairness_defers_same_tenant_streak() -> None:
     queue = DistributedTaskQueue(
         InMemoryQueueBackend(),
@@ -101,3 +219,25 @@ def test_queue_applies_tenant_priority_boost() -> None:
         "metadata": {"tenant_id": "tenant-vip"},
     })
     assert task.priority == 30
+
+
+def test_partitioned_queue_claims_own_partition_and_steals_when_idle() -> None:
+    partitioned = PartitionedTaskQueue(DistributedTaskQueue(InMemoryQueueBackend(), queue_name="p"))
+    for idx in range(3):
+        partitioned.enqueue(QueueTask(task_id=f"a{idx}", name="n", metadata={"tenant_id": "tenant-a"}))
+    partitioned.enqueue(QueueTask(task_id="b0", name="n", metadata={"tenant_id": "tenant-b"}))
+    key_a = "tenant:tenant-a|goal:general|priority:normal"
+    key_b = "tenant:tenant-b|goal:general|priority:normal"
+
+    own = partitioned.dequeue_for_worker({key_b}, timeout_seconds=0)
+    assert own is not None and own.task_id == "b0"
+    assert partitioned.partition_queue(key_a).ready_size() == 3
+
+    stolen = partitioned.dequeue_for_worker({key_b}, timeout_seconds=0)
+    assert stolen is not None and stolen.task_id == "a0"
+    partitioned.acknowledge_task(stolen)
+    assert partitioned.queue_size() == 2
+
+    no_steal = PartitionedTaskQueue(DistributedTaskQueue(InMemoryQueueBackend(), queue_name="q"), work_stealing=False)
+    no_steal.enqueue(QueueTask(task_id="a0", name="n", metadata={"tenant_id": "tenant-a"}))
+    assert no_steal.dequeue_for_worker({key_b}, timeout_seconds=0) is None
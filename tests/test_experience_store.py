@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from learning.experience_store import ExperienceStore
+
+
+def test_query_similar_filters_kinds_and_ranks_exact_match_first() -> None:
+    store = ExperienceStore()
+    for idx in range(20):
+        store.store_evaluation({"score": idx})
+    target = store.store_execution_trace({"task_id": "t-7"})
+
+    results = store.query_similar("execution_trace:{'task_id': 't-7'}", limit=3)
+    assert results[0] is target
+    assert len(results) == 3
+    assert all(record.kind == "evaluation" for record in store.query_similar("x", limit=5, kinds={"evaluation"}))
+
+
+def test_capacity_evicts_oldest_or_keeps_reservoir_sample() -> None:
+    fifo = ExperienceStore(capacity=3)
+    for idx in range(5):
+        fifo.store_evaluation({"score": idx})
+    assert [record.payload["score"] for record in fifo.all_records()] == [2, 3, 4]
+    assert len(fifo.query_similar("evaluation", limit=10)) == 3
+
+    draws = iter([0.1, 0.99, 0.0])
+    reservoir = ExperienceStore(capacity=2, retention="reservoir", random_fn=lambda: next(draws))
+    for idx in range(5):
+        reservoir.store_evaluation({"score": idx})
+    assert sorted(record.payload["score"] for record in reservoir.all_records()) == [1, 4]
+
+
+def test_persisted_records_reload_and_compact(tmp_path: Path) -> None:
+    path = tmp_path / "experience.jsonl"
+    store = ExperienceStore(capacity=2, persist_path=path)
+    for idx in range(5):
+        store.store_evaluation({"score": idx})
+    assert len(path.read_text().splitlines()) == 2
+
+    reloaded = ExperienceStore(capacity=2, persist_path=path)
+    assert [record.payload["score"] for record in reloaded.all_records()] == [3, 4]
+    assert reloaded.query_similar("evaluation:{'score': 4}", limit=1)[0].payload == {"score": 4}
@@ -56,3 +56,104 @@ def test_query_filters_by_actor_and_content(tmp_path: Path) -> None:
     assert alpha_entries[0].details["tool"] == "calendar.create"
     assert len(blocked_entries) == 1
     assert blocked_entries[0].actor == "beta"
+
+
+def test_appends_use_persisted_chain_head_and_rotate_segments(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "audit.jsonl"
+    ledger = AuditLedger(path, signing_key="secret", max_segment_entries=2)
+    for idx in range(5):
+        ledger.record_tool_execution(actor="executor", tool=f"tool-{idx}", status="success")
+
+    assert sorted(p.name for p in tmp_path.glob("audit.0*.jsonl")) == ["audit.000000.jsonl", "audit.000001.jsonl"]
+    assert len(path.read_text().splitlines()) == 1
+
+    def fail_full_read() -> list:
+        raise AssertionError("append must not re-read the ledger")
+
+    reopened = AuditLedger(path, signing_key="secret", max_segment_entries=2)
+    monkeypatch.setattr(reopened, "_load_entries", fail_full_read)
+    entry = reopened.record_tool_execution(actor="executor", tool="tool-5", status="success")
+    assert entry.index == 5
+    monkeypatch.undo()
+
+    reopened.verify()
+    assert len(reopened.query(event_type=EVENT_TOOL_EXECUTION)) == 6
+
+
+def test_incremental_verify_skips_checkpointed_segments(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    ledger = AuditLedger(path, signing_key="secret", max_segment_entries=2)
+    for idx in range(3):
+        ledger.record_tool_execution(actor="executor", tool=f"tool-{idx}", status="success")
+    ledger.verify(incremental=True)
+
+    sealed = tmp_path / "audit.000000.jsonl"
+    rows = [json.loads(line) for line in sealed.read_text().splitlines()]
+    rows[0]["details"]["status"] = "failed"
+    sealed.write_text("\n".join(json.dumps(row) for row in rows) + "\n")
+
+    ledger.record_tool_execution(actor="executor", tool="tool-3", status="success")
+    ledger.record_tool_execution(actor="executor", tool="tool-4", status="success")
+    ledger.verify(incremental=True)
+    with pytest.raises(AuditLedgerIntegrityError, match="entry hash mismatch"):
+        ledger.verify()
+
+
+def test_head_is_rebuilt_when_sidecar_is_stale(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    ledger = AuditLedger(path, signing_key="secret")
+    ledger.record_tool_execution(actor="executor", tool="a", status="success")
+    (tmp_path / "audit.jsonl.head.json").unlink()
+
+    reopened = AuditLedger(path, signing_key="secret")
+    reopened.record_tool_execution(actor="executor", tool="b", status="success")
+    reopened.verify()
+
+
+def test_append_many_chains_across_segment_rotation(tmp_path: Path) -> None:
+    ledger = AuditLedger(tmp_path / "audit.jsonl", signing_key="secret", max_segment_entries=3)
+    ledger.record_tool_execution(actor="executor", tool="warmup", status="success")
+
+    entries = ledger.append_many(
+        [(EVENT_TOOL_EXECUTION, "executor", {"tool": f"t{idx}", "status": "success"}) for idx in range(7)]
+    )
+
+    assert [entry.index for entry in entries] == list(range(1, 8))
+    assert len(list(tmp_path.glob("audit.0*.jsonl"))) == 2
+    ledger.verify()
+    reopened = AuditLedger(tmp_path / "audit.jsonl", signing_key="secret", max_segment_entries=3)
+    assert reopened.append(event_type=EVENT_TOOL_EXECUTION, actor="executor", details={}).index == 8
+
+
+def test_failed_write_does_not_advance_chain_head(tmp_path: Path, monkeypatch) -> None:
+    ledger = AuditLedger(tmp_path / "audit.jsonl", signing_key="secret")
+    ledger.record_tool_execution(actor="executor", tool="first", status="success")
+    real_open = Path.open
+
+    def failing_open(self: Path, mode: str = "r", *args, **kwargs):
+        if mode == "ab":
+            raise OSError("disk full")
+        return real_open(self, mode, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "open", failing_open)
+    with pytest.raises(OSError):
+        ledger.record_tool_execution(actor="executor", tool="lost", status="success")
+    monkeypatch.undo()
+
+    assert ledger.record_tool_execution(actor="executor", tool="second", status="success").index == 1
+    ledger.verify()
+    reopened = AuditLedger(tmp_path / "audit.jsonl", signing_key="secret")
+    assert reopened.append(event_type=EVENT_TOOL_EXECUTION, actor="executor", details={}).index == 2
+
+
+def test_instances_sharing_a_path_keep_one_chain(tmp_path: Path) -> None:
+    first = AuditLedger(tmp_path / "audit.jsonl", signing_key="secret", max_segment_entries=2)
+    second = AuditLedger(tmp_path / "audit.jsonl", signing_key="secret", max_segment_entries=2)
+
+    indexes = []
+    for idx in range(3):
+        indexes.append(first.record_tool_execution(actor="a", tool=f"first-{idx}", status="success").index)
+        indexes.append(second.record_tool_execution(actor="b", tool=f"second-{idx}", status="success").index)
+
+    assert indexes == list(range(6))
+    first.verify()
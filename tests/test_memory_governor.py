@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from memory.distributed_memory import DistributedMemory, MemoryEntry
+from memory.memory_governor import MemoryGovernancePolicy, MemoryGovernor
+
+
+def _memory(tmp_path: Path, **governor_kwargs) -> tuple[DistributedMemory, MemoryGovernor]:
+    db_path = str(tmp_path / "memory.db")
+    governor = MemoryGovernor(db_path, **governor_kwargs)
+    return DistributedMemory(db_path, memory_governor=governor), governor
+
+
+def _count(memory: DistributedMemory) -> int:
+    return memory._conn.execute("SELECT COUNT(*) FROM task_history").fetchone()[0]
+
+
+def test_inline_compaction_waits_for_write_threshold(tmp_path: Path) -> None:
+    policy = MemoryGovernancePolicy(tenant_max_records=3, compaction_write_threshold=5)
+    memory, _ = _memory(tmp_path, policies={"legacy": policy})
+    now = time.time()
+    for idx in range(4):
+        memory.store_task_history(MemoryEntry(key=f"k{idx}", value={}, namespace="tenant:legacy:tasks", created_at=now + idx))
+    assert _count(memory) == 4
+
+    memory.store_task_history(MemoryEntry(key="k4", value={}, namespace="tenant:legacy:tasks", created_at=now + 4))
+    assert _count(memory) == 3
+
+
+def test_deferred_compaction_respects_row_budget_and_resumes(tmp_path: Path) -> None:
+    policy = MemoryGovernancePolicy(tenant_max_records=2, compaction_write_threshold=1, compaction_row_budget=3)
+    memory, governor = _memory(tmp_path, policies={"legacy": policy}, compaction_mode="deferred")
+    now = time.time()
+    for idx in range(10):
+        memory.store_task_history(MemoryEntry(key=f"k{idx}", value={}, namespace="tenant:legacy:tasks", created_at=now + idx))
+    assert _count(memory) == 10
+
+    first = governor.run_due_compactions()
+    assert first["legacy"]["deleted_quota"] == 3 and first["legacy"]["complete"] == 0
+    assert governor.is_due("legacy")
+
+    governor.run_due_compactions()
+    governor.run_due_compactions()
+    assert _count(memory) == 2
+    assert not governor.is_due("legacy")
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import pytest
+
+from learning.performance_feedback import PerformanceFeedback
+
+
+def test_planner_signals_use_running_aggregates() -> None:
+    feedback = PerformanceFeedback()
+    feedback.record_execution({"success": True, "execution_time": 1.0, "cost": 0.5, "agent_id": "a1", "tool": "pytest", "strategy_id": "s1"})
+    feedback.record_execution({"success": False, "execution_time": 3.0, "cost": 1.5, "agent_id": "a1", "tool": "pytest"})
+
+    signals = feedback.planner_signals()
+    assert signals["global_success_rate"] == 0.5
+    assert signals["average_execution_time"] == 2.0
+    assert signals["agent_performance"]["a1"] == {"success_rate": 0.5, "avg_execution_time": 2.0, "avg_cost": 1.0}
+    assert signals["tool_effectiveness"] == {"pytest": 0.5}
+    assert signals["strategy_performance"]["s1"]["success_rate"] == 1.0
+
+
+def test_decay_favours_recent_results_and_tracking_is_bounded() -> None:
+    feedback = PerformanceFeedback(decay_half_life=10, max_tracked_keys=3)
+    for idx in range(100):
+        feedback.record_execution({"success": False, "agent_id": f"agent-{idx}"})
+    for _ in range(30):
+        feedback.record_execution({"success": True, "agent_id": "agent-99"})
+
+    assert feedback.planner_signals()["global_success_rate"] == pytest.approx(1 - 0.5**3, abs=0.01)
+    assert len(feedback.planner_signals()["agent_performance"]) == 3
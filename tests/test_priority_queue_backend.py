@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import json
+import math
+
+import pytest
+
+from core.task_queue import DistributedTaskQueue, PriorityRedisQueueBackend, QueueTask, RedisQueueBackend
+
+
+class _FakePipeline:
+    def __init__(self, redis: "_FakeRedis") -> None:
+        self._redis = redis
+        self._calls: list[tuple[str, tuple]] = []
+
+    def __getattr__(self, name: str):
+        def _record(*args, **kwargs):
+            self._calls.append((name, args))
+            return self
+
+        return _record
+
+    def execute(self) -> list:
+        self._redis.round_trips += 1
+        return [getattr(self._redis, f"_{name}")(*args) for name, args in self._calls]
+
+
+class _FakeScript:
+    def __init__(self, redis: "_FakeRedis", handler) -> None:
+        self._redis = redis
+        self._handler = handler
+
+    def __call__(self, keys: list[str], args: list):
+        self._redis.round_trips += 1
+        return self._handler(keys, args)
+
+
+class _FakeRedis:
+    """Minimal list/sorted-set subset of the redis-py client, counting round trips.
+
+    Lua scripts are emulated by Python handlers keyed on the backends' script
+    sources, each running as one indivisible step like EVALSHA does.
+    """
+
+    def __init__(self) -> None:
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.lists: dict[str, list[str]] = {}
+        self.round_trips = 0
+        self._script_handlers = {
+            PriorityRedisQueueBackend.CLAIM_SCRIPT: self._claim,
+            PriorityRedisQueueBackend.PROMOTE_DUE_SCRIPT: self._promote_to_zset,
+            RedisQueueBackend.PROMOTE_DUE_SCRIPT: self._promote_to_list,
+        }
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    def register_script(self, source: str) -> _FakeScript:
+        return _FakeScript(self, self._script_handlers[source])
+
+    def __getattr__(self, name: str):
+        impl = getattr(self, f"_{name}")
+
+        def _call(*args, **kwargs):
+            self.round_trips += 1
+            return impl(*args, **kwargs)
+
+        return _call
+
+    def _ordered(self, key: str) -> list[str]:
+        zset = self.zsets.get(key, {})
+        return sorted(zset, key=lambda member: (zset[member], member))
+
+    def _zadd(self, key: str, mapping: dict[str, float]) -> int:
+        self.zsets.setdefault(key, {}).update({member: float(score) for member, score in mapping.items()})
+        return len(mapping)
+
+    def _zrem(self, key: str, *members: str) -> int:
+        zset = self.zsets.get(key, {})
+        return sum(1 for member in members if zset.pop(member, None) is not None)
+
+    def _zcard(self, key: str) -> int:
+        return len(self.zsets.get(key, {}))
+
+    def _zrange(self, key: str, start: int, end: int) -> list[str]:
+        return self._ordered(key)[start : end + 1]
+
+    def _due(self, key: str, now: float, limit: int) -> list[str]:
+        zset = self.zsets.get(key, {})
+        return [member for member in self._ordered(key) if zset[member] <= float(now)][: int(limit)]
+
+    def _lpush(self, key: str, *items: str) -> int:
+        target = self.lists.setdefault(key, [])
+        for item in items:
+            target.insert(0, item)
+        return len(target)
+
+    def _rpoplpush(self, source: str, destination: str) -> str | None:
+        items = self.lists.get(source)
+        if not items:
+            return None
+        item = items.pop()
+        self._lpush(destination, item)
+        return item
+
+    def _lrem(self, key: str, count: int, value: str) -> int:
+        items = self.lists.get(key, [])
+        if value in items:
+            items.remove(value)
+            return 1
+        return 0
+
+    def _llen(self, key: str) -> int:
+        return len(self.lists.get(key, []))
+
+    def _claim(self, keys: list[str], args: list) -> list[str]:
+        queue, processing = keys
+        items = self._ordered(queue)[: int(args[0])]
+        for item in items:
+            self._zrem(queue, item)
+            self._zadd(processing, {item: args[1]})
+        return items
+
+    def _promote_to_zset(self, keys: list[str], args: list) -> int:
+        delayed, ready = keys
+        due = self._due(delayed, args[0], args[1])
+        for item in due:
+            self._zrem(delayed, item)
+            priority = json.loads(item).get("priority", 50)
+            self._zadd(ready, {item: priority * 10**13 + math.floor(float(args[0]) * 1000)})
+        return len(due)
+
+    def _promote_to_list(self, keys: list[str], args: list) -> int:
+        delayed, ready = keys
+        due = self._due(delayed, args[0], args[1])
+        for item in due:
+            self._zrem(delayed, item)
+            self._lpush(ready, item)
+        return len(due)
+
+
+def test_priority_backend_dequeues_urgent_work_before_bulk_jobs() -> None:
+    queue = DistributedTaskQueue(PriorityRedisQueueBackend(_FakeRedis()))
+    queue.enqueue_task(QueueTask(task_id="bulk-1", name="bulk", priority=90))
+    queue.enqueue_task(QueueTask(task_id="bulk-2", name="bulk", priority=90))
+    queue.enqueue_task(QueueTask(task_id="urgent", name="urgent", priority=5))
+
+    first = queue.dequeue_task()
+    second = queue.dequeue_task()
+    assert first is not None and first.task_id == "urgent"
+    assert second is not None and second.task_id == "bulk-1"
+
+
+def test_priority_backend_batches_use_constant_round_trips() -> None:
+    redis = _FakeRedis()
+    backend = PriorityRedisQueueBackend(redis)
+    queue = DistributedTaskQueue(backend, queue_high_watermark=1000, queue_low_watermark=10)
+
+    redis.round_trips = 0
+    backend.push_many(queue.queue_name, [QueueTask(task_id=f"t{idx}", name="n").to_json() for idx in range(200)])
+    assert redis.round_trips == 1
+
+    redis.round_trips = 0
+    claimed = backend.pop_many(queue.queue_name, 50)
+    assert len(claimed) == 50
+    assert redis.round_trips == 1
+    assert backend.length(queue.processing_queue_name) == 50
+
+    redis.round_trips = 0
+    backend.ack_many(queue.processing_queue_name, claimed)
+    assert redis.round_trips == 1
+    assert backend.length(queue.processing_queue_name) == 0
+
+
+def test_priority_backend_rejects_out_of_range_priority() -> None:
+    backend = PriorityRedisQueueBackend(_FakeRedis())
+    with pytest.raises(ValueError):
+        backend.push("q", "item", priority=PriorityRedisQueueBackend.MAX_PRIORITY + 1)
+
+
+def test_distributed_queue_batch_apis_round_trip_tasks() -> None:
+    backend = PriorityRedisQueueBackend(_FakeRedis())
+    queue = DistributedTaskQueue(backend, queue_high_watermark=100, queue_low_watermark=10)
+    queue.enqueue_many([
+        {"task_id": "low", "name": "n", "priority": 70},
+        {"task_id": "high", "name": "n", "priority": 10},
+        {"task_id": "mid", "name": "n", "priority": 40},
+    ])
+
+    tasks = queue.dequeue_many(10)
+    assert [task.task_id for task in tasks] == ["high", "mid", "low"]
+    assert queue.queue_size() == 0
+
+    queue.acknowledge_many(tasks)
+    assert backend.length(queue.processing_queue_name) == 0
+    assert queue.tenant_depth("default") == 0
+
+
+def test_list_backend_batches_preserve_fifo_order() -> None:
+    redis = _FakeRedis()
+    backend = RedisQueueBackend(redis)
+    backend.push_many("q", ["first", "second", "third"])
+    assert redis.lists["q"] == ["third", "second", "first"]
+
+    redis.round_trips = 0
+    claimed = backend.pop_many("q", 5)
+    assert claimed == ["first", "second", "third"]
+    assert redis.round_trips == 1
+    assert backend.length("q:processing") == 3
+
+    backend.ack_many("q:processing", claimed)
+    assert backend.length("q:processing") == 0
+
+
+def test_priority_backend_promotes_delayed_tasks_only_when_due() -> None:
+    backend = PriorityRedisQueueBackend(_FakeRedis())
+    queue = DistributedTaskQueue(backend)
+    parked = QueueTask(task_id="parked", name="n", metadata={"next_attempt_at": 2000.0})
+    backend.push_delayed(queue.delayed_queue_name, parked.to_json(), 2000.0)
+
+    assert backend.promote_due(queue.delayed_queue_name, queue.queue_name, now=1000.0) == 0
+    assert queue.ready_size() == 0 and queue.delayed_size() == 1
+
+    assert backend.promote_due(queue.delayed_queue_name, queue.queue_name, now=2000.0) == 1
+    assert queue.ready_size() == 1 and queue.delayed_size() == 0
+
+
+def _dequeue_many_round_trips(batch_size: int) -> int:
+    redis = _FakeRedis()
+    backend = RedisQueueBackend(redis)
+    queue = DistributedTaskQueue(backend, queue_high_watermark=1000, queue_low_watermark=10, time_fn=lambda: 1000.0)
+    queue.enqueue_many([
+        {"task_id": f"later-{idx}", "name": "n", "metadata": {"next_attempt_at": 5000.0}} for idx in range(batch_size)
+    ])
+
+    redis.round_trips = 0
+    assert queue.dequeue_many(batch_size) == []
+    assert queue.delayed_size() == batch_size
+    assert backend.length(queue.processing_queue_name) == 0
+    return redis.round_trips
+
+
+def test_dequeue_many_parks_future_tasks_in_one_batch() -> None:
+    assert _dequeue_many_round_trips(5) == _dequeue_many_round_trips(50)
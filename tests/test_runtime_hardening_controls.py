@@ -111,3 +111,65 @@ def test_durable_event_bus_deduplicates_event_ids() -> None:
     assert first == "evt-1"
     assert second == "evt-1"
     assert seen == ["evt-1"]
+
+
+class _FakeStreamRedis:
+    def __init__(self) -> None:
+        self.entries: list[tuple[str, dict[str, str]]] = []
+        self.calls: list[str] = []
+        self.acked: list[str] = []
+        self._delivered = 0
+
+    def pipeline(self, transaction: bool = True) -> "_FakeStreamRedis._Pipeline":
+        return self._Pipeline(self)
+
+    class _Pipeline:
+        def __init__(self, redis: "_FakeStreamRedis") -> None:
+            self._redis = redis
+            self._messages: list[dict[str, str]] = []
+
+        def xadd(self, stream: str, message: dict[str, str]) -> None:
+            self._messages.append(message)
+
+        def execute(self) -> list[str]:
+            self._redis.calls.append("pipeline")
+            return [self._redis._append(message) for message in self._messages]
+
+    def _append(self, message: dict[str, str]) -> str:
+        message_id = f"{len(self.entries) + 1}-0"
+        self.entries.append((message_id, message))
+        return message_id
+
+    def xgroup_create(self, stream: str, group: str, id: str, mkstream: bool) -> None:
+        self.calls.append("xgroup_create")
+
+    def xreadgroup(self, group: str, consumer: str, streams: dict[str, str], count: int, block: int) -> list:
+        self.calls.append("xreadgroup")
+        batch = self.entries[self._delivered : self._delivered + count]
+        self._delivered += len(batch)
+        return [("stream", batch)] if batch else []
+
+    def xack(self, stream: str, group: str, *message_ids: str) -> int:
+        self.calls.append("xack")
+        self.acked.extend(message_ids)
+        return len(message_ids)
+
+
+def test_durable_event_bus_publishes_and_acks_in_batches() -> None:
+    redis = _FakeStreamRedis()
+    bus = DurableEventBus(redis)
+    ids = bus.publish_many([
+        Event(topic="topic", payload={"n": 1}, event_id="evt-1"),
+        Event(topic="topic", payload={"n": 2}, event_id="evt-2"),
+        Event(topic="topic", payload={"n": 1}, event_id="evt-1"),
+    ])
+    assert ids == ["1-0", "2-0", "evt-1"]
+    assert redis.calls == ["pipeline"]
+
+    consumed: list[int] = []
+    assert bus.consume(group="g", consumer="c", callback=lambda event: consumed.append(event.payload["n"])) == 2
+    assert bus.consume(group="g", consumer="c", callback=lambda event: consumed.append(event.payload["n"])) == 0
+    assert consumed == [1, 2]
+    assert redis.acked == ["1-0", "2-0"]
+    assert redis.calls.count("xgroup_create") == 1
+    assert redis.calls.count("xack") == 1
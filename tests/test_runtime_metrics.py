@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+
+from monitoring.runtime_metrics import RuntimeMetrics, StreamingHistogram
+
+
+def test_streaming_histogram_quantiles_stay_within_relative_accuracy() -> None:
+    histogram = StreamingHistogram(relative_accuracy=0.01)
+    for value in range(1, 10_001):
+        histogram.observe(float(value))
+
+    assert histogram.quantile(0.5) == pytest.approx(5000, rel=0.02)
+    assert histogram.quantile(0.99) == pytest.approx(9900, rel=0.02)
+    assert histogram.quantile(1.0) == 10_000
+
+
+def test_streaming_histogram_memory_is_bounded() -> None:
+    histogram = StreamingHistogram(max_buckets=64)
+    for exponent in range(-200, 200):
+        histogram.observe(10.0**exponent / 7)
+
+    assert len(histogram._positive) <= 64
+    assert histogram.count == 400
+
+
+def test_runtime_metrics_snapshot_reports_streaming_aggregates() -> None:
+    metrics = RuntimeMetrics()
+    for value in (0.0, 1.0, 2.0, 3.0):
+        metrics.observe("latency", value)
+    metrics.inc("requests")
+
+    histograms = metrics.snapshot()["histograms"]
+    assert histograms["latency_count"] == 4.0
+    assert histograms["latency_avg"] == 1.5
+    assert histograms["latency_p50"] == pytest.approx(1.0, rel=0.02)
+    assert "latency_p99 " in metrics.to_prometheus()
@@ -9,7 +9,7 @@ from tools.sandbox_runner import SandboxResult
 
 
 class _RunnerStub:
-    def run_callable(self, func, *args, policy=None, **kwargs):
+    def run_callable(self, func, *args, policy=None, tenant_id=None, **kwargs):
         return SandboxResult(ok=True, output=func(*args, **kwargs))
 
 
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pytest
+
+from core.semantic_cache import NumpySemanticIndex, PythonSemanticIndex, SemanticLLMCache
+
+
+def _index_factories():
+    factories = [PythonSemanticIndex]
+    try:
+        NumpySemanticIndex()
+    except RuntimeError:
+        return factories
+    return factories + [NumpySemanticIndex]
+
+
+@pytest.mark.parametrize("index_factory", _index_factories())
+def test_lookup_matches_nearest_entry_within_partition(index_factory) -> None:
+    cache = SemanticLLMCache(similarity_threshold=0.95, index_factory=index_factory)
+    cache.store("a", "east", embedding=[1.0, 0.0, 0.0], tenant_id="t1")
+    cache.store("b", "north", embedding=[0.0, 1.0, 0.0], tenant_id="t1")
+    cache.store("c", "other-tenant", embedding=[1.0, 0.0, 0.0], tenant_id="t2")
+
+    assert cache.lookup("q", embedding=[0.99, 0.05, 0.0], tenant_id="t1") == "east"
+    assert cache.lookup("q", embedding=[0.0, 0.0, 1.0], tenant_id="t1") is None
+    assert cache.lookup("q", embedding=[1.0, 0.0, 0.0], tenant_id="t3") is None
+
+
+@pytest.mark.parametrize("index_factory", _index_factories())
+def test_lru_eviction_keeps_recently_hit_entries(index_factory) -> None:
+    cache = SemanticLLMCache(similarity_threshold=0.99, max_entries=2, index_factory=index_factory)
+    cache.store("a", "first", embedding=[1.0, 0.0])
+    cache.store("b", "second", embedding=[0.0, 1.0])
+    assert cache.lookup("a", embedding=[1.0, 0.0]) == "first"
+
+    cache.store("c", "third", embedding=[-1.0, 0.0])
+    assert cache.size() == 2
+    assert cache.lookup("b", embedding=[0.0, 1.0]) is None
+    assert cache.lookup("a", embedding=[1.0, 0.0]) == "first"
+
+
+def test_expired_entries_are_not_served() -> None:
+    clock = {"now": 0.0}
+    cache = SemanticLLMCache(similarity_threshold=0.9, ttl_seconds=10, time_fn=lambda: clock["now"])
+    cache.store("prompt", "cached")
+    assert cache.lookup("prompt") == "cached"
+
+    clock["now"] = 11.0
+    assert cache.lookup("prompt") is None
+    assert cache.size() == 0
+
+
+@pytest.mark.parametrize("index_factory", _index_factories())
+def test_index_top_k_returns_best_scores_in_order(index_factory) -> None:
+    index = index_factory()
+    index.add(1, [1.0, 0.0])
+    index.add(2, [0.0, 1.0])
+    index.add(3, [1.0, 1.0])
+
+    ranked = index.top_k([1.0, 0.1], 2)
+    assert [key for key, _ in ranked] == [1, 3]
+    assert ranked[0][1] >= ranked[1][1]
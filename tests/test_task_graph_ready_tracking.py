@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from tasks.task_graph import TaskGraph
+
+
+def test_completion_releases_only_direct_dependents_in_priority_order() -> None:
+    graph = TaskGraph()
+    graph.add_task(task_id="root", description="root")
+    graph.add_task(task_id="slow", description="slow", priority=80, dependencies=["root"])
+    graph.add_task(task_id="fast", description="fast", priority=10, dependencies=["root"])
+    graph.add_task(task_id="join", description="join", dependencies=["slow", "fast"])
+
+    assert [task.task_id for task in graph.get_ready_tasks()] == ["root"]
+    graph.mark_completed("root")
+    assert [task.task_id for task in graph.get_ready_tasks()] == ["fast", "slow"]
+
+    graph.mark_completed("fast")
+    graph.mark_completed("fast")
+    assert graph.get_ready_tasks() == []
+    graph.mark_completed("slow")
+    assert [task.task_id for task in graph.get_ready_tasks()] == ["join"]
+    assert graph.pending_count() == 1
+
+
+def test_dependency_added_after_dependent_still_gates_readiness() -> None:
+    graph = TaskGraph()
+    graph.add_task(task_id="child", description="child", dependencies=["late-parent"])
+    assert graph.get_ready_tasks() == []
+
+    graph.add_task(task_id="late-parent", description="parent")
+    assert [task.task_id for task in graph.get_ready_tasks()] == ["late-parent"]
+    graph.mark_completed("late-parent")
+    assert [task.task_id for task in graph.get_ready_tasks()] == ["child"]
+
+
+def test_execute_parallel_reuses_one_executor() -> None:
+    graph = TaskGraph()
+    for idx in range(6):
+        graph.add_task(task_id=f"t{idx}", description="work")
+
+    first = graph.execute_parallel(lambda task: task.task_id, max_workers=3)
+    executor = graph._executor
+    second = graph.execute_parallel(lambda task: task.task_id, max_workers=3)
+
+    assert sorted(first + second) == [f"t{idx}" for idx in range(6)]
+    assert graph._executor is executor
+    graph.shutdown()
+    assert graph._executor is None
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from core.semantic_cache import PythonSemanticIndex
+from memory.vector_memory import MemoryRecord, VectorMemory
+
+
+def _memory(**kwargs) -> VectorMemory:
+    return VectorMemory(index_factory=PythonSemanticIndex, **kwargs)
+
+
+def test_capacity_reuses_slots_and_evicts_oldest_by_age() -> None:
+    memory = _memory(capacity=3, eviction="age")
+    for idx in range(5):
+        memory.store_knowledge({"idx": idx})
+
+    assert len(memory) == 3
+    assert len(memory._slots) == 3
+    kept = {record.payload["idx"] for record in memory.semantic_retrieve("anything", limit=10)}
+    assert kept == {2, 3, 4}
+
+
+def test_lru_eviction_keeps_recently_retrieved_records() -> None:
+    memory = _memory(capacity=2, eviction="lru")
+    first = memory.store_knowledge({"idx": 0})
+    memory.store_knowledge({"idx": 1})
+    memory.semantic_retrieve("anything", limit=1, where=lambda record: record is first)
+
+    memory.store_knowledge({"idx": 2})
+
+    kept = {record.payload["idx"] for record in memory.semantic_retrieve("anything", limit=10)}
+    assert kept == {0, 2}
+
+
+def test_importance_eviction_drops_least_important_record() -> None:
+    memory = _memory(capacity=2, eviction="importance")
+    memory.store_knowledge({"name": "keep", "importance": 0.9})
+    memory.store_knowledge({"name": "drop", "importance": 0.1})
+    memory.store_knowledge({"name": "new", "importance": 0.5})
+
+    kept = {record.payload["name"] for record in memory.semantic_retrieve("anything", limit=10)}
+    assert kept == {"keep", "new"}
+
+
+def test_retrieval_matches_exhaustive_ranking_and_honours_filters() -> None:
+    memory = _memory()
+    for idx in range(40):
+        memory.store_task_result(f"task-{idx}", {"ok": idx % 2 == 0})
+        memory.store_agent_decision({"decision": idx})
+
+    query = memory._embed("quarterly revenue report")
+    records = memory.records()
+    expected = sorted(
+        records,
+        key=lambda record: sum(a * b for a, b in zip(query, record.embedding))
+        / (sum(a * a for a in record.embedding) ** 0.5),
+        reverse=True,
+    )[:5]
+    assert memory.semantic_retrieve("quarterly revenue report", limit=5) == expected
+
+    decisions = memory.semantic_retrieve("quarterly revenue report", limit=5, kinds={"agent_decision"})
+    assert len(decisions) == 5 and all(record.kind == "agent_decision" for record in decisions)
+
+    successes = memory.semantic_retrieve(
+        "quarterly revenue report", limit=50, where=lambda record: record.payload.get("result", {}).get("ok") is True
+    )
+    assert len(successes) == 20
+
+
+def test_add_and_replace_record_validate_and_reindex() -> None:
+    memory = _memory()
+    stable = memory.store_knowledge({"stable": True})
+    assert memory.add_record("corrupt") is False
+    assert memory.add_record(MemoryRecord(kind="knowledge", payload={}, embedding=["nan"], timestamp="bad")) is False
+    assert memory.add_record(stable) is True
+
+    retrieved = memory.semantic_retrieve("stable", limit=5)
+    assert len(retrieved) == 2
+    assert all(isinstance(record, MemoryRecord) for record in retrieved)
+    assert len(memory) == 2
+
+    decision = MemoryRecord(
+        kind="agent_decision", payload={"replaced": True}, embedding=memory._embed("replaced"), timestamp="now"
+    )
+    assert memory.replace_record(stable, decision) is True
+    assert memory.replace_record(stable, decision) is True
+    assert memory.replace_record(stable, decision) is False
+    assert memory.semantic_retrieve("replaced", limit=5, kinds={"knowledge"}) == []
+    assert memory.semantic_retrieve("replaced", limit=5) == [decision, decision]
+    assert None not in memory.records()
+
+
+def test_where_filter_pulls_more_index_candidates_until_limit_is_met() -> None:
+    memory = _memory()
+    for idx in range(100):
+        memory.store_knowledge({"idx": idx})
+
+    rare = memory.semantic_retrieve("anything", limit=3, where=lambda record: record.payload["idx"] % 40 == 0)
+
+    assert sorted(record.payload["idx"] for record in rare) == [0, 40, 80]
@@ -6,13 +6,18 @@ import builtins
 import io
 import multiprocessing
 import os
+import pickle
 import resource
+import shutil
 import socket
 import tempfile
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable
 
+from security.tenant_context import current_tenant_context
+
 
 @dataclass(slots=True)
 class SandboxPolicy:
@@ -36,19 +41,123 @@ class SandboxResult:
 
 
 class SandboxRunner:
-    """Executes callables in a subprocess with strict limits."""
-
-    def __init__(self, *, default_policy: SandboxPolicy | None = None) -> None:
+    """Executes callables in a subprocess with strict limits.
+
+    With ``pool_size > 0`` calls are served by pre-forked workers that have
+    already applied the policy's limits and restrictions, keeping up to
+    ``pool_size`` idle workers per tenant and policy. A worker is recycled after
+    ``max_calls_per_worker`` calls, after a timeout, crash or ``MemoryError``,
+    or once its peak RSS exceeds ``max_worker_rss_mb``. Its scratch directory
+    is emptied between calls. Callables that cannot be pickled fall back to a
+    fresh fork per call, and a result that cannot be pickled comes back as an
+    error without losing the worker.
+
+    A pooled worker is a long-lived interpreter: module globals, imported
+    module caches and anything a callable monkeypatches survive into the next
+    call it serves. Workers are therefore never shared across tenants (the
+    ``tenant_id`` argument, defaulting to the current tenant context), but
+    calls from the same tenant can observe each other's leftovers. Use
+    ``pool_size=0`` where that residual state is unacceptable.
+    """
+
+    def __init__(
+        self,
+        *,
+        default_policy: SandboxPolicy | None = None,
+        pool_size: int = 0,
+        max_calls_per_worker: int = 100,
+        max_worker_rss_mb: int | None = None,
+    ) -> None:
         self.default_policy = default_policy or SandboxPolicy()
+        self.pool_size = max(0, pool_size)
+        self.max_calls_per_worker = max(1, max_calls_per_worker)
+        self.max_worker_rss_mb = max_worker_rss_mb
+        self._idle_workers: dict[tuple[Any, ...], list[_PooledWorker]] = {}
+        self._pool_lock = threading.Lock()
 
     def run_callable(
         self,
         func: Callable[..., Any],
         *args: Any,
         policy: SandboxPolicy | None = None,
+        tenant_id: str | None = None,
         **kwargs: Any,
     ) -> SandboxResult:
         effective = policy or self.default_policy
+        if tenant_id is None:
+            context = current_tenant_context()
+            tenant_id = context.tenant_id if context is not None else ""
+        if self.pool_size:
+            try:
+                payload = pickle.dumps((func, args, kwargs))
+            except Exception:
+                payload = None
+            if payload is not None:
+                result = self._run_pooled(payload, effective, tenant_id)
+                if result is not None:
+                    return result
+        return self._run_forked(func, args, kwargs, effective)
+
+    def close(self) -> None:
+        """Stops every idle pooled worker."""
+
+        with self._pool_lock:
+            workers = [worker for idle in self._idle_workers.values() for worker in idle]
+            self._idle_workers.clear()
+        for worker in workers:
+            worker.stop()
+
+    def _run_pooled(self, payload: bytes, policy: SandboxPolicy, tenant_id: str) -> SandboxResult | None:
+        key = (tenant_id, *_policy_key(policy))
+        with self._pool_lock:
+            idle = self._idle_workers.get(key)
+            worker = idle.pop() if idle else None
+        if worker is not None and not worker.process.is_alive():
+            worker.stop()
+            worker = None
+        if worker is None:
+            worker = _PooledWorker.spawn(policy, self.max_calls_per_worker)
+
+        worker.conn.send_bytes(payload)
+        if not worker.conn.poll(policy.timeout_seconds):
+            worker.stop()
+            return SandboxResult(ok=False, error="sandbox timeout exceeded")
+        try:
+            status, result, peak_rss_kb = worker.conn.recv()
+        except (EOFError, OSError):
+            worker.stop()
+            return SandboxResult(ok=False, error="sandbox terminated without result")
+        worker.calls += 1
+
+        if status == _STATUS_UNPICKLABLE:
+            self._release(key, worker)
+            return None
+        recycle = (
+            status == _STATUS_BREACH
+            or worker.calls >= self.max_calls_per_worker
+            or (self.max_worker_rss_mb is not None and peak_rss_kb > self.max_worker_rss_mb * 1024)
+        )
+        if recycle:
+            worker.stop()
+        else:
+            self._release(key, worker)
+        return result
+
+    def _release(self, key: tuple[Any, ...], worker: _PooledWorker) -> None:
+        with self._pool_lock:
+            idle = self._idle_workers.setdefault(key, [])
+            if len(idle) < self.pool_size:
+                idle.append(worker)
+                return
+        worker.stop()
+
+    def _run_forked(
+        self,
+        func: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        effective: SandboxPolicy,
+    ) -> SandboxResult:
         with tempfile.TemporaryDirectory(prefix="tool-sandbox-") as temp_dir:
             queue: multiprocessing.Queue[SandboxResult] = multiprocessing.Queue(maxsize=1)
             process = _mp_context().Process(
@@ -67,6 +176,108 @@ class SandboxRunner:
             return queue.get()
 
 
+_STATUS_DONE = "done"
+_STATUS_BREACH = "breach"
+_STATUS_UNPICKLABLE = "unpicklable"
+_STATUS_UNPICKLABLE_RESULT = "unpicklable_result"
+
+
+class _PooledWorker:
+    """Parent-side handle for one pre-forked sandbox worker."""
+
+    def __init__(self, process: multiprocessing.process.BaseProcess, conn: Any, temp_dir: str) -> None:
+        self.process = process
+        self.conn = conn
+        self.temp_dir = temp_dir
+        self.calls = 0
+
+    @classmethod
+    def spawn(cls, policy: SandboxPolicy, max_calls: int) -> _PooledWorker:
+        temp_dir = tempfile.mkdtemp(prefix="tool-sandbox-")
+        context = _mp_context()
+        parent_conn, child_conn = context.Pipe()
+        process = context.Process(
+            target=_pooled_sandbox_entry,
+            args=(child_conn, policy, temp_dir, max_calls),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return cls(process, parent_conn, temp_dir)
+
+    def stop(self) -> None:
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        self.conn.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+
+def _policy_key(policy: SandboxPolicy) -> tuple[Any, ...]:
+    return (
+        policy.timeout_seconds,
+        policy.cpu_seconds,
+        policy.memory_limit_mb,
+        policy.network_enabled,
+        policy.writable_paths,
+        policy.readable_paths,
+    )
+
+
+def _pooled_sandbox_entry(conn: Any, policy: SandboxPolicy, temp_dir: str, max_calls: int) -> None:
+    # RLIMIT_CPU is cumulative per process, so the hard limit covers the
+    # worker's whole lifetime and the soft limit is re-armed before each call.
+    _apply_limits(policy, cpu_hard_seconds=policy.cpu_seconds * max_calls + 1)
+    os.chdir(temp_dir)
+    _apply_filesystem_restrictions(policy, Path(temp_dir))
+    _apply_network_restrictions(policy)
+    while True:
+        try:
+            payload = conn.recv_bytes()
+        except EOFError:
+            return
+        try:
+            func, args, kwargs = pickle.loads(payload)
+        except Exception as exc:
+            conn.send((_STATUS_UNPICKLABLE, SandboxResult(ok=False, error=str(exc)), _peak_rss_kb()))
+            continue
+        _arm_cpu_budget(policy)
+        status = _STATUS_DONE
+        try:
+            result = SandboxResult(ok=True, output=func(*args, **kwargs))
+        except MemoryError as exc:
+            status = _STATUS_BREACH
+            result = SandboxResult(ok=False, error=f"sandbox memory limit exceeded: {exc}")
+        except Exception as exc:  # pragma: no cover - defensive sandbox boundary
+            result = SandboxResult(ok=False, error=str(exc))
+        try:
+            conn.send((status, result, _peak_rss_kb()))
+        except (pickle.PicklingError, TypeError, AttributeError) as exc:
+            # Connection.send pickles before writing, so nothing reached the pipe yet.
+            error = SandboxResult(ok=False, error=f"sandbox result could not be pickled: {exc}")
+            conn.send((_STATUS_UNPICKLABLE_RESULT, error, _peak_rss_kb()))
+        _clear_directory(Path(temp_dir))
+
+
+def _arm_cpu_budget(policy: SandboxPolicy) -> None:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    soft = int(usage.ru_utime + usage.ru_stime) + policy.cpu_seconds
+    resource.setrlimit(resource.RLIMIT_CPU, (min(soft, hard), hard))
+
+
+def _peak_rss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _clear_directory(directory: Path) -> None:
+    for child in directory.iterdir():
+        if child.is_dir() and not child.is_symlink():
+            shutil.rmtree(child, ignore_errors=True)
+        else:
+            child.unlink(missing_ok=True)
+
+
 def _mp_context() -> multiprocessing.context.BaseContext:
     try:
         return multiprocessing.get_context("fork")
@@ -93,10 +304,11 @@ def _sandbox_entry(
         queue.put(SandboxResult(ok=False, error=str(exc)))
 
 
-def _apply_limits(policy: SandboxPolicy) -> None:
+def _apply_limits(policy: SandboxPolicy, *, cpu_hard_seconds: int | None = None) -> None:
     memory_bytes = policy.memory_limit_mb * 1024 * 1024
     resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
-    resource.setrlimit(resource.RLIMIT_CPU, (policy.cpu_seconds, policy.cpu_seconds + 1))
+    hard = cpu_hard_seconds if cpu_hard_seconds is not None else policy.cpu_seconds + 1
+    resource.setrlimit(resource.RLIMIT_CPU, (policy.cpu_seconds, hard))
 
 
 def _apply_network_restrictions(policy: SandboxPolicy) -> None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import threading
 import time
@@ -19,6 +20,10 @@ class TaskHandler(Protocol):
     def execute(self, task: QueueTask) -> dict[str, Any]: ...
 
 
+class AsyncTaskHandler(Protocol):
+    async def execute_async(self, task: QueueTask) -> dict[str, Any]: ...
+
+
 class ResultStore(Protocol):
     def save_result(self, task: QueueTask, result: dict[str, Any]) -> None: ...
 
@@ -60,6 +65,8 @@ class AgentWorker:
         tenant_allowlist: set[str] | None = None,
         max_consecutive_failures: int = 25,
         max_tenant_failures_before_quarantine: int = 5,
+        max_in_flight: int = 16,
+        drain_timeout_seconds: float = 30.0,
     ) -> None:
         self.worker_id = worker_id
         self.queue = queue
@@ -71,6 +78,8 @@ class AgentWorker:
         self.telemetry = WorkerTelemetry(worker_id=worker_id)
         self._running = False
         self._thread: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stop_event: asyncio.Event | None = None
         self._last_heartbeat = 0.0
         self._tracer = get_tracer()
         self.retry_engine = retry_engine or get_default_retry_engine()
@@ -81,6 +90,9 @@ class AgentWorker:
         self._consecutive_failures = 0
         self._tenant_failures: dict[str, int] = {}
         self._tenant_quarantine: set[str] = set()
+        self.max_in_flight = max(1, max_in_flight)
+        self.drain_timeout_seconds = max(0.0, drain_timeout_seconds)
+        self._in_flight: set[asyncio.Task[None]] = set()
 
     def _emit_heartbeat(self) -> None:
         now = time.time()
@@ -97,55 +109,106 @@ class AgentWorker:
             return False
 
         tenant_id = str(task.metadata.get("tenant_id", "default"))
-        if self.tenant_allowlist is not None and tenant_id not in self.tenant_allowlist:
-            self.queue.fail_task(task, error=f"tenant_not_allowed:{tenant_id}")
-            runtime_metrics.inc("worker.tasks_rejected")
-            return True
-
-        if tenant_id in self._tenant_quarantine:
-            self.queue.fail_task(task, error=f"tenant_quarantined:{tenant_id}")
-            runtime_metrics.inc("worker.tasks_rejected")
+        if not self._admit(task, tenant_id):
             return True
 
         with self._tracer.start_span("agent.execution", kind="agent_execution", attributes={"worker_id": self.worker_id, "task_id": task.task_id}):
-            self.event_bus.publish_event(
-                Event(
-                    topic="worker.task_started",
-                    payload={"worker_id": self.worker_id, "task_id": task.task_id, "task": asdict(task)},
-                )
-            )
+            self._publish_started(task)
             try:
                 result = self.retry_engine.execute(
                     "task_execution",
                     self.task_handler.execute,
                     task,
-                    context={"worker_id": self.worker_id, "task_id": task.task_id, "task_name": task.name},
+                    context=self._retry_context(task),
                 )
-                self.result_store.save_result(task, result)
-                self._consecutive_failures = 0
-                self._tenant_failures[tenant_id] = 0
-                self.queue.acknowledge_task(task)
-                self.telemetry.processed_tasks += 1
-                self.event_bus.report_completion(task_id=task.task_id, worker_id=self.worker_id, result=result)
-                runtime_metrics.inc("worker.tasks_processed")
+                self._record_success(task, tenant_id, result)
             except Exception as exc:  # noqa: BLE001
-                self.telemetry.failed_tasks += 1
-                self._consecutive_failures += 1
-                tenant_failures = self._tenant_failures.get(tenant_id, 0) + 1
-                self._tenant_failures[tenant_id] = tenant_failures
-                if tenant_failures >= self.max_tenant_failures_before_quarantine:
-                    self._tenant_quarantine.add(tenant_id)
-                    runtime_metrics.inc("worker.tenant_quarantined")
-                self.queue.fail_task(task, error=str(exc), exc=exc)
-                runtime_metrics.inc("worker.tasks_failed")
-                self.event_bus.publish_event(
-                    Event(
-                        topic="worker.task_failed",
-                        payload={"worker_id": self.worker_id, "task_id": task.task_id, "error": str(exc)},
+                self._record_failure(task, tenant_id, exc)
+        return True
+
+    async def process_task_async(self, task: QueueTask) -> None:
+        """Executes one claimed task without blocking the event loop.
+
+        Handlers exposing ``execute_async`` are awaited directly; plain
+        ``execute`` handlers run in a thread. Cancellation hands the task back
+        to the queue's retry path and propagates.
+        """
+        tenant_id = str(task.metadata.get("tenant_id", "default"))
+        if not self._admit(task, tenant_id):
+            return
+
+        with self._tracer.start_span("agent.execution", kind="agent_execution", attributes={"worker_id": self.worker_id, "task_id": task.task_id}):
+            self._publish_started(task)
+            execute_async = getattr(self.task_handler, "execute_async", None)
+            try:
+                if execute_async is not None:
+                    result = await self.retry_engine.execute_async(
+                        "task_execution", execute_async, task, context=self._retry_context(task)
                     )
-                )
+                else:
+                    result = await asyncio.to_thread(
+                        self.retry_engine.execute,
+                        "task_execution",
+                        self.task_handler.execute,
+                        task,
+                        context=self._retry_context(task),
+                    )
+                self._record_success(task, tenant_id, result)
+            except asyncio.CancelledError:
+                self.queue.fail_task(task, error="worker_cancelled")
+                runtime_metrics.inc("worker.tasks_cancelled")
+                raise
+            except Exception as exc:  # noqa: BLE001
+                self._record_failure(task, tenant_id, exc)
+
+    def _admit(self, task: QueueTask, tenant_id: str) -> bool:
+        if self.tenant_allowlist is not None and tenant_id not in self.tenant_allowlist:
+            self.queue.fail_task(task, error=f"tenant_not_allowed:{tenant_id}")
+            runtime_metrics.inc("worker.tasks_rejected")
+            return False
+
+        if tenant_id in self._tenant_quarantine:
+            self.queue.fail_task(task, error=f"tenant_quarantined:{tenant_id}")
+            runtime_metrics.inc("worker.tasks_rejected")
+            return False
         return True
 
+    def _retry_context(self, task: QueueTask) -> dict[str, Any]:
+        return {"worker_id": self.worker_id, "task_id": task.task_id, "task_name": task.name}
+
+    def _publish_started(self, task: QueueTask) -> None:
+        self.event_bus.publish_event(
+            Event(
+                topic="worker.task_started",
+                payload={"worker_id": self.worker_id, "task_id": task.task_id, "task": asdict(task)},
+            )
+        )
+
+    def _record_success(self, task: QueueTask, tenant_id: str, result: dict[str, Any]) -> None:
+        self.result_store.save_result(task, result)
+        self._consecutive_failures = 0
+        self._tenant_failures[tenant_id] = 0
+        self.queue.acknowledge_task(task)
+        self.telemetry.processed_tasks += 1
+        self.event_bus.report_completion(task_id=task.task_id, worker_id=self.worker_id, result=result)
+        runtime_metrics.inc("worker.tasks_processed")
+
+    def _record_failure(self, task: QueueTask, tenant_id: str, exc: Exception) -> None:
+        self.telemetry.failed_tasks += 1
+        self._consecutive_failures += 1
+        tenant_failures = self._tenant_failures.get(tenant_id, 0) + 1
+        self._tenant_failures[tenant_id] = tenant_failures
+        if tenant_failures >= self.max_tenant_failures_before_quarantine:
+            self._tenant_quarantine.add(tenant_id)
+            runtime_metrics.inc("worker.tenant_quarantined")
+        self.queue.fail_task(task, error=str(exc), exc=exc)
+        runtime_metrics.inc("worker.tasks_failed")
+        self.event_bus.publish_event(
+            Event(
+                topic="worker.task_failed",
+                payload={"worker_id": self.worker_id, "task_id": task.task_id, "error": str(exc)},
+            )
+        )
 
     def process_batch(self) -> int:
         processed = 0
@@ -171,27 +234,101 @@ class AgentWorker:
             if processed == 0:
                 time.sleep(self.poll_interval_seconds)
 
-    def start_background(self) -> None:
+    async def run_async(self) -> None:
+        """Keeps up to ``max_in_flight`` tasks executing concurrently on one event loop.
+
+        ``stop()`` ends the claim loop even while every slot is busy; tasks
+        already in flight then get ``drain_timeout_seconds`` to finish before
+        being cancelled, and a task claimed after the stop is released back
+        to the queue.
+        """
+        self._running = True
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        stop_waiter = asyncio.create_task(self._stop_event.wait())
+        slots = asyncio.Semaphore(self.max_in_flight)
+        try:
+            while self._running:
+                if self._consecutive_failures >= self.max_consecutive_failures:
+                    runtime_metrics.inc("worker.circuit_breaker_tripped")
+                    self._running = False
+                    break
+                self._emit_heartbeat()
+                if not await self._acquire_slot(slots, stop_waiter):
+                    break
+                task = await self.queue.dequeue_task_async(timeout_seconds=1)
+                if task is not None and not self._running:
+                    self.queue.release_task(task)
+                    slots.release()
+                    break
+                if task is None:
+                    slots.release()
+                    await asyncio.sleep(self.poll_interval_seconds * (2 if self.queue.is_under_pressure() else 1))
+                    continue
+                in_flight = asyncio.create_task(self.process_task_async(task))
+                self._in_flight.add(in_flight)
+                in_flight.add_done_callback(lambda done: (self._in_flight.discard(done), slots.release()))
+                runtime_metrics.set_gauge("worker.utilization", float(len(self._in_flight) / self.max_in_flight))
+        finally:
+            stop_waiter.cancel()
+            self._loop = None
+            self._stop_event = None
+            await self._drain()
+
+    async def _acquire_slot(self, slots: asyncio.Semaphore, stop_waiter: asyncio.Task[Any]) -> bool:
+        """Waits for a free slot or a stop request, whichever comes first; False means stop."""
+        acquire = asyncio.create_task(slots.acquire())
+        await asyncio.wait({acquire, stop_waiter}, return_when=asyncio.FIRST_COMPLETED)
+        if not acquire.done():
+            acquire.cancel()
+            await asyncio.gather(acquire, return_exceptions=True)
+        acquired = acquire.done() and not acquire.cancelled()
+        if acquired and self._running:
+            return True
+        if acquired:
+            slots.release()
+        return False
+
+    async def _drain(self) -> None:
+        if not self._in_flight:
+            return
+        pending = set(self._in_flight)
+        _, still_running = await asyncio.wait(pending, timeout=self.drain_timeout_seconds)
+        for task in still_running:
+            task.cancel()
+        if still_running:
+            await asyncio.gather(*still_running, return_exceptions=True)
+            runtime_metrics.inc("worker.drain_cancelled", float(len(still_running)))
+
+    def start_background(self, *, use_asyncio: bool = False) -> None:
         if self._thread and self._thread.is_alive():
             return
-        self._thread = threading.Thread(target=self.run_forever, daemon=True)
+        target = (lambda: asyncio.run(self.run_async())) if use_asyncio else self.run_forever
+        self._thread = threading.Thread(target=target, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         self._running = False
+        loop, stop_event = self._loop, self._stop_event
+        if loop is not None and stop_event is not None:
+            try:
+                loop.call_soon_threadsafe(stop_event.set)
+            except RuntimeError:
+                pass  # loop already closed
         if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=1.0)
+            self._thread.join(timeout=1.0 + (self.drain_timeout_seconds if self._in_flight else 0.0))
 
 
 class WorkerPool:
     """Utility to run many worker instances, enabling horizontal scaling."""
 
-    def __init__(self, workers: list[AgentWorker]) -> None:
+    def __init__(self, workers: list[AgentWorker], *, use_asyncio: bool = False) -> None:
         self.workers = workers
+        self.use_asyncio = use_asyncio
 
     def start(self) -> None:
         for worker in self.workers:
-            worker.start_background()
+            worker.start_background(use_asyncio=self.use_asyncio)
 
     def stop(self) -> None:
         for worker in self.workers: